@@ -0,0 +1,53 @@
+"""
+Compares the rounds simulated per second by players who flat bet when
+the cards are dealt from a finite shoe and from an infinite deck, whose
+shoes are played without counts, a cut card or seen cards.
+
+    python benchmarks/bench_infinite_deck.py --shoes 2000 --rounds-per-shoe 60
+
+"""
+import argparse
+import time
+from blackjack.blackjack import Blackjack
+from blackjack.player import Player
+
+
+def _simulate_rounds(infinite_deck: bool, shoes: int, shoe_size: int, rounds_per_shoe: int) -> float:
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    for player_number in range(3):
+        blackjack.add_player(player=Player(name=f'Player {player_number + 1}', bankroll=10000000, min_bet=10))
+    start = time.perf_counter()
+    blackjack.simulate(
+        penetration=0.75,
+        number_of_shoes=shoes,
+        shoe_size=shoe_size,
+        seed=1,
+        progress_bar=False,
+        rounds_per_shoe=rounds_per_shoe,
+        infinite_deck=infinite_deck
+    )
+    return blackjack.rounds_played / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shoes', type=int, default=2000)
+    parser.add_argument('--shoe-size', type=int, default=8)
+    parser.add_argument('--rounds-per-shoe', type=int, default=60)
+    args = parser.parse_args()
+
+    print(f"{'deck':<12} {'rounds/sec':>12}")
+    rounds_per_second = {}
+    for infinite_deck in (False, True):
+        rounds_per_second[infinite_deck] = _simulate_rounds(
+            infinite_deck=infinite_deck,
+            shoes=args.shoes,
+            shoe_size=args.shoe_size,
+            rounds_per_shoe=args.rounds_per_shoe
+        )
+        print(f"{'infinite' if infinite_deck else 'finite':<12} {rounds_per_second[infinite_deck]:>12,.1f}")
+    print(f'speedup      {rounds_per_second[True] / rounds_per_second[False]:>11.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares the classes of shoe in blackjack/shoe.py, both dealing shoes
+on their own (shuffling and dealing every card up to the cut card) and
+simulating games with a player and a card counter.
+
+    python benchmarks/bench_shoes.py --shoes 2000 --shoe-size 8
+
+"""
+import argparse
+import time
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem
+from blackjack.player import Player
+from blackjack.shoe import ArrayShoe, CompositionShoe, CursorShoe, PartialShuffleShoe, Shoe
+from blackjack.shoe_factory import np
+
+
+SHOE_TYPES: list[type[Shoe]] = [Shoe, CursorShoe, PartialShuffleShoe, CompositionShoe]
+if np is not None:
+    # ArrayShoe deals shoes shuffled in batches by a ShoeFactory, which needs NumPy
+    SHOE_TYPES.append(ArrayShoe)
+
+
+def _deal_shoes(shoe_type: type[Shoe], shoes: int, shoe_size: int, penetration: float) -> float:
+    start = time.perf_counter()
+    shoe = shoe_type(shoe_size=shoe_size, penetration=penetration)
+    for shoe_index in range(shoes):
+        if shoe_type is Shoe:
+            # Shoe allocates its cards again for every shoe, as it did before shoes were re-used
+            shoe = Shoe(shoe_size=shoe_size, penetration=penetration)
+        shoe.start_shoe(seed=1, shoe_index=shoe_index)
+        while not shoe.cut_card_reached:
+            shoe.deal_card()
+    return shoes / (time.perf_counter() - start)
+
+
+def _simulate_shoes(shoe_type: type[Shoe], shoes: int, shoe_size: int, penetration: float) -> float:
+    blackjack = Blackjack(min_bet=10, max_bet=500, shoe_type=shoe_type)
+    blackjack.add_player(player=Player(name='Player', bankroll=10000000, min_bet=10))
+    blackjack.add_player(
+        player=CardCounter(
+            name='Card Counter',
+            bankroll=10000000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={1: 10, 2: 20, 3: 40, 4: 80, 5: 150},
+            insurance=None
+        )
+    )
+    start = time.perf_counter()
+    blackjack.simulate(penetration=penetration, number_of_shoes=shoes, shoe_size=shoe_size, seed=1, progress_bar=False)
+    return shoes / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shoes', type=int, default=2000)
+    parser.add_argument('--shoe-size', type=int, default=8)
+    parser.add_argument('--penetration', type=float, default=0.75)
+    args = parser.parse_args()
+
+    print(f"{'shoe type':<20} {'dealt shoes/sec':>16} {'simulated shoes/sec':>20}")
+    for shoe_type in SHOE_TYPES:
+        dealt = _deal_shoes(shoe_type=shoe_type, shoes=args.shoes, shoe_size=args.shoe_size, penetration=args.penetration)
+        simulated = _simulate_shoes(shoe_type=shoe_type, shoes=args.shoes, shoe_size=args.shoe_size, penetration=args.penetration)
+        print(f'{shoe_type.__name__:<20} {dealt:>16,.1f} {simulated:>20,.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Measures how simulate(threads=N) scales with the number of threads.
+
+Run with a free-threaded build of CPython (i.e. python3.13t) to see the
+threads simulate shoes in parallel. On a build with the GIL every run
+falls back to simulating the shoes serially.
+
+    python benchmarks/bench_threads.py --shoes 2000 --threads 1 2 4 8
+
+"""
+import argparse
+import sys
+import time
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem
+from blackjack.player import Player
+
+
+def _blackjack() -> Blackjack:
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=Player(name='Player', bankroll=10000000, min_bet=10))
+    blackjack.add_player(
+        player=CardCounter(
+            name='Card Counter',
+            bankroll=10000000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={1: 10, 2: 20, 3: 40, 4: 80, 5: 150},
+            insurance=None
+        )
+    )
+    return blackjack
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shoes', type=int, default=2000)
+    parser.add_argument('--shoe-size', type=int, default=8)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled}')
+
+    baseline = None
+    for threads in args.threads:
+        blackjack = _blackjack()
+        start = time.perf_counter()
+        blackjack.simulate(
+            penetration=0.75,
+            number_of_shoes=args.shoes,
+            shoe_size=args.shoe_size,
+            seed=1,
+            progress_bar=False,
+            threads=threads
+        )
+        shoes_per_second = args.shoes / (time.perf_counter() - start)
+        baseline = baseline or shoes_per_second
+        print(f'threads={threads:<3} {shoes_per_second:>10,.1f} shoes/sec  speedup: {shoes_per_second / baseline:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,5 @@
+from blackjack.cli import main
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from typing import Any
+from typing_extensions import override
 from blackjack.card_counter import CardCounter
 
 
@@ -10,6 +11,7 @@ class BackCounter(CardCounter):
     running or true count.
 
     """
+    __slots__ = ('_entry_point', '_exit_point', '_is_seated')
 
     def __init__(self, entry_point: float | int, exit_point: float | int, **kwargs: Any):
         """
@@ -34,6 +36,11 @@ class BackCounter(CardCounter):
         self._exit_point = exit_point
         self._is_seated = False
 
+    @property
+    @override
+    def definition(self) -> dict[str, Any]:
+        return {**super().definition, 'entry_point': self._entry_point, 'exit_point': self._exit_point}
+
     @property
     def entry_point(self) -> float | int:
         return self._entry_point
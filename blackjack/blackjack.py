@@ -1,34 +1,83 @@
+import copy
+import os
 import random
 import sys
 import time
-from typing import Generator
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from math import inf
+from typing import Any
+from blackjack.back_counter import BackCounter
+from blackjack.cache import SimulationCache, simulation_key
+from blackjack.card_counter import CardCounter
+from blackjack.checkpoint import Checkpoint
 from blackjack.dealer import Dealer
-from blackjack.gameplay import play_round
+from blackjack.gameplay import RoundState, play_infinite_shoe, play_round
 from blackjack.player import Player
-from blackjack.playing_strategy import PlayingStrategy
+from blackjack.playing_strategy import PlayingStrategy, load_playing_strategy
+from blackjack.random_generator import GENERATORS, create_generator
 from blackjack.rules import Rules
-from blackjack.shoe import Shoe
+from blackjack.scheduler import ShoeScheduler
+from blackjack.shared_stats import SharedStats, SharedStatsView
+from blackjack.shoe import ArrayShoe, CSMShoe, InfiniteShoe, PartialShuffleShoe, Shoe
+from blackjack.shoe_pool import PooledShoe, ShoePool
+from blackjack.stats import PlayerResults, Stats
 from blackjack.table import Table
 
 
-def _shoe_progress_bar(shoe_range: range, size: int = 60) -> Generator[int, None, None]:
-    total_shoes = len(shoe_range)
-    start = time.time()
+# number of shoe ranges queued up for each worker when shoes are simulated in parallel
+RANGES_PER_WORKER = 2
 
-    def _show(shoe_number: int) -> None:
-        x = int(size * shoe_number / total_shoes)
-        remaining = ((time.time() - start) / shoe_number) * (total_shoes - shoe_number)
-        minutes, seconds = divmod(remaining, 60)
-        minutes = int(minutes)
-        seconds = int(seconds)
-        time_str = f'{minutes if minutes > 10 else minutes:02}:{seconds if seconds > 10 else seconds:02}'
-        print(f"Shoes Simulated: [{'█' * x}{('.' * (size - x))}] {shoe_number}/{total_shoes} Estimated wait: {time_str}", end='\r', file=sys.stdout, flush=True)
 
-    for shoe_number in shoe_range:
-        _show(shoe_number=shoe_number + 1)
-        yield shoe_number
+def _gil_enabled() -> bool:
+    # sys._is_gil_enabled only exists on CPython 3.13 and later
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is None or is_gil_enabled()
 
-    print(flush=True, file=sys.stdout)
+
+def _show_progress(shoes_simulated: int, total_shoes: int, start: float, size: int = 60) -> None:
+    x = int(size * shoes_simulated / total_shoes)
+    remaining = ((time.time() - start) / shoes_simulated) * (total_shoes - shoes_simulated)
+    minutes, seconds = divmod(remaining, 60)
+    minutes = int(minutes)
+    seconds = int(seconds)
+    time_str = f'{minutes if minutes > 10 else minutes:02}:{seconds if seconds > 10 else seconds:02}'
+    print(f"Shoes Simulated: [{'█' * x}{('.' * (size - x))}] {shoes_simulated}/{total_shoes} Estimated wait: {time_str}", end='\r', file=sys.stdout, flush=True)
+
+
+def _play_shoes(
+    blackjack: 'Blackjack',
+    shoe_range: range,
+    penetration: float,
+    shoe_size: int,
+    seed: int,
+    reset_bankroll: bool,
+    rounds_per_shoe: int | None = None
+) -> tuple[list[PlayerResults], float]:
+    """
+    Plays a batch of shoes on a worker's copy of the game and returns the
+    results of every player in the order they were added, along with the
+    number of seconds it took. Stats written to a SharedStats block are
+    not returned.
+
+    """
+    start = time.perf_counter()
+    bankrolls = [player.bankroll for player in blackjack.players]
+    lowest_bankrolls = list(bankrolls)
+    rounds_played = blackjack.rounds_played
+    for shoe_index in shoe_range:
+        blackjack._play_shoe(
+            penetration=penetration,
+            shoe_size=shoe_size,
+            seed=seed,
+            shoe_index=shoe_index,
+            reset_bankroll=reset_bankroll,
+            rounds_per_shoe=rounds_per_shoe,
+            lowest_bankrolls=lowest_bankrolls
+        )
+    results = blackjack._results(bankrolls=bankrolls, lowest_bankrolls=lowest_bankrolls, rounds_played=rounds_played)
+    return results, time.perf_counter() - start
 
 
 class Blackjack:
@@ -49,7 +98,11 @@ class Blackjack:
         resplit_aces: bool = False,
         insurance: bool = True,
         late_surrender: bool = True,
-        dealer_shows_hole_card: bool = False
+        dealer_shows_hole_card: bool = False,
+        shoe_type: type[Shoe] = PartialShuffleShoe,
+        random_generator: str = 'stdlib',
+        shoe_pool: str | os.PathLike | None = None,
+        playing_strategy: str | os.PathLike | None = None
     ):
         """
         Parameters
@@ -77,8 +130,26 @@ class Blackjack:
         dealer_shows_hole_card
             True if the dealer shows his hole card regardless of whether or
             not all players bust, False otherwise
+        shoe_type
+            Class of shoe the cards are dealt from. A single shoe is reset
+            and re-used for every shoe that is simulated
+        random_generator
+            Name of the random number generator shoes are shuffled with,
+            i.e. 'stdlib', 'pcg64', 'philox' or 'counter'
+        shoe_pool
+            File of shuffled shoes written by write_shoe_pool. If given,
+            the cards are dealt from the pool's shoes rather than a shoe
+            of `shoe_type` shuffled with the seed of the simulation
+        playing_strategy
+            CSV or JSON file of a strategy read by load_playing_strategy.
+            If given, every player follows it instead of basic strategy
 
         """
+        if random_generator not in GENERATORS:
+            raise ValueError(f'Random generator must be one of {", ".join(GENERATORS)}.')
+        if issubclass(shoe_type, ArrayShoe) and random_generator == 'counter':
+            raise ValueError('ArrayShoe cannot shuffle batches of shoes with the counter random generator.')
+
         self._rules = Rules(
             min_bet=min_bet,
             max_bet=max_bet,
@@ -93,48 +164,717 @@ class Blackjack:
             dealer_shows_hole_card=dealer_shows_hole_card
         )
         self._table = Table(rules=self._rules)
-        self._playing_strategy = PlayingStrategy(s17=s17)
+        self._playing_strategy = load_playing_strategy(path=playing_strategy) if playing_strategy is not None \
+            else PlayingStrategy(s17=s17)
         self._dealer = Dealer()
+        self._shoe_type = shoe_type
+        self._random_generator = random_generator
+        self._shoe_pool = ShoePool(path=shoe_pool) if shoe_pool is not None else None
+        self._shoe: Shoe | None = None
+        self._rounds_played = 0
+
+    @property
+    def shoe_type(self) -> type[Shoe]:
+        return self._shoe_type
+
+    @property
+    def random_generator(self) -> str:
+        return self._random_generator
+
+    @property
+    def shoe_pool(self) -> ShoePool | None:
+        return self._shoe_pool
+
+    @property
+    def playing_strategy(self) -> PlayingStrategy:
+        return self._playing_strategy
+
+    @property
+    def rounds_played(self) -> int:
+        """Number of rounds dealt across every simulation of the game."""
+        return self._rounds_played
 
     def add_player(self, player: Player) -> None:
         """Add a player to the table."""
         return self._table.add_player(player=player)
 
-    def _play_shoe(self, penetration: float, shoe_size: int, reset_bankroll: bool) -> None:
-        if penetration > 0.9:
-            raise ValueError('Penetration must be less than or equal to 0.9.')
+    @property
+    def players(self) -> list[Player]:
+        """Every player added to the table, in the order they were added."""
+        return self._table.roster
 
-        shoe = Shoe(shoe_size=shoe_size, penetration=penetration)
-        shoe.shuffle()
+    def _clone(self, shared_stats: SharedStats | None = None, slot: int = 0) -> 'Blackjack':
+        # players in the copy start with empty stats so that a worker only
+        # sends back the stats it accumulated itself
+        memo = {
+            id(player.stats): Stats(stats=shared_stats.view(slot=slot, player=player_number) if shared_stats else None)
+            for player_number, player in enumerate(self.players)
+        }
+        # the copy creates its own shoe when it plays its first shoe
+        memo[id(self._shoe)] = None
+        blackjack = copy.deepcopy(self, memo)
+        # and only counts the rounds it deals itself
+        blackjack._rounds_played = 0
+        return blackjack
 
-        while not shoe.cut_card_reached and self._table.players:
+    def _seated(self) -> list[bool]:
+        # players who cannot afford their bet leave the table for good, while
+        # back counters return to observing at the start of every shoe
+        players = self._table.players
+        return [isinstance(player, BackCounter) or player in players for player in self.players]
+
+    def _results(
+        self,
+        bankrolls: list[float | int],
+        lowest_bankrolls: list[float | int] | None = None,
+        rounds_played: int = 0
+    ) -> list[PlayerResults]:
+        """
+        Returns the results of every player since their bankrolls were
+        `bankrolls`, the lowest of which at the start of a round are
+        `lowest_bankrolls` if they were tracked, and the game had dealt
+        `rounds_played` rounds.
+
+        """
+        return [
+            (
+                player.stats.stats.overflow if isinstance(player.stats.stats, SharedStatsView) else dict(player.stats.stats),
+                player.bankroll - bankroll,
+                lowest_bankroll - bankroll if lowest_bankrolls is not None else 0,
+                seated,
+                self._rounds_played - rounds_played
+            )
+            for player, bankroll, lowest_bankroll, seated in zip(
+                self.players,
+                bankrolls,
+                lowest_bankrolls if lowest_bankrolls is not None else bankrolls,
+                self._seated()
+            )
+        ]
+
+    def _merge(self, results: list[PlayerResults]) -> None:
+        # results are ordered the same way as the players they belong to
+        for player, (stats, bankroll_change, _, seated, _) in zip(self.players, results):
+            player.stats.merge(stats=stats)
+            player.adjust_bankroll(amount=bankroll_change)
+            if not seated and player in self._table.players:
+                self._table.remove_player(player=player)
+        if results:
+            self._rounds_played += results[0][4]
+
+    def _bankroll_needed(self, player: Player) -> float | int:
+        # the most a player can lay out in a round before their last bankroll check,
+        # i.e. their largest bet on every hand they can split into, doubled, plus
+        # insurance, and then the largest amount checked, which is three bets
+        largest_bet = max(player.placed_bet(count=-inf), player.placed_bet(count=inf))
+        return largest_bet * (2 * self._rules.max_hands + 3.5)
+
+    def _can_merge(
+        self,
+        results: list[PlayerResults],
+        bankrolls: list[float | int],
+        seated: list[bool],
+        reset_bankroll: bool
+    ) -> bool:
+        """
+        Determines if the results of a range of shoes played on a copy of the
+        game that started with `bankrolls` and `seated` are the same as if
+        the range were played on this game, whose players may have different
+        bankrolls by the time the shoes before the range have been merged.
+
+        """
+        if seated != self._seated():
+            return False
+        for player, bankroll, (_, _, lowest_change, _, _) in zip(self.players, bankrolls, results):
+            if player.bankroll == bankroll:
+                continue
+            # bankrolls that are reset after every round are not carried between shoes
+            if reset_bankroll:
+                return False
+            # every bankroll check passes from either bankroll, so the shoes play out the same
+            bankroll_needed = self._bankroll_needed(player=player) - lowest_change
+            if player.bankroll < bankroll_needed or bankroll < bankroll_needed:
+                return False
+        return True
+
+    def _play_shoe(
+        self,
+        penetration: float,
+        shoe_size: int,
+        seed: int,
+        shoe_index: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None = None,
+        lowest_bankrolls: list[float | int] | None = None
+    ) -> None:
+        shoe = self._shoe
+        if shoe is None or shoe.shoe_size != shoe_size or shoe.penetration != penetration:
+            if self._shoe_pool is not None:
+                shoe = self._shoe = PooledShoe(
+                    pool=self._shoe_pool,
+                    penetration=penetration,
+                    generator=create_generator(name=self._random_generator)
+                )
+            else:
+                shoe = self._shoe = self._shoe_type(
+                    shoe_size=shoe_size,
+                    penetration=penetration,
+                    generator=create_generator(name=self._random_generator)
+                )
+        shoe.start_shoe(seed=seed, shoe_index=shoe_index)
+        compiled_strategy = self._playing_strategy.compile(rules=self._rules)
+        if isinstance(shoe, InfiniteShoe) and not any(isinstance(player, CardCounter) for player in self._table.roster):
+            # an infinite deck has nothing to count, no cut card and no seen cards,
+            # so players who flat bet play its rounds without that bookkeeping
+            self._table.reset_seating()
+            self._rounds_played += play_infinite_shoe(
+                table=self._table,
+                rules=self._rules,
+                shoe=shoe,
+                compiled_strategy=compiled_strategy,
+                rounds_per_shoe=rounds_per_shoe,
+                reset_bankroll=reset_bankroll,
+                lowest_bankrolls=lowest_bankrolls
+            )
+            return
+
+        shoe.track_running_counts(card_counting_systems={
+            player.card_counting_system for player in self._table.roster if isinstance(player, CardCounter)
+        })
+        self._table.reset_seating()
+
+        # the round's containers are allocated once for the shoe
+        round_state = RoundState()
+        rounds_played = 0
+        while not shoe.cut_card_reached and self._table.players and rounds_played != rounds_per_shoe:
             play_round(
                 table=self._table,
                 dealer=self._dealer,
                 rules=self._rules,
                 shoe=shoe,
-                playing_strategy=self._playing_strategy
+                compiled_strategy=compiled_strategy,
+                round_state=round_state
             )
+            shoe.return_discards()
+            rounds_played += 1
+            self._rounds_played += 1
 
             if reset_bankroll:
                 for player in self._table.players + self._table.observers:
                     player.reset_bankroll()
 
+            if lowest_bankrolls is not None:
+                for player_number, player in enumerate(self._table.roster):
+                    if player.bankroll < lowest_bankrolls[player_number]:
+                        lowest_bankrolls[player_number] = player.bankroll
+
+    def _infinite_deck_copy(self) -> 'Blackjack':
+        # card counters need the cards seen, which an infinite deck does not keep
+        if any(isinstance(player, CardCounter) for player in self.players):
+            raise ValueError('An infinite deck can only be simulated with players who flat bet.')
+        if self._shoe_pool is not None:
+            raise ValueError('Cannot deal an infinite deck from a shoe pool.')
+        blackjack = self._clone()
+        blackjack._shoe_type = InfiniteShoe
+        return blackjack
+
+    def _check_rounds_per_shoe(self, rounds_per_shoe: int | None) -> None:
+        if rounds_per_shoe is None:
+            if self._shoe_pool is None and issubclass(self._shoe_type, (CSMShoe, InfiniteShoe)):
+                raise ValueError('A number of rounds per shoe is required to simulate a shoe without a cut card.')
+        elif rounds_per_shoe < 1:
+            raise ValueError('Number of rounds per shoe must be at least 1.')
+
+    def _save_checkpoint(
+        self,
+        checkpoint: Checkpoint,
+        shoe_ranges: list[range],
+        penetration: float,
+        shoe_size: int,
+        seed: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None
+    ) -> None:
+        checkpoint.save(state={
+            'blackjack': self,
+            'shoe_ranges': [shoe_range for shoe_range in shoe_ranges if shoe_range],
+            'penetration': penetration,
+            'shoe_size': shoe_size,
+            'seed': seed,
+            'reset_bankroll': reset_bankroll,
+            'rounds_per_shoe': rounds_per_shoe,
+            'every_shoes': checkpoint.every_shoes,
+            'every_seconds': checkpoint.every_seconds
+        })
+
+    def _simulate_serial(
+        self,
+        penetration: float,
+        shoe_ranges: list[range],
+        shoe_size: int,
+        seed: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None,
+        progress_bar: bool,
+        checkpoint: Checkpoint | None
+    ) -> None:
+        total_shoes = sum(len(shoe_range) for shoe_range in shoe_ranges)
+        shoes_simulated = 0
+        start = time.time()
+
+        for range_number, shoe_range in enumerate(shoe_ranges):
+            for position, shoe_index in enumerate(shoe_range):
+                self._play_shoe(
+                    penetration=penetration,
+                    shoe_size=shoe_size,
+                    seed=seed,
+                    shoe_index=shoe_index,
+                    reset_bankroll=reset_bankroll,
+                    rounds_per_shoe=rounds_per_shoe
+                )
+
+                shoes_simulated += 1
+                if progress_bar:
+                    _show_progress(shoes_simulated=shoes_simulated, total_shoes=total_shoes, start=start)
+
+                if checkpoint is not None and checkpoint.record(number_of_shoes=1):
+                    self._save_checkpoint(
+                        checkpoint=checkpoint,
+                        shoe_ranges=[shoe_range[position + 1:], *shoe_ranges[range_number + 1:]],
+                        penetration=penetration,
+                        shoe_size=shoe_size,
+                        seed=seed,
+                        reset_bankroll=reset_bankroll,
+                        rounds_per_shoe=rounds_per_shoe
+                    )
+
+        if progress_bar:
+            print(flush=True, file=sys.stdout)
+
+    def _simulate_parallel(
+        self,
+        penetration: float,
+        shoe_ranges: list[range],
+        shoe_size: int,
+        seed: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None,
+        progress_bar: bool,
+        checkpoint: Checkpoint | None,
+        workers: int,
+        executor: Executor | None,
+        shared_memory: bool,
+        use_threads: bool
+    ) -> None:
+        # imported here since it pulls in multiprocessing, which serial runs never need
+        from concurrent.futures import ProcessPoolExecutor
+
+        scheduler = ShoeScheduler(shoe_ranges=shoe_ranges, workers=workers)
+        total_shoes = scheduler.remaining_shoes
+        number_of_slots = workers * RANGES_PER_WORKER
+
+        # every range in flight writes to its own slot of the shared memory block
+        shared_stats = SharedStats(number_of_players=len(self.players), number_of_slots=number_of_slots) \
+            if shared_memory and self.players else None
+        free_slots = list(range(number_of_slots))
+
+        with (
+            shared_stats if shared_stats else nullcontext(),
+            nullcontext(executor) if executor is not None
+            else ThreadPoolExecutor(max_workers=workers) if use_threads
+            else ProcessPoolExecutor(max_workers=workers) as pool
+        ):
+            # ranges are handed out in the order of their shoes and merged in the same order,
+            # each with its slot, the bankrolls and seating it started from, and the contents
+            # of its slot beforehand, so that it can be played again if they turn out different
+            in_flight: deque[tuple[range, int, list[float | int], list[bool], bytes | None, Future]] = deque()
+            shoes_simulated = 0
+            start = time.time()
+
+            while True:
+                while free_slots and (batch_range := scheduler.next_range()) is not None:
+                    slot = free_slots.pop()
+                    blackjack = self._clone(shared_stats=shared_stats, slot=slot)
+                    if reset_bankroll and (in_flight or shoes_simulated):
+                        # bankrolls are reset after every round, so every shoe after the
+                        # first starts from the initial bankrolls
+                        for player in blackjack.players:
+                            player.reset_bankroll()
+                    # the slot is copied before the range starts writing to it
+                    slot_contents = shared_stats.read_slot(slot=slot) if shared_stats else None
+                    future = pool.submit(
+                        _play_shoes,
+                        blackjack=blackjack,
+                        shoe_range=batch_range,
+                        penetration=penetration,
+                        shoe_size=shoe_size,
+                        seed=seed,
+                        reset_bankroll=reset_bankroll,
+                        rounds_per_shoe=rounds_per_shoe
+                    )
+                    in_flight.append((
+                        batch_range,
+                        slot,
+                        [player.bankroll for player in blackjack.players],
+                        blackjack._seated(),
+                        slot_contents,
+                        future
+                    ))
+
+                if not in_flight:
+                    break
+
+                batch_range, slot, bankrolls, seated, slot_contents, future = in_flight.popleft()
+                try:
+                    results, seconds = future.result()
+                except Exception:
+                    # a range started from other bankrolls or seating may fail where the
+                    # shoes before it would have let it finish, so it is played again
+                    results = None
+                else:
+                    scheduler.record(number_of_shoes=len(batch_range), seconds=seconds)
+                if results is None or not self._can_merge(
+                    results=results,
+                    bankrolls=bankrolls,
+                    seated=seated,
+                    reset_bankroll=reset_bankroll
+                ):
+                    # the range is played again from where the shoes before it left off,
+                    # and any error it raises from there is raised by the simulation
+                    if shared_stats:
+                        shared_stats.write_slot(slot=slot, contents=slot_contents)
+                    results, _ = _play_shoes(
+                        blackjack=self._clone(shared_stats=shared_stats, slot=slot),
+                        shoe_range=batch_range,
+                        penetration=penetration,
+                        shoe_size=shoe_size,
+                        seed=seed,
+                        reset_bankroll=reset_bankroll,
+                        rounds_per_shoe=rounds_per_shoe
+                    )
+                self._merge(results=results)
+                free_slots.append(slot)
+
+                shoes_simulated += len(batch_range)
+                if progress_bar:
+                    _show_progress(shoes_simulated=shoes_simulated, total_shoes=total_shoes, start=start)
+
+                # ranges still in flight are simulated again when resuming
+                if checkpoint is not None and checkpoint.record(number_of_shoes=len(batch_range)):
+                    self._save_checkpoint(
+                        checkpoint=checkpoint,
+                        shoe_ranges=[in_flight_range for in_flight_range, *_ in in_flight] + scheduler.remaining_ranges,
+                        penetration=penetration,
+                        shoe_size=shoe_size,
+                        seed=seed,
+                        reset_bankroll=reset_bankroll,
+                        rounds_per_shoe=rounds_per_shoe
+                    )
+
+            if progress_bar:
+                print(flush=True, file=sys.stdout)
+
+            if shared_stats:
+                for player_number, player in enumerate(self.players):
+                    player.stats.merge(stats=shared_stats.stats(player=player_number).stats)
+
+        if reset_bankroll:
+            for player in self.players:
+                player.reset_bankroll()
+
+    def _simulate_ranges(
+        self,
+        penetration: float,
+        shoe_ranges: list[range],
+        shoe_size: int,
+        seed: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None,
+        progress_bar: bool,
+        checkpoint: Checkpoint | None,
+        workers: int,
+        executor: Executor | None,
+        shared_memory: bool,
+        threads: int
+    ) -> None:
+        if workers < 1:
+            raise ValueError('Number of workers must be at least 1.')
+        if threads < 1:
+            raise ValueError('Number of threads must be at least 1.')
+        if threads > 1 and (workers > 1 or executor is not None):
+            raise ValueError('Cannot simulate with both threads and worker processes.')
+        if shared_memory and checkpoint is not None:
+            raise ValueError('Cannot checkpoint a simulation that accumulates stats in shared memory.')
+
+        use_threads = threads > 1 and not _gil_enabled()
+        if use_threads or workers > 1 or executor is not None:
+            self._simulate_parallel(
+                penetration=penetration,
+                shoe_ranges=shoe_ranges,
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                rounds_per_shoe=rounds_per_shoe,
+                progress_bar=progress_bar,
+                checkpoint=checkpoint,
+                workers=threads if use_threads else workers,
+                executor=executor,
+                shared_memory=shared_memory,
+                use_threads=use_threads
+            )
+        else:
+            self._simulate_serial(
+                penetration=penetration,
+                shoe_ranges=shoe_ranges,
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                rounds_per_shoe=rounds_per_shoe,
+                progress_bar=progress_bar,
+                checkpoint=checkpoint
+            )
+
+        if checkpoint is not None:
+            self._save_checkpoint(
+                checkpoint=checkpoint,
+                shoe_ranges=[],
+                penetration=penetration,
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                rounds_per_shoe=rounds_per_shoe
+            )
+
+    def _simulate_cached(
+        self,
+        cache: SimulationCache,
+        penetration: float,
+        number_of_shoes: int,
+        shoe_size: int,
+        seed: int,
+        reset_bankroll: bool,
+        rounds_per_shoe: int | None,
+        progress_bar: bool,
+        workers: int,
+        executor: Executor | None,
+        first_shoe: int,
+        shared_memory: bool,
+        threads: int
+    ) -> None:
+        key = simulation_key(
+            rules=self._rules,
+            players=self.players,
+            penetration=penetration,
+            shoe_size=shoe_size,
+            seed=seed,
+            reset_bankroll=reset_bankroll,
+            first_shoe=first_shoe,
+            rounds_per_shoe=rounds_per_shoe,
+            shoe_type=self._shoe_type,
+            random_generator=self._random_generator,
+            shoe_pool=self._shoe_pool.digest if self._shoe_pool is not None else None,
+            playing_strategy=self._playing_strategy.digest
+        )
+        cached = cache.load(key=key, number_of_shoes=number_of_shoes)
+        shoes_cached, results = cached if cached is not None else (0, [({}, 0, 0, True, 0) for _ in self.players])
+
+        if shoes_cached < number_of_shoes:
+            # the shoes that are not cached yet are played on a copy that picks up
+            # where the cached shoes left off, so only the shoes themselves are new
+            blackjack = self._clone()
+            blackjack._merge(results=results)
+            blackjack._simulate_ranges(
+                penetration=penetration,
+                shoe_ranges=[range(first_shoe + shoes_cached, first_shoe + number_of_shoes)],
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                rounds_per_shoe=rounds_per_shoe,
+                progress_bar=progress_bar,
+                checkpoint=None,
+                workers=workers,
+                executor=executor,
+                shared_memory=shared_memory,
+                threads=threads
+            )
+            results = blackjack._results(bankrolls=[player.bankroll for player in self.players])
+            cache.save(key=key, number_of_shoes=number_of_shoes, results=results)
+
+        self._merge(results=results)
+        if reset_bankroll:
+            for player in self.players:
+                player.reset_bankroll()
+
     def simulate(
         self,
         penetration: float,
         number_of_shoes: int,
         shoe_size: int, seed: int | None = None,
         reset_bankroll: bool = False,
-        progress_bar: bool = True
+        progress_bar: bool = True,
+        workers: int = 1,
+        executor: Executor | None = None,
+        first_shoe: int = 0,
+        shared_memory: bool = False,
+        threads: int = 1,
+        checkpoint: Checkpoint | None = None,
+        cache: SimulationCache | None = None,
+        rounds_per_shoe: int | None = None,
+        infinite_deck: bool = False
     ) -> None:
-        """Simulates a series of blackjack games across multiple shoes."""
-        if seed:
-            random.seed(seed)
+        """
+        Simulates a series of blackjack games across multiple shoes.
 
-        if progress_bar:
-            for _ in _shoe_progress_bar(shoe_range=range(number_of_shoes)):
-                self._play_shoe(penetration=penetration, shoe_size=shoe_size, reset_bankroll=reset_bankroll)
-        else:
-            for _ in range(number_of_shoes):
-                self._play_shoe(penetration=penetration, shoe_size=shoe_size, reset_bankroll=reset_bankroll)
+        Every shoe is shuffled by its own generator, seeded from the seed
+        of the simulation and the index of the shoe, so any shoe (or range
+        of shoes starting at `first_shoe`) can be replayed on its own.
+
+        When more than one worker (or an executor) is given, ranges of shoes
+        are handed out to the workers as they become free, sized from the
+        measured shoes per second, and played on separate copies of the table
+        and its players. The stats and bankroll changes of every copy are
+        then merged back into the original players in the order of the shoes.
+        A range that started from bankrolls or seating other than those the
+        ranges before it left, and that could have played out differently
+        because of it, is played again before it is merged, so the results
+        match those of a serial run with the same seed. With `shared_memory`,
+        workers accumulate their stats in a SharedStats block rather than
+        sending them back to be merged.
+
+        When more than one thread is given on a free-threaded build of
+        CPython, the shoes are instead played by a pool of threads, each on
+        its own copy of the table, players and shoe. On a build with the GIL
+        the shoes are simulated serially, since threads would not speed it up.
+
+        With a `checkpoint`, the game and the shoes left to simulate are
+        written to a file periodically, from which `Blackjack.resume` can
+        continue the simulation.
+
+        With a `cache`, the results are stored under a hash of the rules,
+        players, shoe size, penetration and seed. Simulating the same game
+        again loads the results rather than simulating them, and simulating
+        more shoes only simulates the shoes that are not cached yet.
+
+        With a `shoe_pool`, shoe `i` of the simulation is shoe `i` of the
+        pool, so the pool must hold every shoe from `first_shoe` onwards.
+
+        With `rounds_per_shoe`, every shoe is played for that many rounds,
+        or until its cut card is reached if that comes first. A CSMShoe has
+        no cut card, so a simulation of a continuous shuffling machine runs
+        `number_of_shoes` sessions of `rounds_per_shoe` rounds, each seeded
+        like a shoe.
+
+        With `infinite_deck`, the cards are drawn from an InfiniteShoe instead,
+        to estimate the expected value of players who flat bet without the
+        effect of cards removed from the shoe, several times faster than from
+        a finite shoe since nothing is counted or seen. An infinite deck has
+        no cut card, so `rounds_per_shoe` is required, and it cannot be
+        checkpointed.
+
+        """
+        if penetration > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+
+        if infinite_deck:
+            # the copy's checkpoint would hold only the stats of the copy, which
+            # start empty, so resuming from it would lose the players' stats
+            if checkpoint is not None:
+                raise ValueError('Cannot checkpoint a simulation of an infinite deck.')
+            # the shoes are played on a copy dealing from an infinite deck, whose
+            # results are then merged back into the players
+            blackjack = self._infinite_deck_copy()
+            blackjack.simulate(
+                penetration=penetration,
+                number_of_shoes=number_of_shoes,
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                progress_bar=progress_bar,
+                workers=workers,
+                executor=executor,
+                first_shoe=first_shoe,
+                shared_memory=shared_memory,
+                threads=threads,
+                cache=cache,
+                rounds_per_shoe=rounds_per_shoe
+            )
+            self._merge(results=blackjack._results(bankrolls=[player.bankroll for player in self.players]))
+            return
+
+        self._check_rounds_per_shoe(rounds_per_shoe=rounds_per_shoe)
+
+        if self._shoe_pool is not None:
+            if shoe_size != self._shoe_pool.shoe_size:
+                raise ValueError(f'Shoe size must be {self._shoe_pool.shoe_size} to deal from the shoe pool.')
+            if first_shoe + number_of_shoes > self._shoe_pool.number_of_shoes:
+                raise ValueError(f'Shoe pool only holds {self._shoe_pool.number_of_shoes} shoes.')
+
+        if cache is not None:
+            if seed is None:
+                raise ValueError('A seed is required to cache the results of a simulation.')
+            if checkpoint is not None:
+                raise ValueError('Cannot checkpoint a simulation whose results are cached.')
+            self._simulate_cached(
+                cache=cache,
+                penetration=penetration,
+                number_of_shoes=number_of_shoes,
+                shoe_size=shoe_size,
+                seed=seed,
+                reset_bankroll=reset_bankroll,
+                rounds_per_shoe=rounds_per_shoe,
+                progress_bar=progress_bar,
+                workers=workers,
+                executor=executor,
+                first_shoe=first_shoe,
+                shared_memory=shared_memory,
+                threads=threads
+            )
+            return
+
+        self._simulate_ranges(
+            penetration=penetration,
+            shoe_ranges=[range(first_shoe, first_shoe + number_of_shoes)],
+            shoe_size=shoe_size,
+            seed=random.getrandbits(64) if seed is None else seed,
+            reset_bankroll=reset_bankroll,
+            rounds_per_shoe=rounds_per_shoe,
+            progress_bar=progress_bar,
+            checkpoint=checkpoint,
+            workers=workers,
+            executor=executor,
+            shared_memory=shared_memory,
+            threads=threads
+        )
+
+    @classmethod
+    def resume(
+        cls,
+        path: str | os.PathLike,
+        progress_bar: bool = True,
+        workers: int = 1,
+        executor: Executor | None = None,
+        threads: int = 1
+    ) -> 'Blackjack':
+        """
+        Resumes a simulation from the checkpoint written to `path` and
+        returns the game once every remaining shoe has been simulated.
+        Checkpoints continue to be written to the same file.
+
+        """
+        state: dict[str, Any] = Checkpoint.load(path=path)
+        blackjack: Blackjack = state['blackjack']
+        blackjack._simulate_ranges(
+            penetration=state['penetration'],
+            shoe_ranges=state['shoe_ranges'],
+            shoe_size=state['shoe_size'],
+            seed=state['seed'],
+            reset_bankroll=state['reset_bankroll'],
+            rounds_per_shoe=state.get('rounds_per_shoe'),
+            progress_bar=progress_bar,
+            checkpoint=Checkpoint(path=path, every_shoes=state['every_shoes'], every_seconds=state['every_seconds']),
+            workers=workers,
+            executor=executor,
+            shared_memory=False,
+            threads=threads
+        )
+        return blackjack
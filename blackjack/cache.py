@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from enum import Enum
+from typing import Any
+from blackjack.player import Player
+from blackjack.rules import Rules
+from blackjack.shoe import Shoe
+from blackjack.stats import PlayerResults
+
+
+# bumped whenever a change to the simulation would change cached results
+CACHE_VERSION = 3
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return sorted([_canonical(key), _canonical(item)] for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return value
+
+
+def simulation_key(
+    rules: Rules,
+    players: list[Player],
+    penetration: float,
+    shoe_size: int,
+    seed: int | None,
+    reset_bankroll: bool,
+    first_shoe: int = 0,
+    rounds_per_shoe: int | None = None,
+    shoe_type: type[Shoe] | None = None,
+    random_generator: str = 'stdlib',
+    shoe_pool: str | None = None,
+    playing_strategy: str | None = None
+) -> str:
+    """
+    Returns a stable hash of everything that determines the results
+    of a simulation, apart from the number of shoes simulated. Shoes
+    dealt from a shoe pool are identified by the digest of the pool,
+    and a strategy loaded from a file by the digest of the file.
+
+    """
+    definition = {
+        'version': CACHE_VERSION,
+        'rules': rules.definition,
+        'players': [
+            {
+                'class': f'{type(player).__module__}.{type(player).__qualname__}',
+                'definition': player.definition,
+                'bankroll': player.bankroll
+            }
+            for player in players
+        ],
+        'penetration': penetration,
+        'shoe_size': shoe_size,
+        'seed': seed,
+        'reset_bankroll': reset_bankroll,
+        'first_shoe': first_shoe,
+        'rounds_per_shoe': rounds_per_shoe,
+        'shoe_type': f'{shoe_type.__module__}.{shoe_type.__qualname__}' if shoe_type is not None else None,
+        'random_generator': random_generator,
+        'shoe_pool': shoe_pool,
+        'playing_strategy': playing_strategy
+    }
+    return hashlib.sha256(json.dumps(_canonical(definition), sort_keys=True).encode()).hexdigest()
+
+
+class SimulationCache:
+    """
+    Represents an on-disk cache of simulation results, keyed by a stable
+    hash of the rules, players, shoe size, penetration and seed. Results
+    are stored for every number of shoes simulated, so a longer simulation
+    only needs to simulate the shoes that are not cached yet.
+
+    """
+    def __init__(self, directory: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        directory
+            Directory the cached results are stored in
+
+        """
+        self._directory = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _entry_directory(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def shoes_cached(self, key: str) -> list[int]:
+        try:
+            file_names = os.listdir(self._entry_directory(key=key))
+        except FileNotFoundError:
+            return []
+        return sorted(int(file_name.removesuffix('.pickle')) for file_name in file_names if file_name.endswith('.pickle'))
+
+    def load(
+        self,
+        key: str,
+        number_of_shoes: int
+    ) -> tuple[int, list[PlayerResults]] | None:
+        """
+        Returns the largest cached number of shoes that does not exceed
+        `number_of_shoes` along with its results, or None if nothing is cached.
+
+        """
+        shoes_cached = [shoes for shoes in self.shoes_cached(key=key) if shoes <= number_of_shoes]
+        if not shoes_cached:
+            return None
+        with open(os.path.join(self._entry_directory(key=key), f'{shoes_cached[-1]}.pickle'), 'rb') as file:
+            return shoes_cached[-1], pickle.load(file)
+
+    def save(
+        self,
+        key: str,
+        number_of_shoes: int,
+        results: list[PlayerResults]
+    ) -> None:
+        entry_directory = self._entry_directory(key=key)
+        os.makedirs(entry_directory, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(dir=entry_directory, prefix='.entry-', delete=False)
+        try:
+            with file:
+                pickle.dump(results, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, os.path.join(entry_directory, f'{number_of_shoes}.pickle'))
+        except BaseException:
+            if os.path.exists(file.name):
+                os.unlink(file.name)
+            raise
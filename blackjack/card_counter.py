@@ -1,7 +1,7 @@
 from math import ceil, floor
 from typing import Any
 from typing_extensions import override
-from blackjack.enums import CardCountingSystem
+from blackjack.enums import CardCountingSystem, DeckEstimation
 from blackjack.player import Player
 
 
@@ -11,11 +11,23 @@ class CardCounter(Player):
     counts cards according to a counting strategy.
 
     """
+    __slots__ = (
+        'max_bet_ramp',
+        'min_bet_ramp',
+        'min_count',
+        'max_count',
+        '_bet_ramp',
+        '_card_counting_system',
+        '_insurance',
+        '_deck_estimation'
+    )
+
     def __init__(
         self,
         card_counting_system: CardCountingSystem,
         bet_ramp: dict[float | int, float | int],
         insurance: float | int | None = None,
+        deck_estimation: DeckEstimation = DeckEstimation.FULL_DECK,
         **kwargs: Any
     ):
         """
@@ -32,6 +44,9 @@ class CardCounter(Player):
         insurance
             Minimum running or true count at which a player will
             purchase insurance, if desired, and if available
+        deck_estimation
+            Precision with which the player estimates the number of
+            decks remaining when converting to a true count
 
         """
         super().__init__(**kwargs)
@@ -58,11 +73,27 @@ class CardCounter(Player):
         self._bet_ramp = bet_ramp
         self._card_counting_system = card_counting_system
         self._insurance = insurance
+        self._deck_estimation = deck_estimation
+
+    @property
+    @override
+    def definition(self) -> dict[str, Any]:
+        return {
+            **super().definition,
+            'card_counting_system': self._card_counting_system,
+            'bet_ramp': self._bet_ramp,
+            'insurance': self._insurance,
+            'deck_estimation': self._deck_estimation
+        }
 
     @property
     def card_counting_system(self) -> CardCountingSystem:
         return self._card_counting_system
 
+    @property
+    def deck_estimation(self) -> DeckEstimation:
+        return self._deck_estimation
+
     @property
     def bet_ramp(self) -> dict[float | int, float | int]:
         return self._bet_ramp
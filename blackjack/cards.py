@@ -0,0 +1,12 @@
+# every card is handled as the index of its rank in RANKS, so that looking up its
+# value, count or strategy is a tuple or list index rather than a string lookup;
+# ten-valued cards play alike, so they share one rank
+RANKS: tuple[str, ...] = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'A')
+TEN = RANKS.index('10')
+ACE = RANKS.index('A')
+
+CARD_CODES: dict[str, int] = {**{rank: code for code, rank in enumerate(RANKS)}, 'J': TEN, 'Q': TEN, 'K': TEN}
+
+# the value of each rank in a hard total, where an ace is worth 1
+HARD_VALUES: tuple[int, ...] = (2, 3, 4, 5, 6, 7, 8, 9, 10, 1)
+
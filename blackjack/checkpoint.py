@@ -0,0 +1,87 @@
+import os
+import pickle
+import tempfile
+import time
+from typing import Any
+
+
+class Checkpoint:
+    """
+    Represents periodic checkpoints of a simulation, written to a single
+    file every given number of shoes and/or seconds. Each checkpoint
+    replaces the previous one atomically, so the file always holds a
+    complete checkpoint even if the simulation dies while writing it.
+
+    """
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        every_shoes: int | None = None,
+        every_seconds: float | None = None
+    ):
+        """
+        Parameters
+        ----------
+        path
+            Path of the file checkpoints are written to
+        every_shoes
+            Number of shoes simulated between checkpoints
+        every_seconds
+            Number of seconds between checkpoints
+
+        """
+        if every_shoes is None and every_seconds is None:
+            raise ValueError('Checkpoints must be taken every number of shoes and/or seconds.')
+        if (every_shoes is not None and every_shoes < 1) or (every_seconds is not None and every_seconds <= 0):
+            raise ValueError('Checkpoint interval must be greater than 0.')
+
+        self._path = os.fspath(path)
+        self._every_shoes = every_shoes
+        self._every_seconds = every_seconds
+        self._shoes_since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def every_shoes(self) -> int | None:
+        return self._every_shoes
+
+    @property
+    def every_seconds(self) -> float | None:
+        return self._every_seconds
+
+    def record(self, number_of_shoes: int) -> bool:
+        """
+        Records that a number of shoes were simulated and returns
+        True if a checkpoint is due, False otherwise.
+
+        """
+        self._shoes_since_checkpoint += number_of_shoes
+        if self._every_shoes is not None and self._shoes_since_checkpoint >= self._every_shoes:
+            return True
+        return self._every_seconds is not None and time.monotonic() - self._last_checkpoint >= self._every_seconds
+
+    def save(self, state: dict[str, Any]) -> None:
+        # write to a temporary file next to the checkpoint, then swap it in
+        directory = os.path.dirname(os.path.abspath(self._path))
+        file = tempfile.NamedTemporaryFile(dir=directory, prefix='.checkpoint-', delete=False)
+        try:
+            with file:
+                pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(file.name, self._path)
+        except BaseException:
+            if os.path.exists(file.name):
+                os.unlink(file.name)
+            raise
+        self._shoes_since_checkpoint = 0
+        self._last_checkpoint = time.monotonic()
+
+    @staticmethod
+    def load(path: str | os.PathLike) -> dict[str, Any]:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
@@ -0,0 +1,190 @@
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import sys
+import time
+from typing import Any
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ModuleNotFoundError:
+        tomllib = None
+
+
+OUTPUT_FORMATS = ('json', 'csv')
+
+
+def load_config(path: str | os.PathLike) -> dict[str, Any]:
+    """Reads a config from a TOML file, or a JSON file if its name ends in .json."""
+    if os.fspath(path).endswith('.json'):
+        with open(path) as file:
+            return json.load(file)
+
+    if tomllib is None:
+        raise ValueError('Reading TOML configs requires Python 3.11 or later, or the tomli package.')
+    with open(path, 'rb') as file:
+        return tomllib.load(file)
+
+
+def _csv(results: dict[str, Any]) -> str:
+    # one row per player, with a column for the bankroll and every stat
+    output = io.StringIO()
+    players = results['players']
+    fieldnames = ['name', 'type', 'bankroll', *(players[0]['stats'] if players else [])]
+    writer = csv.DictWriter(output, fieldnames=fieldnames, lineterminator='\n')
+    writer.writeheader()
+    for player in players:
+        writer.writerow({'name': player['name'], 'type': player['type'], 'bankroll': player['bankroll'], **player['stats']})
+    return output.getvalue()
+
+
+def format_results(results: dict[str, Any], output_format: str) -> str:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f'Output format must be one of {", ".join(OUTPUT_FORMATS)}.')
+    if output_format == 'csv':
+        return _csv(results=results)
+    return json.dumps(results, indent=2) + '\n'
+
+
+def run(
+    config: dict[str, Any],
+    workers: int | None = None,
+    number_of_shoes: int | None = None,
+    seed: int | None = None,
+    progress_bar: bool = False,
+    bench: bool = False
+) -> dict[str, Any]:
+    """
+    Simulates the game described by a config and returns the parameters
+    of the simulation along with the bankroll and stats of every player.
+    With `bench`, the number of rounds and shoes simulated per second are
+    also returned. The arguments given here take precedence over the same
+    keys in the config, and the number of workers defaults to 1.
+
+    """
+    # the simulation modules are imported here so that --help and
+    # argument errors do not wait on them
+    from blackjack.config import create_blackjack, simulation_parameters
+
+    blackjack = create_blackjack(config=config)
+    if number_of_shoes is not None:
+        config = {**config, 'simulation': {**config.get('simulation', {}), 'number_of_shoes': number_of_shoes}}
+    parameters = simulation_parameters(config=config)
+    if seed is not None:
+        parameters['seed'] = seed
+    elif parameters['seed'] is None:
+        # the seed is recorded in the results so the run can be repeated
+        parameters['seed'] = random.getrandbits(64)
+    if workers is not None:
+        parameters['workers'] = workers
+    parameters.setdefault('workers', 1)
+    # whether to show progress is up to whoever runs the config, so it is not recorded
+    parameters.pop('progress_bar', None)
+
+    start = time.perf_counter()
+    blackjack.simulate(progress_bar=progress_bar, **parameters)
+    seconds = time.perf_counter() - start
+
+    results: dict[str, Any] = {
+        'simulation': parameters,
+        'players': [
+            {
+                'name': player.name,
+                'type': type(player).__name__,
+                'bankroll': player.bankroll,
+                'stats': player.stats.summary(string=False)
+            }
+            for player in blackjack.players
+        ]
+    }
+
+    if bench:
+        results['bench'] = {
+            'seconds': seconds,
+            'rounds': blackjack.rounds_played,
+            'rounds_per_second': blackjack.rounds_played / seconds if seconds else 0.0,
+            'shoes_per_second': parameters['number_of_shoes'] / seconds if seconds else 0.0
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m blackjack', description='Runs blackjack simulations.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='simulate the game described by a config file')
+    run_parser.add_argument('config', help='TOML (or JSON) file declaring the rules, players and simulation')
+    run_parser.add_argument('--workers', type=int, help='number of worker processes, overriding the config (default 1)')
+    run_parser.add_argument('--shoes', type=int, help='number of shoes to simulate, overriding the config')
+    run_parser.add_argument('--seed', type=int, help='seed of the simulation, overriding the config')
+    run_parser.add_argument('--output', '-o', help='file the results are written to, otherwise standard output')
+    run_parser.add_argument('--format', choices=OUTPUT_FORMATS, help='format of the results, inferred from --output by default')
+    run_parser.add_argument('--progress', action='store_true', help='show a progress bar on standard error')
+    run_parser.add_argument('--bench', action='store_true', help='report the number of rounds simulated per second')
+
+    pool_parser = subparsers.add_parser('pool', help='write a pool of shuffled shoes to a file for replay')
+    pool_parser.add_argument('output', help='file the shoes are written to')
+    pool_parser.add_argument('--shoes', type=int, required=True, help='number of shoes in the pool')
+    pool_parser.add_argument('--shoe-size', type=int, required=True, help='number of decks in each shoe')
+    pool_parser.add_argument('--seed', type=int, help='seed the shoes are shuffled with, otherwise a random one')
+    pool_parser.add_argument('--random-generator', default='stdlib', help='random generator the shoes are shuffled with')
+    args = parser.parse_args(argv)
+
+    if args.command == 'pool':
+        from blackjack.shoe_pool import write_shoe_pool
+
+        try:
+            seed = write_shoe_pool(
+                path=args.output,
+                number_of_shoes=args.shoes,
+                shoe_size=args.shoe_size,
+                seed=args.seed,
+                random_generator=args.random_generator
+            )
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        print(f'Wrote {args.shoes:,} shoes of {args.shoe_size} decks to {args.output} (seed {seed})', file=sys.stderr)
+        return
+
+    output_format = args.format
+    if output_format is None:
+        output_format = 'csv' if args.output is not None and args.output.endswith('.csv') else 'json'
+
+    try:
+        config = load_config(path=args.config)
+        # the progress bar is written to standard output, which may hold the results
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run(
+                config=config,
+                workers=args.workers,
+                number_of_shoes=args.shoes,
+                seed=args.seed,
+                progress_bar=args.progress,
+                bench=args.bench
+            )
+    except KeyError as e:
+        parser.error(f'Invalid config, missing {e.args[0]!r}.')
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        parser.error(str(e))
+
+    output = format_results(results=results, output_format=output_format)
+    if args.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(args.output, 'w', newline='') as file:
+            file.write(output)
+
+    if args.bench:
+        bench = results['bench']
+        print(
+            f"Simulated {bench['rounds']:,} rounds in {bench['seconds']:.2f}s "
+            f"({bench['rounds_per_second']:,.0f} rounds/sec, {bench['shoes_per_second']:,.1f} shoes/sec)",
+            file=sys.stderr
+        )
@@ -0,0 +1,126 @@
+from typing import Any
+from blackjack.back_counter import BackCounter
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem, DeckEstimation
+from blackjack.player import Player
+from blackjack.shoe import ArrayShoe, CompositionShoe, CSMShoe, CursorShoe, InfiniteShoe, PartialShuffleShoe, Shoe
+
+
+PLAYER_TYPES: dict[str, type[Player]] = {
+    'Player': Player,
+    'CardCounter': CardCounter,
+    'BackCounter': BackCounter
+}
+
+SHOE_TYPES: dict[str, type[Shoe]] = {
+    'Shoe': Shoe,
+    'CursorShoe': CursorShoe,
+    'PartialShuffleShoe': PartialShuffleShoe,
+    'CompositionShoe': CompositionShoe,
+    'ArrayShoe': ArrayShoe,
+    'CSMShoe': CSMShoe,
+    'InfiniteShoe': InfiniteShoe
+}
+
+SIMULATION_DEFAULTS: dict[str, Any] = {
+    'penetration': 0.75,
+    'seed': None,
+    'reset_bankroll': False,
+    'first_shoe': 0,
+    'rounds_per_shoe': None,
+    'infinite_deck': False
+}
+
+
+def _count(key: float | int | str) -> float | int:
+    # bet ramp counts are strings when read from JSON or TOML
+    count = float(key)
+    return int(count) if count.is_integer() else count
+
+
+def _card_counting_system(value: CardCountingSystem | str) -> CardCountingSystem:
+    if isinstance(value, CardCountingSystem):
+        return value
+    for card_counting_system in CardCountingSystem:
+        if value in (card_counting_system.name, card_counting_system.value):
+            return card_counting_system
+    raise ValueError(f'Unknown card counting system {value!r}.')
+
+
+def _deck_estimation(value: DeckEstimation | str) -> DeckEstimation:
+    if isinstance(value, DeckEstimation):
+        return value
+    for deck_estimation in DeckEstimation:
+        if value in (deck_estimation.name, deck_estimation.value):
+            return deck_estimation
+    raise ValueError(f'Unknown deck estimation {value!r}.')
+
+
+def create_player(definition: dict[str, Any]) -> Player:
+    """
+    Creates a player from its definition, i.e. an entry of the
+    players in a config, where `type` names the class of player.
+
+    """
+    if not isinstance(definition, dict):
+        raise ValueError('Each player must be a table of its parameters.')
+    definition = dict(definition)
+    player_type = definition.pop('type', 'Player')
+    if player_type not in PLAYER_TYPES:
+        raise ValueError(f'Unknown player type {player_type!r}.')
+
+    if 'card_counting_system' in definition:
+        definition['card_counting_system'] = _card_counting_system(value=definition['card_counting_system'])
+    if 'deck_estimation' in definition:
+        definition['deck_estimation'] = _deck_estimation(value=definition['deck_estimation'])
+    if 'bet_ramp' in definition:
+        if not isinstance(definition['bet_ramp'], dict):
+            raise ValueError('Bet ramp must be a table of counts and wagers.')
+        definition['bet_ramp'] = {_count(key=count): wager for count, wager in definition['bet_ramp'].items()}
+    return PLAYER_TYPES[player_type](**definition)
+
+
+def create_blackjack(config: dict[str, Any]) -> Blackjack:
+    """
+    Creates a game from the `rules` and `players` of a config, with the
+    players added to the table in the order they are listed. The rules
+    may name the `shoe_type` cards are dealt from, or the path of a
+    `shoe_pool` to deal them from, and the path of a `playing_strategy`
+    for the players to follow.
+
+    """
+    if 'rules' not in config:
+        raise ValueError('Config must include the rules of the game.')
+    if not isinstance(config['rules'], dict):
+        raise ValueError('Rules must be a table of their parameters.')
+
+    rules = dict(config['rules'])
+    if isinstance(rules.get('shoe_type'), str):
+        if rules['shoe_type'] not in SHOE_TYPES:
+            raise ValueError(f"Unknown shoe type {rules['shoe_type']!r}.")
+        rules['shoe_type'] = SHOE_TYPES[rules['shoe_type']]
+
+    players = config.get('players', [])
+    if not isinstance(players, list):
+        raise ValueError('Players must be a list of player definitions.')
+
+    blackjack = Blackjack(**rules)
+    for definition in players:
+        blackjack.add_player(player=create_player(definition=definition))
+    return blackjack
+
+
+def simulation_parameters(config: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns the keyword arguments of `Blackjack.simulate` given in
+    the `simulation` section of a config, filled in with defaults.
+
+    """
+    if not isinstance(config.get('simulation', {}), dict):
+        raise ValueError('Simulation must be a table of its parameters.')
+    parameters = {**SIMULATION_DEFAULTS, **config.get('simulation', {})}
+    for parameter in ('number_of_shoes', 'shoe_size'):
+        if parameter not in parameters:
+            raise ValueError(f'Config must include the {parameter} to simulate.')
+    return parameters
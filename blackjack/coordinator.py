@@ -0,0 +1,288 @@
+import logging
+import random
+import secrets
+import socket
+import threading
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Connection, Listener
+from typing import Any
+from blackjack.blackjack import Blackjack, _play_shoes
+from blackjack.scheduler import ShoeScheduler
+from blackjack.stats import PlayerResults
+
+
+logger = logging.getLogger(__name__)
+
+
+class Coordinator:
+    """
+    Represents a coordinator that spreads one simulation across worker
+    processes, possibly on other machines, over TCP. Workers (started with
+    `python -m blackjack.worker`) receive the table, rules and players once,
+    then repeatedly ask for a range of shoes and send back the results of
+    every player. Ranges held by a worker that dies are handed out again.
+    Results are merged in the order of the shoes, and a range that fails,
+    or whose players would have started from different bankrolls or seating
+    than the workers' copy of the game, is simulated again by the coordinator.
+    Workers that connect after every shoe has been simulated are told there
+    is nothing left to do, until the coordinator is closed.
+
+    """
+    def __init__(
+        self,
+        blackjack: Blackjack,
+        penetration: float,
+        number_of_shoes: int,
+        shoe_size: int,
+        seed: int | None = None,
+        first_shoe: int = 0,
+        reset_bankroll: bool = False,
+        rounds_per_shoe: int | None = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        authkey: bytes | None = None,
+        workers: int = 1
+    ):
+        """
+        Parameters
+        ----------
+        blackjack
+            Blackjack class instance whose players the results are merged into
+        penetration
+            The percentage of the shoe that is dealt before the shoe is re-shuffled
+        number_of_shoes
+            Number of shoes to simulate
+        shoe_size
+            Number of decks used during a blackjack game
+        seed
+            Seed of the simulation from which the seed of every shoe is derived
+        first_shoe
+            Index of the first shoe to simulate
+        reset_bankroll
+            True if bankrolls are reset after every round, False otherwise
+        rounds_per_shoe
+            Number of rounds every shoe is played for, otherwise
+            every shoe is played until its cut card is reached
+        host
+            Host the coordinator listens on
+        port
+            Port the coordinator listens on, 0 picks a free port
+        authkey
+            Key workers must know to connect, otherwise a random key is generated
+        workers
+            Number of workers expected to connect, used to size the ranges of shoes
+
+        """
+        if penetration > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+        blackjack._check_rounds_per_shoe(rounds_per_shoe=rounds_per_shoe)
+
+        self._blackjack = blackjack
+        self._reset_bankroll = reset_bankroll
+        job_blackjack = blackjack._clone()
+        self._bankrolls = [player.bankroll for player in job_blackjack.players]
+        self._seated = job_blackjack._seated()
+        self._job = {
+            'blackjack': job_blackjack,
+            'penetration': penetration,
+            'shoe_size': shoe_size,
+            'seed': random.getrandbits(64) if seed is None else seed,
+            'reset_bankroll': reset_bankroll,
+            'rounds_per_shoe': rounds_per_shoe
+        }
+        self._scheduler = ShoeScheduler(shoe_ranges=[range(first_shoe, first_shoe + number_of_shoes)], workers=workers)
+        self._retry_ranges: list[range] = []
+        # ranges handed out that are not merged yet, in the order of their shoes,
+        # along with the results of those that have been simulated
+        self._unmerged_ranges: list[range] = []
+        self._completed_ranges: dict[range, list[PlayerResults] | None] = {}
+        self._merging = False
+        self._error: Exception | None = None
+        self._ranges_in_flight = 0
+        self._shoes_remaining = number_of_shoes
+        self._condition = threading.Condition()
+        self._authkey = authkey if authkey is not None else secrets.token_bytes(16)
+        self._listener = Listener(address=(host, port), family='AF_INET', authkey=self._authkey)
+        self._accept_thread: threading.Thread | None = None
+        self._serve_threads: list[threading.Thread] = []
+        self._closed = False
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._listener.address
+
+    @property
+    def authkey(self) -> bytes:
+        return self._authkey
+
+    @property
+    def shoes_remaining(self) -> int:
+        return self._shoes_remaining
+
+    def _next_range(self) -> range | None:
+        with self._condition:
+            while True:
+                if self._retry_ranges:
+                    shoe_range = self._retry_ranges.pop()
+                else:
+                    shoe_range = self._scheduler.next_range()
+                    if shoe_range is not None:
+                        self._unmerged_ranges.append(shoe_range)
+
+                if shoe_range is not None:
+                    self._ranges_in_flight += 1
+                    return shoe_range
+
+                # every range has been handed out, but one may still come back
+                # if the worker simulating it dies
+                if not self._ranges_in_flight or self._closed or self._error is not None:
+                    return None
+                self._condition.wait()
+
+    def _complete_range(
+        self,
+        shoe_range: range,
+        results: list[PlayerResults] | None,
+        seconds: float
+    ) -> None:
+        # results are None if the range failed on the worker
+        with self._condition:
+            if results is not None:
+                self._scheduler.record(number_of_shoes=len(shoe_range), seconds=seconds)
+            self._ranges_in_flight -= 1
+            self._completed_ranges[shoe_range] = results
+            self._condition.notify_all()
+        self._merge_ranges()
+
+    def _merge_ranges(self) -> None:
+        # one thread at a time merges the completed ranges at the front, and ranges
+        # completed meanwhile are merged by that thread once it finishes its range
+        blackjack = self._blackjack
+        while True:
+            with self._condition:
+                if self._merging or not self._unmerged_ranges or self._unmerged_ranges[0] not in self._completed_ranges:
+                    return
+                shoe_range = self._unmerged_ranges[0]
+                results = self._completed_ranges.pop(shoe_range)
+                if results is not None and blackjack._can_merge(
+                    results=results,
+                    bankrolls=self._bankrolls,
+                    seated=self._seated,
+                    reset_bankroll=self._reset_bankroll
+                ):
+                    self._merge_range(shoe_range=shoe_range, results=results)
+                    continue
+                # the range is played again from where the shoes before it left off,
+                # on a copy taken now so that workers are not held up meanwhile
+                self._merging = True
+                replay_blackjack = blackjack._clone()
+
+            try:
+                results, _ = _play_shoes(
+                    blackjack=replay_blackjack,
+                    shoe_range=shoe_range,
+                    penetration=self._job['penetration'],
+                    shoe_size=self._job['shoe_size'],
+                    seed=self._job['seed'],
+                    reset_bankroll=self._reset_bankroll,
+                    rounds_per_shoe=self._job['rounds_per_shoe']
+                )
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+                    self._merging = False
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                self._merge_range(shoe_range=shoe_range, results=results)
+                self._merging = False
+
+    def _merge_range(self, shoe_range: range, results: list[PlayerResults]) -> None:
+        self._blackjack._merge(results=results)
+        self._unmerged_ranges.pop(0)
+        self._shoes_remaining -= len(shoe_range)
+        self._condition.notify_all()
+
+    def _fail_range(self, shoe_range: range) -> None:
+        with self._condition:
+            self._retry_ranges.append(shoe_range)
+            self._ranges_in_flight -= 1
+            self._condition.notify_all()
+
+    def _serve(self, connection: Connection) -> None:
+        shoe_range = None
+        try:
+            with connection:
+                connection.send(('job', self._job))
+                while (shoe_range := self._next_range()) is not None:
+                    connection.send(('range', shoe_range))
+                    results, seconds = connection.recv()
+                    self._complete_range(shoe_range=shoe_range, results=results, seconds=seconds)
+                    shoe_range = None
+                connection.send(('done', None))
+        except (EOFError, OSError):
+            if shoe_range is not None:
+                self._fail_range(shoe_range=shoe_range)
+
+    def _accept(self) -> None:
+        while not self._closed:
+            try:
+                connection = self._listener.accept()
+            except (EOFError, AuthenticationError):
+                continue
+            except OSError as e:
+                # the listener is closed along with the coordinator, while any
+                # other error only loses the worker that was connecting
+                if self._closed:
+                    return
+                logger.warning('Worker failed to connect: %s', e)
+                continue
+            thread = threading.Thread(target=self._serve, args=(connection,), daemon=True)
+            thread.start()
+            self._serve_threads.append(thread)
+
+    def run(self) -> None:
+        """
+        Serves ranges of shoes to workers until every shoe has been simulated.
+        An error raised while a range is played again by the coordinator is
+        raised here.
+
+        """
+        if self._accept_thread is None:
+            self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+            self._accept_thread.start()
+
+        with self._condition:
+            while self._shoes_remaining and self._error is None:
+                self._condition.wait()
+            if self._error is not None:
+                raise self._error
+
+        if self._reset_bankroll:
+            for player in self._blackjack.players:
+                player.reset_bankroll()
+
+    def close(self) -> None:
+        """Stops accepting workers and waits for connected workers to finish."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._accept_thread is not None:
+            # wake up the accepting thread, which is blocked waiting for a worker
+            with socket.create_connection(self.address):
+                pass
+            self._accept_thread.join()
+        self._listener.close()
+
+        # workers still holding a range are only waited on if the run finished
+        if not self._shoes_remaining:
+            for thread in self._serve_threads:
+                thread.join()
+
+    def __enter__(self) -> 'Coordinator':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -6,6 +6,8 @@ class Dealer:
     Represents the dealer at a blackjack table.
 
     """
+    __slots__ = ('_hand',)
+
     def __init__(self):
         self._hand = Hand()
 
@@ -14,12 +16,12 @@ class Dealer:
         return self._hand
 
     @property
-    def hole_card(self) -> str:
-        return self._hand.cards[0]
+    def hole_card(self) -> int:
+        return self._hand.card_codes[0]
 
     @property
-    def up_card(self) -> str:
-        return self._hand.cards[1]
+    def up_card(self) -> int:
+        return self._hand.card_codes[1]
 
     def reset_hand(self) -> None:
-        self._hand = Hand()
+        self._hand.reset()
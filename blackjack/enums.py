@@ -10,6 +10,19 @@ class CardCountingSystem(Enum):
     ZEN_COUNT = 'ZEN COUNT'
     KO = 'KO'
 
+    # members are singletons, so the identity hash is enough and avoids
+    # Enum.__hash__, since the count of a system is looked up every round
+    __hash__ = object.__hash__
+
+
+class DeckEstimation(Enum):
+    EXACT = 'EXACT'
+    QUARTER_DECK = 'QUARTER DECK'
+    HALF_DECK = 'HALF DECK'
+    FULL_DECK = 'FULL DECK'
+
+    __hash__ = object.__hash__
+
 
 class HandStatus(Enum):
     IN_PLAY = 'IN PLAY'
@@ -33,3 +46,11 @@ class StatsCategory(Enum):
     NET_WINNINGS = 'NET WINNINGS'
     TOTAL_AMOUNT_BET = 'TOTAL AMOUNT BET'
     TOTAL_NET_WINNINGS = 'TOTAL NET WINNINGS'
+
+
+class JobStatus(Enum):
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    COMPLETED = 'COMPLETED'
+    CANCELLED = 'CANCELLED'
+    FAILED = 'FAILED'
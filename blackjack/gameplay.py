@@ -1,50 +1,111 @@
 from collections import defaultdict
 from blackjack.back_counter import BackCounter
 from blackjack.card_counter import CardCounter
+from blackjack.cards import ACE
 from blackjack.dealer import Dealer
-from blackjack.enums import CardCountingSystem, HandStatus
+from blackjack.enums import CardCountingSystem, DeckEstimation, HandStatus
 from blackjack.hand import Hand
 from blackjack.player import Player
-from blackjack.playing_strategy import PlayingStrategy
+from blackjack.playing_strategy import DOUBLE_OR_HIT, DOUBLE_OR_STAND, HIT, SPLIT, SPLIT_OR_HIT, SURRENDER
+from blackjack.playing_strategy import CompiledStrategy, PlayingStrategy
 from blackjack.rules import Rules
 from blackjack.shoe import Shoe
+from blackjack.source.hand_states import BUSTED, DEALER_STANDS, EMPTY_HAND, NUMBER_OF_CARDS, PAIRS, TOTALS
+from blackjack.source.hand_states import TRANSITIONS, TWO_CARD_21
 from blackjack.stats import StatsCategory
 from blackjack.table import Table
 
 
-def get_count(table: Table, shoe: Shoe) -> dict[CardCounter, float | int]:
+# stats tallied by play_infinite_shoe, in the order of their positions in a player's tally
+_TALLIED_CATEGORIES = (
+    StatsCategory.TOTAL_ROUNDS_PLAYED,
+    StatsCategory.TOTAL_HANDS_PLAYED,
+    StatsCategory.PLAYER_HANDS_WON,
+    StatsCategory.PLAYER_HANDS_LOST,
+    StatsCategory.PLAYER_HANDS_PUSHED,
+    StatsCategory.PLAYER_BLACKJACKS,
+    StatsCategory.DEALER_BLACKJACKS,
+    StatsCategory.PLAYER_DOUBLE_DOWNS,
+    StatsCategory.PLAYER_SURRENDERS,
+    StatsCategory.AMOUNT_BET,
+    StatsCategory.NET_WINNINGS
+)
+(
+    _ROUNDS_PLAYED,
+    _HANDS_PLAYED,
+    _HANDS_WON,
+    _HANDS_LOST,
+    _HANDS_PUSHED,
+    _PLAYER_BLACKJACKS,
+    _DEALER_BLACKJACKS,
+    _DOUBLE_DOWNS,
+    _SURRENDERS,
+    _AMOUNT_BET,
+    _NET_WINNINGS
+) = range(len(_TALLIED_CATEGORIES))
+
+# status of a hand played by play_infinite_shoe
+_IN_PLAY, _SHOWDOWN, _SETTLED = range(3)
+
+
+def _count(shoe: Shoe, card_counting_system: CardCountingSystem, deck_estimation: DeckEstimation) -> float | int:
+    # KO is an unbalanced system, so its running count is used rather than a true count
+    if card_counting_system == CardCountingSystem.KO:
+        return shoe.running_count(card_counting_system=card_counting_system)
+    return shoe.true_count(card_counting_system=card_counting_system, deck_estimation=deck_estimation)
+
+
+def get_count(
+    table: Table,
+    shoe: Shoe,
+    count_dict: dict[CardCounter, float | int] | None = None
+) -> dict[CardCounter, float | int]:
     """
     Gets the count for every player at the table before
-    bets are placed and stores it in a dictionary.
+    bets are placed and stores it in a dictionary, which is
+    `count_dict` cleared of the last round if given. The count
+    of each card counting system and deck estimation is only
+    computed once.
 
     """
-    count_dict = {}
+    if count_dict is None:
+        count_dict = {}
+    else:
+        count_dict.clear()
+    system_counts: dict[tuple[CardCountingSystem, DeckEstimation], float | int] = {}
     for player in table.players + table.observers:
         if isinstance(player, CardCounter):
-            card_counting_system = player.card_counting_system
-            count_dict[player] = (
-                shoe.running_count(card_counting_system=card_counting_system)
-                if card_counting_system == CardCountingSystem.KO
-                else shoe.true_count(card_counting_system=card_counting_system)
-            )
+            system = (player.card_counting_system, player.deck_estimation)
+            if system not in system_counts:
+                system_counts[system] = _count(shoe=shoe, card_counting_system=system[0], deck_estimation=system[1])
+            count_dict[player] = system_counts[system]
     return count_dict
 
 
-def get_insurance_count(players: list[Player], shoe: Shoe) -> dict[CardCounter, float | int]:
+def get_insurance_count(
+    players: list[Player],
+    shoe: Shoe,
+    insurance_count_dict: dict[CardCounter, float | int] | None = None
+) -> dict[CardCounter, float | int]:
     """
     Gets the count for every player at the table before
-    an insurance bet is made and stores it in a dictionary.
+    an insurance bet is made and stores it in a dictionary,
+    which is `insurance_count_dict` cleared of the last round
+    if given. The count of each card counting system and deck
+    estimation is only computed once.
 
     """
-    insurance_count_dict = {}
+    if insurance_count_dict is None:
+        insurance_count_dict = {}
+    else:
+        insurance_count_dict.clear()
+    system_counts: dict[tuple[CardCountingSystem, DeckEstimation], float | int] = {}
     for player in players:
         if isinstance(player, CardCounter) and player.insurance is not None:
-            card_counting_system = player.card_counting_system
-            insurance_count_dict[player] = (
-                shoe.running_count(card_counting_system=card_counting_system)
-                if card_counting_system == CardCountingSystem.KO
-                else shoe.true_count(card_counting_system=card_counting_system)
-            )
+            system = (player.card_counting_system, player.deck_estimation)
+            if system not in system_counts:
+                system_counts[system] = _count(shoe=shoe, card_counting_system=system[0], deck_estimation=system[1])
+            insurance_count_dict[player] = system_counts[system]
     return insurance_count_dict
 
 
@@ -65,13 +126,13 @@ def player_initial_decision(
     count: float | int | None,
     insurance_count: float | int | None,
     dealer_hand_is_blackjack: bool,
-    dealer_up_card: str,
+    dealer_up_card: int,
     rules: Rules,
-    playing_strategy: PlayingStrategy
-) -> str | None:
+    compiled_strategy: CompiledStrategy
+) -> int | None:
     """
-    Determines a player's initial decision based on the first two cards dealt
-    to them by the dealer.
+    Determines a player's initial action based on the first two cards dealt
+    to them by the dealer, as one of the actions of a compiled strategy.
 
     """
     first_hand = player.get_first_hand()
@@ -85,9 +146,10 @@ def player_initial_decision(
     half_bet = total_bet * 0.5
     player_hand_is_blackjack = first_hand.is_blackjack
 
+    # the rules are only read once the cards call for them
     if (
-        rules.insurance
-        and dealer_up_card == 'A'
+        dealer_up_card == ACE
+        and rules.insurance
         and isinstance(player, CardCounter)
         and player.insurance is not None
         and insurance_count is not None
@@ -143,14 +205,15 @@ def player_initial_decision(
         first_hand.status = HandStatus.SETTLED
         return
 
-    decision = player.decision(
+    action = player.action(
+        compiled_strategy=compiled_strategy,
         hand=first_hand,
         dealer_up_card=dealer_up_card,
-        max_hands=rules.max_hands,
-        playing_strategy=playing_strategy
+        max_hands=rules.max_hands
     )
 
-    if rules.late_surrender and decision in {'Rh', 'Rp', 'Rs'}:
+    # surrendering is only compiled into the strategy if late surrender is allowed
+    if action == SURRENDER:
         player.adjust_bankroll(amount=half_bet)
         player_stats[(count, StatsCategory.TOTAL_HANDS_PLAYED)] += 1
         player_stats[(count, StatsCategory.PLAYER_HANDS_LOST)] += 1
@@ -159,14 +222,14 @@ def player_initial_decision(
         first_hand.status = HandStatus.SETTLED
         return
 
-    return decision
+    return action
 
 
 def _finished_splitting_aces(hand: Hand, player: Player, rules: Rules) -> bool:
     """Determines if a player is finished splitting Aces."""
-    cards = hand.cards
-    return cards[0] == 'A' and (player.number_of_hands == rules.max_hands or \
-        not rules.resplit_aces or cards[1] != 'A')
+    cards = hand.card_codes
+    return cards[0] == ACE and (player.number_of_hands == rules.max_hands or \
+        not rules.resplit_aces or cards[1] != ACE)
 
 
 def player_plays_hands(
@@ -177,12 +240,12 @@ def player_plays_hands(
     count: float | int | None,
     insurance_count: float | int | None,
     dealer_hand_is_blackjack: bool,
-    dealer_up_card: str,
+    dealer_up_card: int,
     rules: Rules,
-    playing_strategy: PlayingStrategy
+    compiled_strategy: CompiledStrategy
 ) -> None:
     """Player plays out their hand(s)."""
-    decision = player_initial_decision(
+    action = player_initial_decision(
         player=player,
         player_stats=player_stats,
         placed_bet=placed_bet,
@@ -191,10 +254,10 @@ def player_plays_hands(
         dealer_hand_is_blackjack=dealer_hand_is_blackjack,
         dealer_up_card=dealer_up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
 
-    if decision is None:
+    if action is None:
         return
 
     hand_number = 0
@@ -211,32 +274,18 @@ def player_plays_hands(
             if _finished_splitting_aces(hand=hand, player=player, rules=rules):
                 hand.status = HandStatus.SHOWDOWN
 
-        # a sufficient bankroll check for the 'Rp' and 'P' decisions is performed in Player class
-        elif (
-            decision in {'Rp', 'P'}
-            or (decision == 'Ph'
-            and rules.double_after_split
-            and player.has_sufficient_bankroll(amount=total_bet * 3))
-        ):
+        # a sufficient bankroll check for splitting is performed in Player class,
+        # and the rules for doubling and splitting are resolved in the compiled strategy
+        elif action == SPLIT or (action == SPLIT_OR_HIT and player.has_sufficient_bankroll(amount=total_bet * 3)):
             player.adjust_bankroll(amount=-total_bet)
             player_stats[(count, StatsCategory.AMOUNT_BET)] += total_bet
-            player.hands.append(hand.split())
+            player.split_hand(hand=hand)
             hand.add_card(card=shoe.deal_card())
             another_hand += 1
             if _finished_splitting_aces(hand=hand, player=player, rules=rules):
                 hand.status = HandStatus.SHOWDOWN
 
-        elif (
-            decision in {'Dh', 'Ds'}
-            and number_of_cards == 2
-            and ((rules.double_down
-            and not (hand.is_split
-            or hand.was_split))
-            or (rules.double_after_split
-            and (hand.is_split
-            or hand.was_split)))
-            and player.has_sufficient_bankroll(amount=total_bet)
-        ):
+        elif (action == DOUBLE_OR_HIT or action == DOUBLE_OR_STAND) and player.has_sufficient_bankroll(amount=total_bet):
             player.adjust_bankroll(amount=-total_bet)
             player_stats[(count, StatsCategory.AMOUNT_BET)] += total_bet
             player_stats[(count, StatsCategory.PLAYER_DOUBLE_DOWNS)] += 1
@@ -244,7 +293,7 @@ def player_plays_hands(
             hand.add_to_total_bet(amount=total_bet)
             hand.status = HandStatus.SHOWDOWN
 
-        elif decision in {'Rh', 'Dh', 'Ph', 'H'}:
+        elif action == HIT or action == DOUBLE_OR_HIT or action == SPLIT_OR_HIT:
             hand.add_card(card=shoe.deal_card())
 
         else:
@@ -262,11 +311,11 @@ def player_plays_hands(
             hand.status = HandStatus.SETTLED
 
         if hand.status == HandStatus.IN_PLAY:
-            decision = player.decision(
+            action = player.action(
+                compiled_strategy=compiled_strategy,
                 hand=hand,
                 dealer_up_card=dealer_up_card,
-                max_hands=rules.max_hands,
-                playing_strategy=playing_strategy
+                max_hands=rules.max_hands
             )
         elif another_hand > 0:
             another_hand -= 1
@@ -286,8 +335,10 @@ def dealer_turn(players: list[Player]) -> bool:
 
 def dealer_plays_hand(shoe: Shoe, dealer: Dealer, s17: bool) -> None:
     """Dealer plays out their hand."""
-    while dealer.hand.total < 17 or (dealer.hand.total == 17 and dealer.hand.is_soft and not s17):
-        dealer.hand.add_card(card=shoe.deal_card())
+    hand = dealer.hand
+    stands = DEALER_STANDS[s17]
+    while not stands[hand.state]:
+        hand.add_card(card=shoe.deal_card())
 
 
 def compare_hands(
@@ -332,19 +383,50 @@ def clear_hands(dealer: Dealer, players: list[Player]) -> None:
         player.reset_hands()
 
 
+class RoundState:
+    """
+    Represents the containers a round of blackjack fills in as it is
+    played, i.e. the counts and bets of the players, which a simulation
+    keeps from one round to the next rather than allocating every round.
+
+    """
+    __slots__ = ('count_dict', 'insurance_count_dict', 'placed_bet_dict', 'players_and_observers')
+
+    def __init__(self):
+        self.count_dict: dict[CardCounter, float | int] = {}
+        self.insurance_count_dict: dict[CardCounter, float | int] = {}
+        self.placed_bet_dict: dict[Player, float | int] = {}
+        self.players_and_observers: list[Player] = []
+
+
 def play_round(
     table: Table,
     dealer: Dealer,
     rules: Rules,
     shoe: Shoe,
-    playing_strategy: PlayingStrategy
+    playing_strategy: PlayingStrategy | None = None,
+    compiled_strategy: CompiledStrategy | None = None,
+    round_state: RoundState | None = None
 ) -> None:
-    """Plays a round of blackjack between a dealer and players at a table."""
-    player_stats_dict = {}
-    placed_bet_dict = {}
-    count_dict = get_count(table=table, shoe=shoe)
+    """
+    Plays a round of blackjack between a dealer and players at a table,
+    following `compiled_strategy`, or `playing_strategy` compiled for the
+    rules if it is not given. A simulation compiles its strategy once and
+    passes the same `round_state` to every round.
 
-    players_and_observers = table.players + table.observers
+    """
+    if compiled_strategy is None:
+        compiled_strategy = playing_strategy.compile(rules=rules)
+    if round_state is None:
+        round_state = RoundState()
+    placed_bet_dict = round_state.placed_bet_dict
+    placed_bet_dict.clear()
+    count_dict = get_count(table=table, shoe=shoe, count_dict=round_state.count_dict)
+
+    # the table changes as players leave and back counters enter, so the players are copied
+    players_and_observers = round_state.players_and_observers
+    players_and_observers[:] = table.players
+    players_and_observers += table.observers
     for player in players_and_observers:
         count = count_dict.get(player, None)
 
@@ -365,9 +447,7 @@ def play_round(
                 table.remove_player(player=player)
                 continue
 
-        player_stats = player.stats.stats
-        player_stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
-        player_stats_dict[player] = player_stats
+        player.stats.stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
         placed_bet_dict[player] = placed_bet
 
     players = table.players
@@ -375,12 +455,16 @@ def play_round(
         initialize_hands(dealer=dealer, players=players, shoe=shoe)
         dealer_hand_is_blackjack = dealer.hand.is_blackjack
         dealer_up_card = dealer.up_card
-        insurance_count_dict = get_insurance_count(players=players, shoe=shoe)
+        insurance_count_dict = get_insurance_count(
+            players=players,
+            shoe=shoe,
+            insurance_count_dict=round_state.insurance_count_dict
+        )
 
         for player in players:
             player_plays_hands(
                 player=player,
-                player_stats=player_stats_dict[player],
+                player_stats=player.stats.stats,
                 placed_bet=placed_bet_dict[player],
                 shoe=shoe,
                 count=count_dict.get(player, None),
@@ -388,7 +472,7 @@ def play_round(
                 dealer_hand_is_blackjack=dealer_hand_is_blackjack,
                 dealer_up_card=dealer_up_card,
                 rules=rules,
-                playing_strategy=playing_strategy
+                compiled_strategy=compiled_strategy
             )
 
         if dealer_turn(players=players):
@@ -400,7 +484,7 @@ def play_round(
             for player in players:
                 compare_hands(
                     player=player,
-                    player_stats=player_stats_dict[player],
+                    player_stats=player.stats.stats,
                     count=count_dict.get(player, None),
                     dealer_hand_is_busted=dealer_hand_is_busted,
                     dealer_hand_total=dealer_hand_total
@@ -409,3 +493,205 @@ def play_round(
             shoe.add_to_seen_cards(card=dealer.hole_card)
 
         clear_hands(dealer=dealer, players=players)
+
+
+def play_infinite_shoe(
+    table: Table,
+    rules: Rules,
+    shoe: Shoe,
+    compiled_strategy: CompiledStrategy,
+    rounds_per_shoe: int | None,
+    reset_bankroll: bool,
+    lowest_bankrolls: list[float | int] | None = None
+) -> int:
+    """
+    Plays a shoe of `rounds_per_shoe` rounds between a dealer and players
+    who flat bet, dealt from a shoe that keeps no seen cards or cut card,
+    i.e. an InfiniteShoe, and returns the number of rounds played. Every
+    round plays out as it does in play_round, dealing the same cards, but
+    with nothing to count, no insurance for players who flat bet and no
+    cards to mark as seen, the hands are played from their states alone,
+    and the bankrolls and stats of the players are tallied for the shoe
+    and only written back to the players once it is over.
+
+    """
+    roster = table.roster
+    positions = {player: position for position, player in enumerate(roster)}
+    seats = [positions[player] for player in table.players]
+    bets = [player.placed_bet(count=None) for player in roster]
+    bankrolls = [player.bankroll for player in roster]
+    tallies = [[0] * len(_TALLIED_CATEGORIES) for _ in roster]
+
+    deal_card = shoe.deal_card
+    stands = DEALER_STANDS[rules.s17]
+    max_hands = rules.max_hands
+    resplit_aces = rules.resplit_aces
+    blackjack_payout = rules.blackjack_payout
+    # indexed by whether the hand is split, then whether it can be split
+    tables = [
+        [compiled_strategy.table(split=split, can_split=can_split) for can_split in (False, True)]
+        for split in (False, True)
+    ]
+    number_of_ranks = len(TRANSITIONS[EMPTY_HAND])
+    empty_hand = TRANSITIONS[EMPTY_HAND]
+
+    rounds_played = 0
+    while seats and rounds_played != rounds_per_shoe:
+        # players who cannot afford their bet leave the table for good
+        for position in [position for position in seats if bankrolls[position] < bets[position]]:
+            table.remove_player(player=roster[position])
+            seats.remove(position)
+        if not seats:
+            rounds_played += 1
+            break
+        for position in seats:
+            tallies[position][_ROUNDS_PLAYED] += 1
+
+        # every player is dealt a card, then the dealer their hole card, then
+        # every player a second card, and the dealer their up card
+        first_cards = [deal_card() for _ in seats]
+        hole_card = deal_card()
+        second_cards = [deal_card() for _ in seats]
+        dealer_up_card = deal_card()
+        dealer_state = TRANSITIONS[empty_hand[hole_card]][dealer_up_card]
+        dealer_hand_is_blackjack = TWO_CARD_21[dealer_state]
+
+        # the hands left to compare with the dealer's, as the player and the hand
+        showdown_hands = []
+        for position, first_card, second_card in zip(seats, first_cards, second_cards):
+            tally = tallies[position]
+            bet = bets[position]
+            bankrolls[position] -= bet
+            tally[_AMOUNT_BET] += bet
+            state = TRANSITIONS[empty_hand[first_card]][second_card]
+
+            if TWO_CARD_21[state]:
+                tally[_HANDS_PLAYED] += 1
+                tally[_PLAYER_BLACKJACKS] += 1
+                if dealer_hand_is_blackjack:
+                    bankrolls[position] += bet
+                    tally[_HANDS_PUSHED] += 1
+                    tally[_DEALER_BLACKJACKS] += 1
+                else:
+                    blackjack_winnings = bet * blackjack_payout
+                    bankrolls[position] += bet + blackjack_winnings
+                    tally[_HANDS_WON] += 1
+                    tally[_NET_WINNINGS] += blackjack_winnings
+                continue
+
+            if dealer_hand_is_blackjack:
+                tally[_HANDS_PLAYED] += 1
+                tally[_HANDS_LOST] += 1
+                tally[_DEALER_BLACKJACKS] += 1
+                tally[_NET_WINNINGS] -= bet
+                continue
+
+            can_split = PAIRS[state] is not None and max_hands > 1 and bet <= bankrolls[position]
+            action = tables[False][can_split][state * number_of_ranks + dealer_up_card]
+            if action == SURRENDER:
+                half_bet = bet * 0.5
+                bankrolls[position] += half_bet
+                tally[_HANDS_PLAYED] += 1
+                tally[_HANDS_LOST] += 1
+                tally[_SURRENDERS] += 1
+                tally[_NET_WINNINGS] -= half_bet
+                continue
+
+            # every hand is its state, total bet, first card and status, and is
+            # played as in player_plays_hands
+            hands = [[state, bet, first_card, _IN_PLAY]]
+            hand_number = 0
+            another_hand = 0
+            while True:
+                hand = hands[hand_number]
+                state, total_bet, first_card, _ = hand
+
+                if NUMBER_OF_CARDS[state] == 1:
+                    card = deal_card()
+                    state = hand[0] = TRANSITIONS[state][card]
+                    if first_card == ACE and (len(hands) == max_hands or not resplit_aces or card != ACE):
+                        hand[3] = _SHOWDOWN
+
+                elif action == SPLIT or (action == SPLIT_OR_HIT and total_bet * 3 <= bankrolls[position]):
+                    bankrolls[position] -= total_bet
+                    tally[_AMOUNT_BET] += total_bet
+                    hands.append([empty_hand[PAIRS[state]], total_bet, PAIRS[state], _IN_PLAY])
+                    card = deal_card()
+                    state = hand[0] = TRANSITIONS[empty_hand[first_card]][card]
+                    another_hand += 1
+                    if first_card == ACE and (len(hands) == max_hands or not resplit_aces or card != ACE):
+                        hand[3] = _SHOWDOWN
+
+                elif (action == DOUBLE_OR_HIT or action == DOUBLE_OR_STAND) and total_bet <= bankrolls[position]:
+                    bankrolls[position] -= total_bet
+                    tally[_AMOUNT_BET] += total_bet
+                    tally[_DOUBLE_DOWNS] += 1
+                    state = hand[0] = TRANSITIONS[state][deal_card()]
+                    hand[1] = total_bet * 2
+                    hand[3] = _SHOWDOWN
+
+                elif action == HIT or action == DOUBLE_OR_HIT or action == SPLIT_OR_HIT:
+                    state = hand[0] = TRANSITIONS[state][deal_card()]
+
+                else:
+                    hand[3] = _SHOWDOWN
+                    if another_hand > 0:
+                        another_hand -= 1
+                        hand_number += 1
+                        continue
+                    break
+
+                if BUSTED[state]:
+                    tally[_HANDS_PLAYED] += 1
+                    tally[_HANDS_LOST] += 1
+                    tally[_NET_WINNINGS] -= total_bet
+                    hand[3] = _SETTLED
+
+                if hand[3] == _IN_PLAY:
+                    can_split = PAIRS[state] is not None and len(hands) < max_hands and hand[1] <= bankrolls[position]
+                    action = tables[len(hands) > 1][can_split][state * number_of_ranks + dealer_up_card]
+                elif another_hand > 0:
+                    another_hand -= 1
+                    hand_number += 1
+                else:
+                    break
+
+            showdown_hands.extend((position, hand) for hand in hands if hand[3] == _SHOWDOWN)
+
+        if showdown_hands:
+            while not stands[dealer_state]:
+                dealer_state = TRANSITIONS[dealer_state][deal_card()]
+            dealer_hand_is_busted = BUSTED[dealer_state]
+            dealer_hand_total = TOTALS[dealer_state]
+
+            for position, (state, total_bet, _, _) in showdown_hands:
+                tally = tallies[position]
+                total = TOTALS[state]
+                if dealer_hand_is_busted or total > dealer_hand_total:
+                    bankrolls[position] += total_bet * 2
+                    tally[_HANDS_WON] += 1
+                    tally[_NET_WINNINGS] += total_bet
+                elif total == dealer_hand_total:
+                    bankrolls[position] += total_bet
+                    tally[_HANDS_PUSHED] += 1
+                else:
+                    tally[_HANDS_LOST] += 1
+                    tally[_NET_WINNINGS] -= total_bet
+                tally[_HANDS_PLAYED] += 1
+
+        rounds_played += 1
+        if reset_bankroll:
+            for position in seats:
+                bankrolls[position] = roster[position].initial_bankroll
+        if lowest_bankrolls is not None:
+            for position, bankroll in enumerate(bankrolls):
+                if bankroll < lowest_bankrolls[position]:
+                    lowest_bankrolls[position] = bankroll
+
+    for player, bankroll, tally in zip(roster, bankrolls, tallies):
+        player.adjust_bankroll(amount=bankroll - player.bankroll)
+        player_stats = player.stats.stats
+        for category, value in zip(_TALLIED_CATEGORIES, tally):
+            if value:
+                player_stats[(None, category)] += value
+    return rounds_played
@@ -1,29 +1,21 @@
 from __future__ import annotations
+from blackjack.cards import CARD_CODES, RANKS
 from blackjack.enums import HandStatus
-
-
-HARD_CARD_VALUE = {
-     '2': 2,
-     '3': 3,
-     '4': 4,
-     '5': 5,
-     '6': 6,
-     '7': 7,
-     '8': 8,
-     '9': 9,
-     '10': 10,
-     'J': 10,
-     'Q': 10,
-     'K': 10,
-     'A': 1
-}
+from blackjack.source.hand_states import BUSTED, EMPTY_HAND, PAIRS, SOFT, TOTALS, TRANSITIONS, TWO_CARD_21
 
 
 class Hand:
     """
-    Represents a single blackjack hand.
+    Represents a single blackjack hand. Its total, softness, pair and
+    whether it is busted are read from tables for the hand's state, which
+    moves along a precomputed transition table as every card is added.
+    A hand can be reset and dealt again rather than allocating a new one.
+    Cards are kept as their codes in blackjack.cards; the ranks of cards
+    given as strings, such as 'K', are only kept once one is added.
 
     """
+    __slots__ = ('_cards', '_was_split', '_is_split', '_status', '_total_bet', '_state', '_faces')
+
     def __init__(self, was_split: bool = False):
         """
         Parameters
@@ -32,26 +24,38 @@ class Hand:
             True if the previous hand was split, False otherwise
 
         """
-        self._cards: list[str] = []
+        self._cards: list[int] = []
         self._was_split = was_split
         self._is_split = False
         self._status = HandStatus.IN_PLAY
         self._total_bet: float | int = 0
-        self._total_cache: int | None = None
-        self._hard_total_cache: int | None = None
-        self._is_soft_cache: bool | None = None
-        self._is_blackjack_cache: bool | None = None
+        self._state = EMPTY_HAND
+        self._faces: list[str] | None = None
 
-    def _invalidate_cache(self):
-        self._total_cache = None
-        self._hard_total_cache = None
-        self._is_soft_cache = None
-        self._is_blackjack_cache = None
+    def reset(self, was_split: bool = False) -> None:
+        """Empties the hand in place, ready to be dealt again."""
+        self._cards.clear()
+        self._was_split = was_split
+        self._is_split = False
+        self._status = HandStatus.IN_PLAY
+        self._total_bet = 0
+        self._state = EMPTY_HAND
+        self._faces = None
 
     @property
     def cards(self) -> list[str]:
+        if self._faces is not None:
+            return list(self._faces)
+        return [RANKS[card] for card in self._cards]
+
+    @property
+    def card_codes(self) -> list[int]:
         return self._cards
 
+    @property
+    def state(self) -> int:
+        return self._state
+
     @property
     def status(self) -> HandStatus:
         return self._status
@@ -67,41 +71,53 @@ class Hand:
     def add_to_total_bet(self, amount: float | int) -> None:
         self._total_bet += amount
 
-    def add_card(self, card: str) -> None:
+    def add_card(self, card: int | str) -> None:
+        # cards are dealt as codes, but may be given as strings such as 'K'
+        if isinstance(card, str):
+            if self._faces is None:
+                self._faces = [RANKS[code] for code in self._cards]
+            self._faces.append(card)
+            card = CARD_CODES[card]
+        elif self._faces is not None:
+            self._faces.append(RANKS[card])
         self._cards.append(card)
-        self._invalidate_cache()
+        self._state = TRANSITIONS[self._state][card]
 
     @property
     def number_of_cards(self) -> int:
         return len(self._cards)
 
-    def _calculate_hard_total(self) -> int:
-        if self._hard_total_cache is None:
-            self._hard_total_cache = sum(HARD_CARD_VALUE[card] for card in self._cards)
-        return self._hard_total_cache
-
     @property
     def total(self) -> int:
-        if self._total_cache is None:
-            hard_total = self._calculate_hard_total()
-            self._total_cache = hard_total + 10 if 'A' in self._cards and hard_total < 12 else hard_total
-        return self._total_cache
+        return TOTALS[self._state]
 
     @property
     def is_soft(self) -> bool:
-        if self._is_soft_cache is None:
-            hard_total = self._calculate_hard_total()
-            self._is_soft_cache = 'A' in self._cards and hard_total < 12
-        return self._is_soft_cache
+        return SOFT[self._state]
 
     @property
     def is_busted(self) -> bool:
-        return self.total > 21
+        return BUSTED[self._state]
+
+    @property
+    def pair_card(self) -> int | None:
+        """Code of the paired card if the hand is a pair of two cards, otherwise None."""
+        return PAIRS[self._state]
 
-    def split(self) -> Hand:
+    def split(self, new_hand: Hand | None = None) -> Hand:
+        """Moves the second card of the hand to a new hand, or to `new_hand` after emptying it, and returns it."""
         self._is_split = True
-        new_hand = Hand(was_split=True)
-        new_hand.add_card(card=self._cards.pop())
+        card = self._cards.pop()
+        if self._faces is not None:
+            card = self._faces.pop()
+        self._state = EMPTY_HAND
+        for remaining_card in self._cards:
+            self._state = TRANSITIONS[self._state][remaining_card]
+        if new_hand is None:
+            new_hand = Hand(was_split=True)
+        else:
+            new_hand.reset(was_split=True)
+        new_hand.add_card(card=card)
         new_hand.add_to_total_bet(amount=self._total_bet)
         return new_hand
 
@@ -115,7 +131,4 @@ class Hand:
 
     @property
     def is_blackjack(self) -> bool:
-        if self._is_blackjack_cache is None:
-            self._is_blackjack_cache = len(self._cards) == 2 and self.total == 21 and \
-                not self._was_split and not self._is_split
-        return self._is_blackjack_cache
+        return TWO_CARD_21[self._state] and not self._was_split and not self._is_split
@@ -1,6 +1,7 @@
 from typing import Any
+from blackjack.cards import RANKS
 from blackjack.hand import Hand
-from blackjack.playing_strategy import PlayingStrategy
+from blackjack.playing_strategy import CompiledStrategy, PlayingStrategy
 from blackjack.stats import Stats
 
 
@@ -10,6 +11,8 @@ class Player:
     table that bets a flat amount.
 
     """
+    __slots__ = ('_name', '_bankroll', '_initial_bankroll', '_min_bet', '_hands', '_spare_hands', '_stats')
+
     def __init__(self, name: str, bankroll: float | int, min_bet: float | int):
         """
         Parameters
@@ -30,6 +33,8 @@ class Player:
         self._initial_bankroll = bankroll
         self._min_bet = min_bet
         self._hands = [Hand()]
+        # hands left over from splits in earlier rounds, which are reused for later splits
+        self._spare_hands: list[Hand] = []
         self._stats = Stats()
 
     @property
@@ -40,6 +45,14 @@ class Player:
     def bankroll(self) -> float | int:
         return self._bankroll
 
+    @property
+    def initial_bankroll(self) -> float | int:
+        return self._initial_bankroll
+
+    @property
+    def definition(self) -> dict[str, Any]:
+        return {'name': self._name, 'bankroll': self._initial_bankroll, 'min_bet': self._min_bet}
+
     def placed_bet(self, **kwargs: Any) -> float | int:
         return self._min_bet
 
@@ -65,18 +78,34 @@ class Player:
         return amount <= self._bankroll
 
     def _is_split_allowed(self, hand: Hand, max_hands: int) -> bool:
-        return hand.number_of_cards == 2 and (hand.cards[0] == hand.cards[1]) and \
-            len(self._hands) < max_hands and self.has_sufficient_bankroll(amount=hand.total_bet)
+        return hand.pair_card is not None and len(self._hands) < max_hands and \
+            self.has_sufficient_bankroll(amount=hand.total_bet)
 
     def decision(self, playing_strategy: PlayingStrategy, hand: Hand, dealer_up_card: str, max_hands: int) -> str:
         if self._is_split_allowed(hand=hand, max_hands=max_hands):
-            return playing_strategy.pair(card=hand.cards[0], dealer_up_card=dealer_up_card)
+            return playing_strategy.pair(card=RANKS[hand.pair_card], dealer_up_card=dealer_up_card)
         if hand.is_soft:
             return playing_strategy.soft(total=hand.total, dealer_up_card=dealer_up_card)
         return playing_strategy.hard(total=hand.total, dealer_up_card=dealer_up_card)
 
+    def split_hand(self, hand: Hand) -> None:
+        """Splits one of the player's hands, dealing the new hand into a spare hand if there is one."""
+        self._hands.append(hand.split(new_hand=self._spare_hands.pop() if self._spare_hands else None))
+
+    def action(self, compiled_strategy: CompiledStrategy, hand: Hand, dealer_up_card: int, max_hands: int) -> int:
+        return compiled_strategy.action(
+            hand_state=hand.state,
+            dealer_up_card=dealer_up_card,
+            split=hand.is_split or hand.was_split,
+            can_split=self._is_split_allowed(hand=hand, max_hands=max_hands)
+        )
+
     def reset_hands(self) -> None:
-        self._hands = [Hand()]
+        hands = self._hands
+        if len(hands) > 1:
+            self._spare_hands.extend(hands[1:])
+            del hands[1:]
+        hands[0].reset()
 
     def reset_bankroll(self) -> None:
         self._bankroll = self._initial_bankroll
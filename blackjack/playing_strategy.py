@@ -1,36 +1,290 @@
-from blackjack.source.basic_strategy import H17_HARD_DICT, H17_SOFT_DICT, H17_PAIR_DICT
-from blackjack.source.basic_strategy import S17_HARD_DICT, S17_SOFT_DICT, S17_PAIR_DICT
+from __future__ import annotations
+import csv
+import functools
+import hashlib
+import io
+import json
+import os
+from blackjack.cards import CARD_CODES, RANKS
+from blackjack.rules import Rules
+from blackjack.source.basic_strategy import H17_HARD_TABLE, H17_SOFT_TABLE, H17_PAIR_TABLE
+from blackjack.source.basic_strategy import S17_HARD_TABLE, S17_SOFT_TABLE, S17_PAIR_TABLE
+from blackjack.source.hand_states import BUSTED, PAIRS, SOFT, STATES, TOTALS
+
+
+# actions of a compiled strategy, in which every fallback that depends on the rules is resolved
+# the fallbacks that depend on the player's bankroll are left to the moment the action is taken
+HIT = 0
+STAND = 1
+DOUBLE_OR_HIT = 2
+DOUBLE_OR_STAND = 3
+SPLIT = 4
+# splits if the bankroll also covers doubling both hands after the split, otherwise hits
+SPLIT_OR_HIT = 5
+SURRENDER = 6
+
+# decisions a strategy file may use in each of its tables, as in blackjack.source.basic_strategy
+TOTAL_DECISIONS = frozenset({'H', 'S', 'Dh', 'Ds', 'Rh', 'Rs'})
+PAIR_DECISIONS = TOTAL_DECISIONS | {'P', 'Ph', 'Rp'}
+
+# rows of each table in a strategy file: the hard or soft totals, or the rank of the paired cards
+STRATEGY_ROWS = {
+    'hard': [str(total) for total in range(4, 22)],
+    'soft': [str(total) for total in range(12, 22)],
+    'pair': list(RANKS)
+}
 
 
 class PlayingStrategy:
     """
     Represents the decisions a player will make when faced with a
     pair split situation or a certain soft or hard count. Assumes the
-    use of basic strategy.
+    use of basic strategy. Cards are given by their ranks, such as 'K',
+    and looked up in the strategy tables by their codes in blackjack.cards.
 
     """
-    def __init__(self, s17: bool):
+    def __init__(
+        self,
+        s17: bool,
+        hard_table: list[list[str] | None] | None = None,
+        soft_table: list[list[str] | None] | None = None,
+        pair_table: list[list[str]] | None = None,
+        digest: str | None = None
+    ):
         """
         Parameters
         ----------
         s17
             True if dealer stands on a soft 17, False otherwise
+        hard_table
+            Decisions for hard totals, indexed by the total and then the code
+            of the dealer's up card, in place of basic strategy's
+        soft_table
+            Decisions for soft totals, indexed like `hard_table`, in place
+            of basic strategy's
+        pair_table
+            Decisions for pairs, indexed by the code of the paired card and
+            then the code of the dealer's up card, in place of basic strategy's
+        digest
+            SHA-256 hash of the file the strategy was loaded from, if any
 
         """
         if s17:
-            self._hard_dict = S17_HARD_DICT
-            self._soft_dict = S17_SOFT_DICT
-            self._pair_dict = S17_PAIR_DICT
+            self._hard_table = S17_HARD_TABLE
+            self._soft_table = S17_SOFT_TABLE
+            self._pair_table = S17_PAIR_TABLE
         else:
-            self._hard_dict = H17_HARD_DICT
-            self._soft_dict = H17_SOFT_DICT
-            self._pair_dict = H17_PAIR_DICT
+            self._hard_table = H17_HARD_TABLE
+            self._soft_table = H17_SOFT_TABLE
+            self._pair_table = H17_PAIR_TABLE
+        if hard_table is not None:
+            self._hard_table = hard_table
+        if soft_table is not None:
+            self._soft_table = soft_table
+        if pair_table is not None:
+            self._pair_table = pair_table
+        self._digest = digest
+        self._compiled_strategies: dict[tuple[bool, bool, bool], CompiledStrategy] = {}
+
+    @property
+    def digest(self) -> str | None:
+        return self._digest
 
     def hard(self, total: int, dealer_up_card: str) -> str:
-        return self._hard_dict[total][dealer_up_card]
+        return self._hard(total=total, dealer_up_card=CARD_CODES[dealer_up_card])
 
     def soft(self, total: int, dealer_up_card: str) -> str:
-        return self._soft_dict[total][dealer_up_card]
+        return self._soft(total=total, dealer_up_card=CARD_CODES[dealer_up_card])
 
     def pair(self, card: str, dealer_up_card: str) -> str:
-        return self._pair_dict[card][dealer_up_card]
+        return self._pair(card=CARD_CODES[card], dealer_up_card=CARD_CODES[dealer_up_card])
+
+    # the same lookups by card code, for callers that already hold codes
+    def _hard(self, total: int, dealer_up_card: int) -> str:
+        return self._hard_table[total][dealer_up_card]
+
+    def _soft(self, total: int, dealer_up_card: int) -> str:
+        return self._soft_table[total][dealer_up_card]
+
+    def _pair(self, card: int, dealer_up_card: int) -> str:
+        return self._pair_table[card][dealer_up_card]
+
+    def compile(self, rules: Rules) -> CompiledStrategy:
+        """
+        Returns the strategy compiled for the rules, which is only compiled
+        the first time for the rules that the compiled tables depend on.
+
+        """
+        key = (rules.double_down, rules.double_after_split, rules.late_surrender)
+        compiled_strategy = self._compiled_strategies.get(key)
+        if compiled_strategy is None:
+            compiled_strategy = self._compiled_strategies[key] = CompiledStrategy(playing_strategy=self, rules=rules)
+        return compiled_strategy
+
+
+class CompiledStrategy:
+    """
+    Represents a playing strategy compiled for the rules at a table into
+    flat tables of actions, indexed by the state of a hand (see
+    blackjack.source.hand_states) times the number of ranks plus the code
+    of the dealer's up card. There is one table for hands that have not
+    been split and one for hands that have, each in two versions: for
+    when the player can split the hand and for when they cannot.
+
+    """
+    def __init__(self, playing_strategy: PlayingStrategy, rules: Rules):
+        """
+        Parameters
+        ----------
+        playing_strategy
+            Strategy whose decisions are compiled
+        rules
+            Rules at the table, which decide what each decision falls back to
+
+        """
+        self._tables = [
+            [
+                self._compile(playing_strategy=playing_strategy, rules=rules, split=split, can_split=can_split)
+                for can_split in (False, True)
+            ]
+            for split in (False, True)
+        ]
+
+    @staticmethod
+    def _compile(playing_strategy: PlayingStrategy, rules: Rules, split: bool, can_split: bool) -> list[int]:
+        # a hand that has not been split only has two cards when the player first
+        # decides, which is the only time they may surrender
+        can_double = rules.double_after_split if split else rules.double_down
+        actions = {
+            'H': HIT,
+            'S': STAND,
+            'P': SPLIT,
+            'Ph': SPLIT_OR_HIT if rules.double_after_split else HIT,
+            'Rp': SURRENDER if rules.late_surrender and not split else SPLIT
+        }
+        table = []
+        for state, (_, _, number_of_cards, _) in enumerate(STATES):
+            for dealer_up_card in range(len(RANKS)):
+                total = TOTALS[state]
+                if number_of_cards < 2 or BUSTED[state]:
+                    # no decision is made for these hands
+                    table.append(STAND)
+                    continue
+                if can_split and PAIRS[state] is not None:
+                    decision = playing_strategy._pair(card=PAIRS[state], dealer_up_card=dealer_up_card)
+                elif SOFT[state]:
+                    decision = playing_strategy._soft(total=total, dealer_up_card=dealer_up_card)
+                else:
+                    decision = playing_strategy._hard(total=total, dealer_up_card=dealer_up_card)
+
+                if decision in {'Dh', 'Ds'}:
+                    if number_of_cards == 2 and can_double:
+                        table.append(DOUBLE_OR_HIT if decision == 'Dh' else DOUBLE_OR_STAND)
+                    else:
+                        table.append(HIT if decision == 'Dh' else STAND)
+                elif decision in {'Rh', 'Rs'}:
+                    if number_of_cards == 2 and rules.late_surrender and not split:
+                        table.append(SURRENDER)
+                    else:
+                        table.append(HIT if decision == 'Rh' else STAND)
+                else:
+                    table.append(actions[decision])
+        return table
+
+    def table(self, split: bool, can_split: bool) -> list[int]:
+        """Returns the flat table of actions that `action` reads for hands that are `split` and `can_split`."""
+        return self._tables[split][can_split]
+
+    def action(self, hand_state: int, dealer_up_card: int, split: bool, can_split: bool) -> int:
+        """
+        Returns the action for a hand in the given state, where `split` is True
+        if the hand is part of a split and `can_split` if the player can split it.
+
+        """
+        return self._tables[split][can_split][hand_state * len(RANKS) + dealer_up_card]
+
+
+def _read_csv(contents: str) -> dict[str, dict[str, list[str]]]:
+    # a header of table, hand and the dealer's up cards, then a row of decisions for every hand
+    rows = [[value.strip() for value in row] for row in csv.reader(io.StringIO(contents)) if row]
+    if not rows or rows[0] != ['table', 'hand', *RANKS]:
+        raise ValueError(f'Strategy CSV must start with the header table,hand,{",".join(RANKS)}.')
+    tables: dict[str, dict[str, list[str]]] = {}
+    for row in rows[1:]:
+        if len(row) < 2:
+            raise ValueError('Every row of a strategy CSV must name its table and hand.')
+        table, hand, *decisions = row
+        if hand in tables.setdefault(table, {}):
+            raise ValueError(f'Strategy lists {table} {hand} more than once.')
+        tables[table][hand] = decisions
+    return tables
+
+
+def _build_table(tables: dict, table: str, decisions: frozenset[str]) -> list[list[str] | None]:
+    rows = tables.get(table)
+    if not isinstance(rows, dict):
+        raise ValueError(f'Strategy must include a {table} table.')
+    unknown = set(rows) - set(STRATEGY_ROWS[table])
+    if unknown:
+        raise ValueError(f'Strategy {table} table has unknown rows {", ".join(sorted(unknown))}.')
+    built: list[list[str] | None] = []
+    for hand in STRATEGY_ROWS[table]:
+        row = rows.get(hand)
+        if row is None:
+            raise ValueError(f'Strategy {table} table is missing a row for {hand}.')
+        if not isinstance(row, list) or len(row) != len(RANKS):
+            raise ValueError(f'Strategy {table} {hand} must have a decision for each of {", ".join(RANKS)}.')
+        for decision in row:
+            if not isinstance(decision, str) or decision not in decisions:
+                raise ValueError(f'Strategy {table} {hand} has unknown decision {decision!r}.')
+        built.append(list(row))
+    return built
+
+
+def load_playing_strategy(path: str | os.PathLike) -> PlayingStrategy:
+    """
+    Loads a playing strategy from a CSV file, or a JSON file if its name
+    ends in .json, using the decisions of blackjack.source.basic_strategy.
+
+    A CSV file starts with the header table,hand,2,3,4,5,6,7,8,9,10,A
+    followed by one row for every hand, e.g. hard,16,S,S,S,S,S,H,H,Rh,Rh,Rh.
+    A JSON file maps each table to its rows, e.g. {"hard": {"16": [...]}}.
+    Every file includes a hard table for the totals 4 to 21, a soft table
+    for 12 to 21 and a pair table for each rank, with a decision for every
+    up card. The strategies of the files loaded most recently are kept,
+    so loading a file with the same contents again returns its strategy.
+
+    """
+    with open(path, 'rb') as file:
+        contents = file.read()
+    playing_strategy = _parse_playing_strategy(contents=contents, json_file=os.fspath(path).endswith('.json'))
+    if playing_strategy is None:
+        raise ValueError(f'{os.fspath(path)} is not a strategy file.')
+    return playing_strategy
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_playing_strategy(contents: bytes, json_file: bool) -> PlayingStrategy | None:
+    # None if the contents cannot be read as a strategy file at all
+    try:
+        text = contents.decode()
+        tables = json.loads(text) if json_file else _read_csv(contents=text)
+    except (UnicodeDecodeError, json.JSONDecodeError, csv.Error):
+        return None
+    if not isinstance(tables, dict):
+        return None
+    unknown = set(tables) - set(STRATEGY_ROWS)
+    if unknown:
+        raise ValueError(f'Strategy has unknown tables {", ".join(sorted(unknown))}.')
+
+    hard = _build_table(tables=tables, table='hard', decisions=TOTAL_DECISIONS)
+    soft = _build_table(tables=tables, table='soft', decisions=TOTAL_DECISIONS)
+    pair = _build_table(tables=tables, table='pair', decisions=PAIR_DECISIONS)
+    # indexed like the tables of basic strategy, by the total or the code of the paired card
+    return PlayingStrategy(
+        s17=True,
+        hard_table=[None] * 4 + hard,
+        soft_table=[None] * 12 + soft,
+        pair_table=pair,
+        digest=hashlib.sha256(contents).hexdigest()
+    )
@@ -0,0 +1,222 @@
+import random
+from abc import ABC, abstractmethod
+from collections.abc import MutableSequence, Sequence
+from typing import Any
+from typing_extensions import override
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # NumPy is an optional dependency
+    np = None
+
+
+_MASK_64 = (1 << 64) - 1
+
+
+class RandomGenerator(ABC):
+    """
+    Represents a source of random numbers used to shuffle and
+    draw cards, whose state can be saved and restored.
+
+    """
+    @abstractmethod
+    def seed(self, seed: int | None = None) -> None:
+        """Re-seeds the generator, from fresh entropy if no seed is given."""
+
+    @abstractmethod
+    def random(self) -> float:
+        """Returns a float in the interval [0, 1)."""
+
+    @abstractmethod
+    def integers_below(self, bounds: Sequence[int]) -> list[int]:
+        """Returns one integer in the interval [0, bound) for every bound, in order."""
+
+    @abstractmethod
+    def get_state(self) -> Any:
+        """Returns the state of the generator, which can be pickled."""
+
+    @abstractmethod
+    def set_state(self, state: Any) -> None:
+        """Restores a state returned by get_state."""
+
+    def swaps(self, start: int, stop: int) -> list[int]:
+        """
+        Returns the positions that the steps of a Fisher-Yates shuffle from
+        position `start` down to, but excluding, position `stop` swap with.
+
+        """
+        return self.integers_below(bounds=range(start + 1, stop + 1, -1))
+
+    def shuffle(self, cards: MutableSequence) -> None:
+        """Shuffles the cards in place with a Fisher-Yates shuffle from the end of the sequence."""
+        for i, j in zip(range(len(cards) - 1, 0, -1), self.swaps(start=len(cards) - 1, stop=0)):
+            cards[i], cards[j] = cards[j], cards[i]
+
+
+class StdlibGenerator(RandomGenerator):
+    """
+    Represents a generator backed by the Mersenne Twister of the
+    standard library's random module. Shuffles are the same as those
+    of random.shuffle with the same seed.
+
+    """
+    def __init__(self, seed: int | None = None):
+        """
+        Parameters
+        ----------
+        seed
+            Seed of the generator
+
+        """
+        self._random = random.Random(seed)
+
+    @override
+    def seed(self, seed: int | None = None) -> None:
+        self._random.seed(seed)
+
+    @override
+    def random(self) -> float:
+        return self._random.random()
+
+    @override
+    def integers_below(self, bounds: Sequence[int]) -> list[int]:
+        # the same random numbers random.shuffle draws for each step
+        randbelow = self._random._randbelow
+        return [randbelow(bound) for bound in bounds]
+
+    @override
+    def shuffle(self, cards: MutableSequence) -> None:
+        self._random.shuffle(cards)
+
+    @override
+    def get_state(self) -> Any:
+        return self._random.getstate()
+
+    @override
+    def set_state(self, state: Any) -> None:
+        self._random.setstate(state)
+
+
+class NumPyGenerator(RandomGenerator):
+    """
+    Represents a generator backed by one of NumPy's bit generators, i.e.
+    PCG64 or Philox, which draws the integers of a shuffle all at once.
+
+    """
+    def __init__(self, seed: int | None = None, bit_generator: str = 'PCG64'):
+        """
+        Parameters
+        ----------
+        seed
+            Seed of the generator
+        bit_generator
+            Name of the NumPy bit generator, i.e. 'PCG64' or 'Philox'
+
+        """
+        if np is None:
+            raise ModuleNotFoundError('NumPyGenerator requires NumPy, which can be installed with `pip install numpy`.')
+        if bit_generator not in ('PCG64', 'Philox'):
+            raise ValueError('Bit generator must be one of PCG64, Philox.')
+
+        self._bit_generator = bit_generator
+        self.seed(seed=seed)
+
+    @property
+    def bit_generator(self) -> str:
+        return self._bit_generator
+
+    @override
+    def seed(self, seed: int | None = None) -> None:
+        self._generator = np.random.Generator(getattr(np.random, self._bit_generator)(seed))
+
+    @override
+    def random(self) -> float:
+        return float(self._generator.random())
+
+    @override
+    def integers_below(self, bounds: Sequence[int]) -> list[int]:
+        if not len(bounds):
+            return []
+        return self._generator.integers(0, np.asarray(bounds)).tolist()
+
+    @override
+    def get_state(self) -> Any:
+        return self._generator.bit_generator.state
+
+    @override
+    def set_state(self, state: Any) -> None:
+        self._generator.bit_generator.state = state
+
+
+class CounterGenerator(RandomGenerator):
+    """
+    Represents a counter-based generator written in pure Python, whose
+    n-th number is a SplitMix64 hash of a key derived from the seed and
+    of n. Its state is just the key and the counter, so any position in
+    its stream can be reproduced on any machine.
+
+    """
+    def __init__(self, seed: int | None = None):
+        """
+        Parameters
+        ----------
+        seed
+            Seed of the generator
+
+        """
+        self.seed(seed=seed)
+
+    @staticmethod
+    def _mix(value: int) -> int:
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+        return value ^ (value >> 31)
+
+    def _next(self) -> int:
+        self._counter += 1
+        return self._mix(value=(self._key + self._counter * 0x9E3779B97F4A7C15) & _MASK_64)
+
+    @override
+    def seed(self, seed: int | None = None) -> None:
+        if seed is None:
+            seed = random.getrandbits(64)
+        self._key = self._mix(value=seed & _MASK_64)
+        self._counter = 0
+
+    @override
+    def random(self) -> float:
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    @override
+    def integers_below(self, bounds: Sequence[int]) -> list[int]:
+        integers = []
+        for bound in bounds:
+            # numbers past the largest multiple of the bound are rejected to avoid bias
+            limit = ((1 << 64) // bound) * bound
+            while (value := self._next()) >= limit:
+                pass
+            integers.append(value % bound)
+        return integers
+
+    @override
+    def get_state(self) -> Any:
+        return self._key, self._counter
+
+    @override
+    def set_state(self, state: Any) -> None:
+        self._key, self._counter = state
+
+
+GENERATORS = {
+    'stdlib': StdlibGenerator,
+    'pcg64': lambda seed=None: NumPyGenerator(seed=seed, bit_generator='PCG64'),
+    'philox': lambda seed=None: NumPyGenerator(seed=seed, bit_generator='Philox'),
+    'counter': CounterGenerator
+}
+
+
+def create_generator(name: str, seed: int | None = None) -> RandomGenerator:
+    """Creates a generator from its name, i.e. stdlib, pcg64, philox or counter."""
+    if name not in GENERATORS:
+        raise ValueError(f'Random generator must be one of {", ".join(GENERATORS)}.')
+    return GENERATORS[name](seed)
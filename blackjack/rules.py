@@ -3,6 +3,20 @@ class Rules:
     Represents the rules at a table.
 
     """
+    __slots__ = (
+        '_min_bet',
+        '_max_bet',
+        '_s17',
+        '_blackjack_payout',
+        '_max_hands',
+        '_double_down',
+        '_double_after_split',
+        '_resplit_aces',
+        '_insurance',
+        '_late_surrender',
+        '_dealer_shows_hole_card'
+    )
+
     def __init__(
         self,
         min_bet: float | int,
@@ -70,6 +84,22 @@ class Rules:
         self._late_surrender = late_surrender
         self._dealer_shows_hole_card = dealer_shows_hole_card
 
+    @property
+    def definition(self) -> dict[str, float | int | bool]:
+        return {
+            'min_bet': self._min_bet,
+            'max_bet': self._max_bet,
+            's17': self._s17,
+            'blackjack_payout': self._blackjack_payout,
+            'max_hands': self._max_hands,
+            'double_down': self._double_down,
+            'double_after_split': self._double_after_split,
+            'resplit_aces': self._resplit_aces,
+            'insurance': self._insurance,
+            'late_surrender': self._late_surrender,
+            'dealer_shows_hole_card': self._dealer_shows_hole_card
+        }
+
     @property
     def min_bet(self) -> float | int:
         return self._min_bet
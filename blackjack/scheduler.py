@@ -0,0 +1,88 @@
+from math import ceil
+
+
+class ShoeScheduler:
+    """
+    Represents the hand-out of shoe ranges to parallel workers using
+    guided scheduling. Ranges shrink as the simulation nears its end and
+    are sized from the measured number of shoes simulated per second, so
+    that no worker is left idle while another finishes a large range.
+
+    Shoes are always handed out in order and each shoe is tied to its
+    index, but a range starts from the bankrolls its caller assumes, so
+    the caller is responsible for checking those against the bankrolls
+    the ranges before it actually left.
+
+    """
+    def __init__(
+        self,
+        shoe_ranges: list[range],
+        workers: int,
+        target_seconds: float = 0.5,
+        initial_chunk_size: int = 1
+    ):
+        """
+        Parameters
+        ----------
+        shoe_ranges
+            Ranges of indices of the shoes to be simulated
+        workers
+            Number of workers simulating shoes at the same time
+        target_seconds
+            Number of seconds a worker should ideally spend on a single range
+        initial_chunk_size
+            Number of shoes in each range handed out before any
+            shoes per second have been measured
+
+        """
+        if workers < 1:
+            raise ValueError('Number of workers must be at least 1.')
+        if target_seconds <= 0:
+            raise ValueError('Target seconds must be greater than 0.')
+
+        self._shoe_ranges = [shoe_range for shoe_range in shoe_ranges if shoe_range]
+        self._remaining_shoes = sum(len(shoe_range) for shoe_range in self._shoe_ranges)
+        self._workers = workers
+        self._target_seconds = target_seconds
+        self._initial_chunk_size = max(1, initial_chunk_size)
+        self._shoes_measured = 0
+        self._seconds_measured = 0.0
+
+    @property
+    def remaining_shoes(self) -> int:
+        return self._remaining_shoes
+
+    @property
+    def remaining_ranges(self) -> list[range]:
+        return list(self._shoe_ranges)
+
+    @property
+    def shoes_per_second(self) -> float | None:
+        if not self._shoes_measured or self._seconds_measured <= 0:
+            return None
+        return self._shoes_measured / self._seconds_measured
+
+    def chunk_size(self) -> int:
+        # guided scheduling: never hand out more than a fraction of the remaining
+        # shoes, so that the last ranges are small enough to finish together
+        guided_size = ceil(self.remaining_shoes / (2 * self._workers))
+        shoes_per_second = self.shoes_per_second
+        if shoes_per_second is None:
+            return max(1, min(self._initial_chunk_size, guided_size))
+        return max(1, min(int(shoes_per_second * self._target_seconds), guided_size))
+
+    def next_range(self) -> range | None:
+        if not self._shoe_ranges:
+            return None
+        chunk_size = self.chunk_size()
+        shoe_range = self._shoe_ranges[0][:chunk_size]
+        self._shoe_ranges[0] = self._shoe_ranges[0][chunk_size:]
+        if not self._shoe_ranges[0]:
+            self._shoe_ranges.pop(0)
+        self._remaining_shoes -= len(shoe_range)
+        return shoe_range
+
+    def record(self, number_of_shoes: int, seconds: float) -> None:
+        """Records how long a worker took to simulate a range of shoes."""
+        self._shoes_measured += number_of_shoes
+        self._seconds_measured += seconds
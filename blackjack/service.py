@@ -0,0 +1,425 @@
+"""
+Local service that queues simulation jobs from several users and runs
+them on a shared, bounded pool of worker processes.
+
+    python -m blackjack.service --port 8000 --workers 4
+
+Jobs are submitted, inspected and cancelled over HTTP with JSON bodies:
+
+    POST   /jobs               submit a config, with an optional priority
+    GET    /jobs               every job
+    GET    /jobs/<id>          progress and stats of a job
+    GET    /jobs/<id>/events   progress and stats streamed as JSON lines
+    DELETE /jobs/<id>          cancel a job
+
+Configs submitted over HTTP cannot name files on the machine running the
+service, i.e. a shoe pool or playing strategy.
+
+"""
+import argparse
+import asyncio
+import functools
+import itertools
+import json
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Any, AsyncIterator
+from blackjack.blackjack import Blackjack, _play_shoes
+from blackjack.cache import simulation_key
+from blackjack.config import create_blackjack, simulation_parameters
+from blackjack.enums import JobStatus
+from blackjack.scheduler import ShoeScheduler
+
+
+# rules naming files on the machine running the service, which are not read for HTTP jobs
+_PATH_RULES = ('shoe_pool', 'playing_strategy')
+
+
+class _NotFound(Exception):
+    pass
+
+
+class SimulationJob:
+    """
+    Represents a simulation submitted to a SimulationService, along
+    with its progress and the stats accumulated so far.
+
+    """
+    def __init__(self, job_id: int, config: dict[str, Any], priority: int = 0):
+        """
+        Parameters
+        ----------
+        job_id
+            Number identifying the job within the service
+        config
+            Rules, players and simulation parameters of the job
+        priority
+            Jobs with a higher priority are run first
+
+        """
+        self._blackjack = create_blackjack(config=config)
+        parameters = simulation_parameters(config=config)
+        if parameters['penetration'] > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+        if parameters['infinite_deck']:
+            self._blackjack = self._blackjack._infinite_deck_copy()
+        self._blackjack._check_rounds_per_shoe(rounds_per_shoe=parameters['rounds_per_shoe'])
+
+        # identical jobs share a key, including jobs that leave the seed to the service
+        self._key = simulation_key(
+            rules=self._blackjack._rules,
+            players=self._blackjack.players,
+            penetration=parameters['penetration'],
+            shoe_size=parameters['shoe_size'],
+            seed=parameters['seed'],
+            reset_bankroll=parameters['reset_bankroll'],
+            first_shoe=parameters['first_shoe'],
+            rounds_per_shoe=parameters['rounds_per_shoe'],
+            shoe_type=self._blackjack.shoe_type,
+            random_generator=self._blackjack.random_generator,
+            shoe_pool=self._blackjack.shoe_pool.digest if self._blackjack.shoe_pool is not None else None,
+            playing_strategy=self._blackjack.playing_strategy.digest
+        ) + f":{parameters['number_of_shoes']}"
+
+        if parameters['seed'] is None:
+            parameters['seed'] = random.getrandbits(64)
+
+        self._id = job_id
+        self._priority = priority
+        self._parameters = parameters
+        self._status = JobStatus.QUEUED
+        self._shoes_simulated = 0
+        self._error: str | None = None
+        self._version = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    @property
+    def parameters(self) -> dict[str, Any]:
+        return self._parameters
+
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
+    @property
+    def shoes_simulated(self) -> int:
+        return self._shoes_simulated
+
+    @property
+    def done(self) -> bool:
+        return self._status in (JobStatus.COMPLETED, JobStatus.CANCELLED, JobStatus.FAILED)
+
+    @property
+    def blackjack(self) -> Blackjack:
+        return self._blackjack
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            'id': self._id,
+            'status': self._status.value,
+            'priority': self._priority,
+            'shoes_simulated': self._shoes_simulated,
+            'number_of_shoes': self._parameters['number_of_shoes'],
+            'seed': self._parameters['seed'],
+            'error': self._error,
+            'players': [
+                {'name': player.name, 'bankroll': player.bankroll, 'stats': player.stats.summary(string=False)}
+                for player in self._blackjack.players
+            ]
+        }
+
+    async def _update(self, status: JobStatus | None = None, error: str | None = None) -> None:
+        async with self._condition:
+            if status is not None:
+                self._status = status
+            if error is not None:
+                self._error = error
+            self._version += 1
+            self._condition.notify_all()
+
+    async def updates(self) -> AsyncIterator[dict[str, Any]]:
+        """Yields the summary of the job every time it changes, until the job is done."""
+        version = -1
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(lambda: self._version != version)
+                version = self._version
+                summary = self.summary()
+                done = self.done
+            yield summary
+            if done:
+                return
+
+
+class SimulationService:
+    """
+    Represents a local service that runs simulation jobs submitted by
+    several users on one bounded pool of worker processes. Jobs are run
+    in order of priority, then submission, and report their progress and
+    stats after every range of shoes. Submitting a job identical to one
+    that is queued or running returns the existing job instead.
+
+    """
+    def __init__(
+        self,
+        workers: int = 1,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        executor: Executor | None = None
+    ):
+        """
+        Parameters
+        ----------
+        workers
+            Number of jobs run at the same time, and the number of
+            worker processes in the pool
+        host
+            Host the service listens on
+        port
+            Port the service listens on, 0 picks a free port
+        executor
+            Executor jobs are run on, otherwise a pool of worker processes
+
+        """
+        if workers < 1:
+            raise ValueError('Number of workers must be at least 1.')
+
+        self._workers = workers
+        self._host = host
+        self._port = port
+        self._executor = executor
+        self._pool: Executor | None = None
+        self._jobs: dict[int, SimulationJob] = {}
+        self._sequence = itertools.count()
+        self._queue: asyncio.PriorityQueue[tuple[int, int, SimulationJob]] = asyncio.PriorityQueue()
+        self._runners: list[asyncio.Task] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        if self._server is None:
+            return self._host, self._port
+        return self._server.sockets[0].getsockname()[:2]
+
+    @property
+    def jobs(self) -> list[SimulationJob]:
+        return list(self._jobs.values())
+
+    def job(self, job_id: int) -> SimulationJob:
+        if job_id not in self._jobs:
+            raise KeyError(f'Job {job_id} does not exist.')
+        return self._jobs[job_id]
+
+    def submit(self, config: dict[str, Any], priority: int = 0) -> tuple[SimulationJob, bool]:
+        """
+        Queues a job and returns it, along with True if an identical job
+        was already queued or running and is returned instead.
+
+        """
+        # jobs are never removed, so ids only go to jobs that are queued
+        job = SimulationJob(job_id=len(self._jobs) + 1, config=config, priority=priority)
+        for existing_job in self._jobs.values():
+            if existing_job.key == job.key and not existing_job.done:
+                # a duplicate submitted with a higher priority moves the queued job up
+                if existing_job.status is JobStatus.QUEUED and priority > existing_job.priority:
+                    existing_job._priority = priority
+                    self._queue.put_nowait((-priority, next(self._sequence), existing_job))
+                return existing_job, True
+
+        self._jobs[job.id] = job
+        self._queue.put_nowait((-priority, next(self._sequence), job))
+        return job, False
+
+    async def cancel(self, job_id: int) -> SimulationJob:
+        """Cancels a job, which stops once the range of shoes it is simulating finishes."""
+        job = self.job(job_id=job_id)
+        if not job.done:
+            await job._update(status=JobStatus.CANCELLED)
+        return job
+
+    async def _run_job(self, job: SimulationJob) -> None:
+        loop = asyncio.get_running_loop()
+        parameters = job.parameters
+        first_shoe = parameters['first_shoe']
+        scheduler = ShoeScheduler(shoe_ranges=[range(first_shoe, first_shoe + parameters['number_of_shoes'])], workers=1)
+
+        while (shoe_range := scheduler.next_range()) is not None:
+            results, seconds = await loop.run_in_executor(self._pool, functools.partial(
+                _play_shoes,
+                blackjack=job.blackjack._clone(),
+                shoe_range=shoe_range,
+                penetration=parameters['penetration'],
+                shoe_size=parameters['shoe_size'],
+                seed=parameters['seed'],
+                reset_bankroll=parameters['reset_bankroll'],
+                rounds_per_shoe=parameters['rounds_per_shoe']
+            ))
+            if job.status is not JobStatus.RUNNING:
+                return
+
+            scheduler.record(number_of_shoes=len(shoe_range), seconds=seconds)
+            job.blackjack._merge(results=results)
+            job._shoes_simulated += len(shoe_range)
+            await job._update()
+
+        if parameters['reset_bankroll']:
+            for player in job.blackjack.players:
+                player.reset_bankroll()
+        await job._update(status=JobStatus.COMPLETED)
+
+    async def _run_jobs(self) -> None:
+        while True:
+            _, _, job = await self._queue.get()
+            # cancelled jobs and stale entries of re-prioritized jobs are skipped
+            if job.status is not JobStatus.QUEUED:
+                continue
+
+            await job._update(status=JobStatus.RUNNING)
+            try:
+                await self._run_job(job=job)
+            except Exception as e:
+                await job._update(status=JobStatus.FAILED, error=str(e))
+
+    async def _send(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        payload: Any,
+        content_type: str = 'application/json'
+    ) -> None:
+        body = json.dumps(payload).encode() if payload is not None else b''
+        headers = f'HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: {content_type}\r\nConnection: close\r\n'
+        if content_type == 'application/json':
+            headers += f'Content-Length: {len(body)}\r\n'
+        writer.write(f'{headers}\r\n'.encode() + body)
+        await writer.drain()
+
+    def _find_job(self, job_id: str) -> SimulationJob:
+        try:
+            return self.job(job_id=int(job_id))
+        except KeyError as e:
+            raise _NotFound(e.args[0]) from None
+
+    async def _respond(self, writer: asyncio.StreamWriter, method: str, path: str, body: bytes) -> None:
+        parts = path.strip('/').split('/')
+        if parts == ['jobs'] and method == 'POST':
+            payload = json.loads(body or b'{}')
+            if not isinstance(payload, dict):
+                raise ValueError('Job must be a JSON object.')
+            rules = payload.get('rules')
+            for rule in _PATH_RULES:
+                if isinstance(rules, dict) and rule in rules:
+                    raise ValueError(f'Jobs submitted over HTTP cannot set {rule}.')
+            priority = payload.pop('priority', 0)
+            try:
+                job, deduplicated = self.submit(config=payload, priority=priority)
+            except KeyError as e:
+                raise ValueError(f'Invalid config, missing {e.args[0]!r}.') from None
+            await self._send(
+                writer=writer,
+                status=HTTPStatus.OK if deduplicated else HTTPStatus.CREATED,
+                payload={**job.summary(), 'deduplicated': deduplicated}
+            )
+        elif parts == ['jobs'] and method == 'GET':
+            await self._send(writer=writer, status=HTTPStatus.OK, payload=[job.summary() for job in self.jobs])
+        elif len(parts) == 2 and parts[0] == 'jobs' and method == 'GET':
+            await self._send(writer=writer, status=HTTPStatus.OK, payload=self._find_job(job_id=parts[1]).summary())
+        elif len(parts) == 2 and parts[0] == 'jobs' and method == 'DELETE':
+            job = await self.cancel(job_id=self._find_job(job_id=parts[1]).id)
+            await self._send(writer=writer, status=HTTPStatus.OK, payload=job.summary())
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'events' and method == 'GET':
+            job = self._find_job(job_id=parts[1])
+            await self._send(writer=writer, status=HTTPStatus.OK, payload=None, content_type='application/x-ndjson')
+            async for summary in job.updates():
+                writer.write(json.dumps(summary).encode() + b'\n')
+                await writer.drain()
+        else:
+            raise _NotFound(f'{method} {path} does not exist.')
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, _ = (await reader.readline()).decode().split(' ', 2)
+            headers = {}
+            while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+                name, _, value = line.decode().partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+            try:
+                await self._respond(writer=writer, method=method, path=path, body=body)
+            except ConnectionError:
+                raise
+            except _NotFound as e:
+                await self._send(writer=writer, status=HTTPStatus.NOT_FOUND, payload={'error': e.args[0]})
+            except (ValueError, TypeError, OSError) as e:
+                await self._send(writer=writer, status=HTTPStatus.BAD_REQUEST, payload={'error': str(e)})
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        """Starts running queued jobs and accepting requests."""
+        self._pool = self._executor if self._executor is not None else ProcessPoolExecutor(max_workers=self._workers)
+        self._runners = [asyncio.create_task(self._run_jobs()) for _ in range(self._workers)]
+        self._server = await asyncio.start_server(self._handle, host=self._host, port=self._port)
+
+    async def close(self) -> None:
+        """Stops accepting requests and running jobs. Jobs still running are cancelled."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+
+        for job in self._jobs.values():
+            if not job.done:
+                await job._update(status=JobStatus.CANCELLED)
+
+        if self._executor is None and self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> 'SimulationService':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+async def _serve(host: str, port: int, workers: int) -> None:
+    async with SimulationService(workers=workers, host=host, port=port) as service:
+        host, port = service.address
+        print(f'Serving simulation jobs on http://{host}:{port}', flush=True)
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Runs blackjack simulation jobs submitted over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='host the service listens on')
+    parser.add_argument('--port', type=int, default=8000, help='port the service listens on')
+    parser.add_argument('--workers', type=int, default=1, help='number of jobs simulated at the same time')
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(host=args.host, port=args.port, workers=args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+from collections import defaultdict
+from collections.abc import Iterator, MutableMapping
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+from blackjack.enums import StatsCategory
+from blackjack.stats import Stats
+
+
+CATEGORIES = list(StatsCategory)
+
+
+def _stats_index(min_count: int, max_count: int) -> dict[tuple[int | None, StatsCategory], int]:
+    # the first count bin holds stats of players that do not count cards
+    counts: list[int | None] = [None, *range(min_count, max_count + 1)]
+    return {
+        (count, category): count_bin * len(CATEGORIES) + category_bin
+        for count_bin, count in enumerate(counts)
+        for category_bin, category in enumerate(CATEGORIES)
+    }
+
+
+class SharedStatsView(MutableMapping):
+    """
+    Represents the stats of one player in one slot of a SharedStats
+    block. Stats at counts outside of the block's count range are kept
+    in a regular dictionary instead.
+
+    """
+    def __init__(self, shared_stats: 'SharedStats', slot: int, player: int):
+        """
+        Parameters
+        ----------
+        shared_stats
+            SharedStats class instance the view writes into
+        slot
+            Slot of the block that is written to by a single worker at a time
+        player
+            Position of the player in the order players were added to the table
+
+        """
+        self._shared_stats = shared_stats
+        self._slot = slot
+        self._player = player
+        self._offset = shared_stats.offset(slot=slot, player=player)
+        self._index = shared_stats.index
+        self._buffer = shared_stats.buffer
+        self._overflow: defaultdict[tuple[float | int | None, StatsCategory], float] = defaultdict(float)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return SharedStatsView, (self._shared_stats, self._slot, self._player)
+
+    @property
+    def overflow(self) -> dict[tuple[float | int | None, StatsCategory], float]:
+        return dict(self._overflow)
+
+    def __getitem__(self, key: tuple[float | int | None, StatsCategory]) -> float:
+        index = self._index.get(key)
+        if index is None:
+            return self._overflow[key]
+        return self._buffer[self._offset + index]
+
+    def __setitem__(self, key: tuple[float | int | None, StatsCategory], value: float) -> None:
+        index = self._index.get(key)
+        if index is None:
+            self._overflow[key] = value
+        else:
+            self._buffer[self._offset + index] = value
+
+    def __delitem__(self, key: tuple[float | int | None, StatsCategory]) -> None:
+        index = self._index.get(key)
+        if index is None:
+            del self._overflow[key]
+        else:
+            self._buffer[self._offset + index] = 0
+
+    def __iter__(self) -> Iterator[tuple[float | int | None, StatsCategory]]:
+        buffer = self._buffer
+        offset = self._offset
+        yield from (key for key, index in self._index.items() if buffer[offset + index])
+        yield from self._overflow
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class SharedStats:
+    """
+    Represents a fixed-layout block of shared memory that stats are
+    accumulated in by several worker processes, laid out as
+    slot x player x count x stats category.
+
+    Each slot must only be written to by one worker at a time. The
+    block can be read at any time without locking, i.e. for progress
+    reporting, while workers are still writing to it.
+
+    """
+    def __init__(
+        self,
+        number_of_players: int,
+        number_of_slots: int = 1,
+        min_count: int = -50,
+        max_count: int = 50,
+        name: str | None = None
+    ):
+        """
+        Parameters
+        ----------
+        number_of_players
+            Number of players whose stats are stored in the block
+        number_of_slots
+            Number of workers that can write to the block at the same time
+        min_count
+            Lowest running/true count stored in the block
+        max_count
+            Highest running/true count stored in the block
+        name
+            Name of an existing block to attach to, otherwise a new block is created
+
+        """
+        if number_of_players < 1 or number_of_slots < 1:
+            raise ValueError('Number of players and slots must be at least 1.')
+        if max_count < min_count:
+            raise ValueError('Maximum count must be greater than or equal to the minimum count.')
+
+        self._number_of_players = number_of_players
+        self._number_of_slots = number_of_slots
+        self._min_count = min_count
+        self._max_count = max_count
+        self._index = _stats_index(min_count=min_count, max_count=max_count)
+        self._player_size = len(self._index)
+        size = number_of_slots * number_of_players * self._player_size * 8
+        self._is_owner = name is None
+        self._shared_memory = SharedMemory(name=name, create=self._is_owner, size=size)
+        self._buffer = self._shared_memory.buf.cast('d')
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # workers attach to the block by name instead of copying it
+        return SharedStats, (
+            self._number_of_players,
+            self._number_of_slots,
+            self._min_count,
+            self._max_count,
+            self._shared_memory.name
+        )
+
+    def __del__(self) -> None:
+        # the cast view must be released before the shared memory can be closed
+        if hasattr(self, '_buffer'):
+            self._buffer.release()
+
+    def __enter__(self) -> 'SharedStats':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def index(self) -> dict[tuple[int | None, StatsCategory], int]:
+        return self._index
+
+    @property
+    def buffer(self) -> memoryview:
+        return self._buffer
+
+    def offset(self, slot: int, player: int) -> int:
+        return (slot * self._number_of_players + player) * self._player_size
+
+    def view(self, slot: int, player: int) -> SharedStatsView:
+        return SharedStatsView(shared_stats=self, slot=slot, player=player)
+
+    def read_slot(self, slot: int) -> bytes:
+        """Returns a copy of the stats of every player in a slot."""
+        start = self.offset(slot=slot, player=0)
+        return self._buffer[start:start + self._number_of_players * self._player_size].tobytes()
+
+    def write_slot(self, slot: int, contents: bytes) -> None:
+        """Replaces the stats of every player in a slot with a copy returned by read_slot."""
+        start = self.offset(slot=slot, player=0)
+        self._buffer[start:start + self._number_of_players * self._player_size] = memoryview(contents).cast('d')
+
+    def stats(self, player: int) -> Stats:
+        stats = Stats()
+        buffer = self._buffer
+        offsets = [self.offset(slot=slot, player=player) for slot in range(self._number_of_slots)]
+        for key, index in self._index.items():
+            value = sum(buffer[offset + index] for offset in offsets)
+            if value:
+                stats.stats[key] = value
+        return stats
+
+    def close(self) -> None:
+        self._buffer.release()
+        self._shared_memory.close()
+        if self._is_owner:
+            self._shared_memory.unlink()
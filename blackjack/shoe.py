@@ -1,8 +1,31 @@
 from collections import Counter
-import random
-from blackjack.enums import CardCountingSystem
+import hashlib
+from typing_extensions import override
+from blackjack.cards import CARD_CODES, RANKS, TEN
+from blackjack.enums import CardCountingSystem, DeckEstimation
+from blackjack.random_generator import NumPyGenerator, RandomGenerator, StdlibGenerator
+from blackjack.shoe_factory import ShoeFactory
 from blackjack.source.card_counting_systems import COUNT_VALUES, INITIAL_COUNTS
-from blackjack.source.remaining_decks import REMAINING_CARDS_TO_DECKS
+from blackjack.source.remaining_decks import remaining_decks_table
+
+
+CARDS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+# the code of each card in CARDS, which is how shoes hold and deal their cards
+CODES = tuple(CARD_CODES[card] for card in CARDS)
+
+# seen cards are reported by rank, with every ten-valued card under one key
+SEEN_CARD_KEYS = tuple('10-J-Q-K' if code == TEN else rank for code, rank in enumerate(RANKS))
+
+
+def shoe_seed(seed: int, shoe_index: int) -> int:
+    """
+    Derives the seed of a single shoe from the seed of a simulation
+    and the shoe's index, so that any shoe can be regenerated on its own.
+
+    """
+    digest = hashlib.blake2b(f'{seed}:{shoe_index}'.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
 
 
 class Shoe:
@@ -10,7 +33,13 @@ class Shoe:
     Represents a shoe of cards.
 
     """
-    def __init__(self, shoe_size: int, penetration: float = 0.75):
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None
+    ):
         """
         Parameters
         ----------
@@ -19,55 +48,642 @@ class Shoe:
         penetration
             The percentage of the shoe that is dealt
             before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
 
         """
         if not 1 <= shoe_size <= 8 :
             raise ValueError('Shoe size must be between 1 and 8 decks.')
 
         self._shoe_size = shoe_size
-        self._cards = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4 * self._shoe_size
+        self._penetration = penetration
+        self._cards = list(CODES) * 4 * self._shoe_size
         self._total_cards = len(self._cards)
         self._cut_card_location = self._total_cards - int(penetration * self._total_cards)
-        self._seen_cards: Counter[str] = Counter()
+        self._seen_counts = [0] * len(RANKS)
+        self._running_counts: dict[CardCountingSystem, float | int] = {}
+        self._count_values: list[tuple[CardCountingSystem, tuple[float | int, ...]]] = []
+        self._remaining_decks_tables: dict[DeckEstimation, list[float | int]] = {}
+        self._generator = generator if generator is not None else StdlibGenerator()
+        self._generator.seed(seed=seed)
+
+    @property
+    def shoe_size(self) -> int:
+        return self._shoe_size
+
+    @property
+    def generator(self) -> RandomGenerator:
+        return self._generator
+
+    @property
+    def penetration(self) -> float:
+        return self._penetration
 
     @property
     def cards(self) -> list[str]:
-        return self._cards
+        return [RANKS[card] for card in self._cards]
+
+    def reset(self, seed: int | None = None) -> None:
+        """Returns every card to the shoe in its original order and re-seeds the shoe."""
+        self._cards = list(CODES) * 4 * self._shoe_size
+        self._clear_seen_cards()
+        self._generator.seed(seed=seed)
+
+    def start_shoe(self, seed: int, shoe_index: int) -> None:
+        """Resets the shoe to the shoe of a simulation with the given index, shuffled and ready to deal."""
+        self.reset(seed=shoe_seed(seed=seed, shoe_index=shoe_index))
+        self.shuffle()
 
     def burn_card(self) -> None:
         self._cards.pop()
 
-    def deal_card(self, seen = True) -> str:
+    def deal_card(self, seen = True) -> int:
         card = self._cards.pop()
         if seen:
             self.add_to_seen_cards(card=card)
         return card
 
     def shuffle(self) -> None:
-        random.shuffle(self._cards)
+        self._generator.shuffle(cards=self._cards)
         self.burn_card()
 
-    def add_to_seen_cards(self, card: str) -> None:
-        key = '10-J-Q-K' if card in {'10', 'J', 'Q', 'K'} else card
-        self._seen_cards[key] += 1
+    def return_discards(self) -> None:
+        """
+        Returns the cards dealt since the last round to the shoe once a round
+        is over. The discards of a shoe stay out until it is shuffled again,
+        so only a continuous shuffling machine puts them back.
+
+        """
+
+    def add_to_seen_cards(self, card: int | str) -> None:
+        # cards are dealt as codes, but may be given as strings such as 'K'
+        if isinstance(card, str):
+            card = CARD_CODES[card]
+        self._seen_counts[card] += 1
+        for card_counting_system, count_values in self._count_values:
+            self._running_counts[card_counting_system] += count_values[card]
+
+    def _clear_seen_cards(self) -> None:
+        self._seen_counts = [0] * len(RANKS)
+        for card_counting_system in self._running_counts:
+            self._running_counts[card_counting_system] = 0
+
+    def track_running_counts(self, card_counting_systems: set[CardCountingSystem]) -> None:
+        """
+        Keeps a running count for each of the card counting systems, which is
+        updated as every card is seen rather than summed over the seen cards
+        whenever it is needed. Counts of any other system are still summed.
+
+        """
+        self._running_counts = {
+            card_counting_system: sum(
+                value * count for value, count in zip(COUNT_VALUES[card_counting_system], self._seen_counts)
+            )
+            for card_counting_system in card_counting_systems
+        }
+        self._count_values = [
+            (card_counting_system, COUNT_VALUES[card_counting_system]) for card_counting_system in card_counting_systems
+        ]
 
     @property
     def seen_cards(self) -> dict[str, int]:
-        return self._seen_cards
+        return Counter({SEEN_CARD_KEYS[card]: count for card, count in enumerate(self._seen_counts) if count})
+
+    @property
+    def cards_remaining(self) -> int:
+        return len(self._cards)
+
+    def _remaining_decks_table(self, deck_estimation: DeckEstimation) -> list[float | int]:
+        # built the first time each estimation is used, sized to the cards in this shoe
+        table = self._remaining_decks_tables.get(deck_estimation)
+        if table is None:
+            table = self._remaining_decks_tables[deck_estimation] = remaining_decks_table(
+                total_cards=self._total_cards,
+                deck_estimation=deck_estimation
+            )
+        return table
+
+    def estimated_decks(self, deck_estimation: DeckEstimation = DeckEstimation.FULL_DECK) -> float | int:
+        """Returns the number of decks remaining, estimated as precisely as `deck_estimation`."""
+        return self._remaining_decks_table(deck_estimation=deck_estimation)[self.cards_remaining]
 
     @property
     def remaining_decks(self) -> float | int:
-        return REMAINING_CARDS_TO_DECKS[len(self._cards)]
+        return self.estimated_decks()
 
     @property
     def cut_card_reached(self) -> bool:
         return len(self._cards) <= self._cut_card_location
 
     def running_count(self, card_counting_system: CardCountingSystem) -> float | int:
-        running_count = sum(COUNT_VALUES[card_counting_system][card] * count for card, count in self._seen_cards.items())
+        running_count = self._running_counts.get(card_counting_system)
+        if running_count is None:
+            running_count = sum(value * count for value, count in zip(COUNT_VALUES[card_counting_system], self._seen_counts))
         if card_counting_system == CardCountingSystem.KO:
             return running_count + INITIAL_COUNTS[card_counting_system] * (self._shoe_size - 1)
         return running_count
 
-    def true_count(self, card_counting_system: CardCountingSystem) -> int:
-        return int(round(self.running_count(card_counting_system=card_counting_system) / self.remaining_decks, 0))
+    def true_count(
+        self,
+        card_counting_system: CardCountingSystem,
+        deck_estimation: DeckEstimation = DeckEstimation.FULL_DECK
+    ) -> int:
+        table = self._remaining_decks_tables.get(deck_estimation)
+        if table is None:
+            table = self._remaining_decks_table(deck_estimation=deck_estimation)
+        # round returns an int, rounding halves to even
+        return round(self.running_count(card_counting_system=card_counting_system) / table[self.cards_remaining])
+
+
+class CursorShoe(Shoe):
+    """
+    Represents a shoe of cards whose cards are allocated once and
+    dealt by moving a cursor towards the front of the shoe, rather than
+    popping them off. Resetting the shoe restores the original order of
+    the cards in place, so one shoe can be shuffled and dealt over and
+    over again. Given the same seed, it deals the same cards as a Shoe.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+
+        """
+        super().__init__(shoe_size=shoe_size, penetration=penetration, seed=seed, generator=generator)
+        self._initial_cards = self._cards.copy()
+        self._cursor = self._total_cards
+
+    @property
+    @override
+    def cards(self) -> list[str]:
+        return [RANKS[card] for card in self._cards[:self._cursor]]
+
+    @override
+    def reset(self, seed: int | None = None) -> None:
+        self._cards[:] = self._initial_cards
+        self._cursor = self._total_cards
+        self._clear_seen_cards()
+        self._generator.seed(seed=seed)
+
+    @override
+    def burn_card(self) -> None:
+        self._cursor -= 1
+
+    @override
+    def deal_card(self, seen = True) -> int:
+        self._cursor -= 1
+        card = self._cards[self._cursor]
+        if seen:
+            self.add_to_seen_cards(card=card)
+        return card
+
+    @override
+    def shuffle(self) -> None:
+        # every card is returned to the shoe before it is shuffled
+        self._cursor = self._total_cards
+        self._generator.shuffle(cards=self._cards)
+        self.burn_card()
+
+    @property
+    @override
+    def cards_remaining(self) -> int:
+        return self._cursor
+
+    @property
+    @override
+    def cut_card_reached(self) -> bool:
+        return self._cursor <= self._cut_card_location
+
+
+class PartialShuffleShoe(CursorShoe):
+    """
+    Represents a shoe of cards that is only shuffled as far as the cards
+    that will be dealt. Shuffling runs a Fisher-Yates shuffle from the
+    dealing end of the shoe up to the cut card, plus enough cards for the
+    final round, and continues lazily if a round is dealt past that point.
+
+    Each step of a Fisher-Yates shuffle fixes the card at one position,
+    starting from the dealing end, so the cards dealt are exactly those
+    a full shuffle with the same seed would deal.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None,
+        overdraw: int = 26
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+        overdraw
+            Number of cards past the cut card that are shuffled up front,
+            to cover the final round of the shoe
+
+        """
+        super().__init__(shoe_size=shoe_size, penetration=penetration, seed=seed, generator=generator)
+        self._overdraw = overdraw
+        self._shuffled_to = self._total_cards
+
+    def _shuffle_to(self, position: int) -> None:
+        # the same steps and random numbers as a full shuffle, stopped early
+        cards = self._cards
+        start = self._shuffled_to - 1
+        stop = max(position, 1) - 1
+        for i, j in zip(range(start, stop, -1), self._generator.swaps(start=start, stop=stop)):
+            cards[i], cards[j] = cards[j], cards[i]
+        self._shuffled_to = min(position, self._shuffled_to)
+
+    @property
+    @override
+    def cards(self) -> list[str]:
+        self._shuffle_to(position=0)
+        return [RANKS[card] for card in self._cards[:self._cursor]]
+
+    @override
+    def reset(self, seed: int | None = None) -> None:
+        super().reset(seed=seed)
+        self._shuffled_to = self._total_cards
+
+    @override
+    def burn_card(self) -> None:
+        self._cursor -= 1
+        if self._cursor < self._shuffled_to:
+            self._shuffle_to(position=self._cursor)
+
+    @override
+    def deal_card(self, seen = True) -> int:
+        self._cursor -= 1
+        if self._cursor < self._shuffled_to:
+            self._shuffle_to(position=self._cursor)
+        card = self._cards[self._cursor]
+        if seen:
+            self.add_to_seen_cards(card=card)
+        return card
+
+    @override
+    def shuffle(self) -> None:
+        self._cursor = self._total_cards
+        self._shuffled_to = self._total_cards
+        self._shuffle_to(position=self._cut_card_location - self._overdraw)
+        self.burn_card()
+
+
+# ten-valued cards come first since they are drawn most often
+DRAW_ORDER = ['10', '2', '3', '4', '5', '6', '7', '8', '9', 'A']
+DRAW_CODES = tuple(CARD_CODES[rank] for rank in DRAW_ORDER)
+
+
+class CompositionShoe(Shoe):
+    """
+    Represents a shoe of cards described only by the number of cards of
+    each rank it holds, for studies in which the order of the cards does
+    not matter. Every card dealt is drawn with a probability proportional
+    to the number of cards of its rank that remain, so the shoe never
+    needs to be shuffled. Ten-valued cards are all dealt as a '10'.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None,
+        composition: dict[str, int] | None = None
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+        composition
+            Number of cards of each rank ('2' to '9', '10' for every
+            ten-valued card, and 'A') the shoe starts with, otherwise
+            the shoe starts with `shoe_size` full decks
+
+        """
+        super().__init__(shoe_size=shoe_size, penetration=penetration, seed=seed, generator=generator)
+        if composition is None:
+            composition = {rank: 16 * shoe_size if rank == '10' else 4 * shoe_size for rank in DRAW_ORDER}
+        if set(composition) - set(DRAW_ORDER):
+            raise ValueError(f'Composition ranks must be one of {", ".join(DRAW_ORDER)}.')
+        if any(count < 0 for count in composition.values()):
+            raise ValueError('Composition counts must not be negative.')
+        if not 0 < sum(composition.values()) <= len(self._cards):
+            raise ValueError('Composition must hold between 1 card and the cards of the shoe size.')
+
+        self._initial_counts = [composition.get(rank, 0) for rank in DRAW_ORDER]
+        self._counts = self._initial_counts.copy()
+        self._total_cards = sum(self._initial_counts)
+        self._remaining = self._total_cards
+        self._cut_card_location = self._total_cards - int(penetration * self._total_cards)
+        self._cards = []
+
+    @property
+    def composition(self) -> dict[str, int]:
+        return dict(zip(DRAW_ORDER, self._counts))
+
+    @property
+    @override
+    def cards(self) -> list[str]:
+        return [rank for rank, count in zip(DRAW_ORDER, self._counts) for _ in range(count)]
+
+    @override
+    def reset(self, seed: int | None = None) -> None:
+        self._counts[:] = self._initial_counts
+        self._remaining = self._total_cards
+        self._clear_seen_cards()
+        self._generator.seed(seed=seed)
+
+    def _draw(self) -> int:
+        # picks a position among the remaining cards the same way random.choices
+        # does, then walks the counts of at most ten ranks to find its rank
+        position = int(self._generator.random() * self._remaining)
+        counts = self._counts
+        index = 0
+        while position >= counts[index]:
+            position -= counts[index]
+            index += 1
+        counts[index] -= 1
+        self._remaining -= 1
+        return DRAW_CODES[index]
+
+    @override
+    def burn_card(self) -> None:
+        self._draw()
+
+    @override
+    def deal_card(self, seen = True) -> int:
+        card = self._draw()
+        if seen:
+            self.add_to_seen_cards(card=card)
+        return card
+
+    @override
+    def shuffle(self) -> None:
+        # every card is returned to the shoe, which needs no shuffling
+        self._counts[:] = self._initial_counts
+        self._remaining = self._total_cards
+        self.burn_card()
+
+    @property
+    @override
+    def cards_remaining(self) -> int:
+        return self._remaining
+
+    @property
+    @override
+    def cut_card_reached(self) -> bool:
+        return self._remaining <= self._cut_card_location
+
+
+class ArrayShoe(CursorShoe):
+    """
+    Represents a shoe of cards stored as one byte per card, each the index
+    of its rank in CARDS. Rather than shuffling its own cards, the shoe can
+    deal a row of a batch of shoes shuffled by a ShoeFactory, which it reads
+    through a memoryview without copying. Shuffling the shoe itself deals
+    the same cards as a Shoe with the same seed.
+
+    Batches are shuffled with the NumPy bit generator of the shoe's own
+    generator, i.e. MT19937 for the standard library's Mersenne Twister,
+    so a generator that NumPy does not provide cannot start a shoe.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+
+        """
+        super().__init__(shoe_size=shoe_size, penetration=penetration, seed=seed, generator=generator)
+        self._initial_cards = bytes(range(len(CARDS))) * 4 * shoe_size
+        self._buffer = bytearray(self._initial_cards)
+        self._cards = self._buffer
+        self._factory: ShoeFactory | None = None
+
+    def __getstate__(self) -> dict:
+        # the factory's batch of shoes is rebuilt when it is next needed
+        return {**self.__dict__, '_cards': self._buffer, '_factory': None}
+
+    @property
+    @override
+    def cards(self) -> list[str]:
+        return [RANKS[CODES[card]] for card in self._cards[:self._cursor]]
+
+    def load(self, cards: memoryview | bytes | bytearray) -> None:
+        """Deals the given cards from now on, with every card back in the shoe."""
+        if len(cards) != self._total_cards:
+            raise ValueError(f'Expected {self._total_cards} cards but received {len(cards)}.')
+        self._cards = cards
+        self._cursor = self._total_cards
+        self._clear_seen_cards()
+
+    @override
+    def reset(self, seed: int | None = None) -> None:
+        self._buffer[:] = self._initial_cards
+        self._cards = self._buffer
+        self._cursor = self._total_cards
+        self._clear_seen_cards()
+        self._generator.seed(seed=seed)
+
+    def _bit_generator(self) -> str:
+        if isinstance(self._generator, NumPyGenerator):
+            return self._generator.bit_generator
+        if isinstance(self._generator, StdlibGenerator):
+            return 'MT19937'
+        raise ValueError(f'ArrayShoe cannot shuffle batches of shoes with a {type(self._generator).__name__}.')
+
+    @override
+    def start_shoe(self, seed: int, shoe_index: int) -> None:
+        if self._factory is None or self._factory.seed != seed:
+            self._factory = ShoeFactory(shoe_size=self._shoe_size, seed=seed, bit_generator=self._bit_generator())
+        self.load(cards=self._factory.shoe(shoe_index=shoe_index))
+        self.burn_card()
+
+    @override
+    def deal_card(self, seen = True) -> int:
+        self._cursor -= 1
+        card = CODES[self._cards[self._cursor]]
+        if seen:
+            self.add_to_seen_cards(card=card)
+        return card
+
+    @override
+    def shuffle(self) -> None:
+        # the shoe's own cards are shuffled, never the rows of a factory's batch
+        self._cards = self._buffer
+        super().shuffle()
+
+
+class CSMShoe(CursorShoe):
+    """
+    Represents a continuous shuffling machine, which has no cut card.
+    After every round, the discards are reinserted at random positions
+    among the cards in the machine, one step of an inside-out Fisher-Yates
+    shuffle per card, so returning them costs as much as the number of
+    cards returned rather than a shuffle of the whole machine. Every card
+    seen is back in the machine once the discards are returned, so the
+    seen cards are cleared with them.
+
+    """
+    @override
+    def return_discards(self) -> None:
+        # the discards are the cards past the cursor, and each one is swapped
+        # into a random position among the cards in the machine and itself
+        cards = self._cards
+        swaps = self._generator.integers_below(bounds=range(self._cursor + 1, self._total_cards + 1))
+        for position, j in enumerate(swaps, self._cursor):
+            cards[position], cards[j] = cards[j], cards[position]
+        self._cursor = self._total_cards
+        self._clear_seen_cards()
+
+    @property
+    @override
+    def cut_card_reached(self) -> bool:
+        return False
+
+
+# number of cards an InfiniteShoe draws at once
+BLOCK_SIZE = 128
+
+
+class InfiniteShoe(Shoe):
+    """
+    Represents an infinite deck, from which every card is drawn
+    independently with the probability of its rank in a single deck.
+    Cards are drawn in blocks, and the shoe keeps no other bookkeeping:
+    no cards are seen, so counts stay at zero, and there is no cut card.
+    It estimates the expected value of players who flat bet without the
+    effect of cards removed from the shoe. A game of players who flat bet
+    plays its shoes with play_infinite_shoe, which skips the counts, cut
+    card and seen cards of play_round, so its rounds are several times
+    faster than from a finite shoe.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None,
+        block_size: int = BLOCK_SIZE
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game, which
+            does not change the cards drawn from an infinite deck
+        penetration
+            The percentage of the shoe that is dealt before the shoe
+            is re-shuffled, which does not apply to an infinite deck
+        seed
+            Seed of the random number generator owned by the shoe
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+        block_size
+            Number of cards drawn at once
+
+        """
+        if block_size < 1:
+            raise ValueError('Block size must be at least 1.')
+
+        super().__init__(shoe_size=shoe_size, penetration=penetration, seed=seed, generator=generator)
+        self._bounds = [len(CARDS)] * block_size
+        self._block: list[int] = []
+
+    def _draw_block(self) -> None:
+        self._block = list(map(CODES.__getitem__, self._generator.integers_below(bounds=self._bounds)))
+
+    @override
+    def reset(self, seed: int | None = None) -> None:
+        self._block = []
+        self._generator.seed(seed=seed)
+
+    @override
+    def burn_card(self) -> None:
+        pass
+
+    @override
+    def deal_card(self, seen = True) -> int:
+        if not self._block:
+            self._draw_block()
+        return self._block.pop()
+
+    @override
+    def shuffle(self) -> None:
+        # the cards are independent, so only the undealt cards of the last block are discarded
+        self._block = []
+
+    @override
+    def add_to_seen_cards(self, card: int | str) -> None:
+        pass
+
+    @property
+    @override
+    def cards_remaining(self) -> int:
+        # an infinite deck is never depleted
+        return self._total_cards
+
+    @property
+    @override
+    def cut_card_reached(self) -> bool:
+        return False
@@ -0,0 +1,108 @@
+try:
+    import numpy as np
+except ModuleNotFoundError:  # NumPy is an optional dependency
+    np = None
+
+
+# number of shoes shuffled together by a ShoeFactory
+SHOES_PER_BATCH = 256
+
+# NumPy bit generators a batch can be shuffled with
+BIT_GENERATORS = ('MT19937', 'PCG64', 'Philox')
+
+
+class ShoeFactory:
+    """
+    Represents a factory of shuffled shoes that shuffles a whole batch of
+    shoes at once with NumPy. Each batch is a uint8 matrix with one row per
+    shoe, and each card is the index of its rank in blackjack.shoe.CARDS.
+
+    Shoes are grouped into batches by their index, and every batch has its
+    own generator seeded from the seed and the index of the batch, so a
+    shoe is the same however the shoes of a simulation are split up. The
+    rows of a batch are shuffled one after another by its generator, so
+    they are only shuffled as far as the last shoe asked for, and a short
+    range of shoes does not pay for shuffling the whole batch.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        seed: int,
+        shoes_per_batch: int = SHOES_PER_BATCH,
+        bit_generator: str = 'PCG64'
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks in each shoe
+        seed
+            Seed of the simulation from which the seed of every batch is derived
+        shoes_per_batch
+            Number of shoes shuffled together
+        bit_generator
+            Name of the NumPy bit generator batches are shuffled with,
+            i.e. 'MT19937', 'PCG64' or 'Philox'
+
+        """
+        if np is None:
+            raise ModuleNotFoundError('ShoeFactory requires NumPy, which can be installed with `pip install numpy`.')
+        if shoes_per_batch < 1:
+            raise ValueError('Number of shoes per batch must be at least 1.')
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f'Bit generator must be one of {", ".join(BIT_GENERATORS)}.')
+
+        self._shoe_size = shoe_size
+        self._seed = seed
+        self._shoes_per_batch = shoes_per_batch
+        self._bit_generator = bit_generator
+        self._cards = np.tile(np.arange(13, dtype=np.uint8), 4 * shoe_size)
+        self._batch_index: int | None = None
+        self._batch = None
+        self._generator = None
+        self._rows_shuffled = 0
+
+    @property
+    def shoe_size(self) -> int:
+        return self._shoe_size
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def shoes_per_batch(self) -> int:
+        return self._shoes_per_batch
+
+    @property
+    def bit_generator(self) -> str:
+        return self._bit_generator
+
+    def _shuffle_rows(self, batch_index: int, rows: int) -> None:
+        # shuffles the rows of the batch up to `rows` that are not shuffled yet
+        if batch_index != self._batch_index:
+            # seeds are reduced to 64 bits, since NumPy does not accept negative seeds
+            bit_generator = getattr(np.random, self._bit_generator)([batch_index, self._seed % 2 ** 64])
+            self._generator = np.random.Generator(bit_generator)
+            self._batch = np.tile(self._cards, (self._shoes_per_batch, 1))
+            self._batch_index = batch_index
+            self._rows_shuffled = 0
+        if rows > self._rows_shuffled:
+            unshuffled = self._batch[self._rows_shuffled:rows]
+            self._generator.permuted(unshuffled, axis=1, out=unshuffled)
+            self._rows_shuffled = rows
+
+    def batch(self, batch_index: int):
+        """Returns the shuffled shoes of a batch as a (shoes per batch x cards) uint8 array."""
+        self._shuffle_rows(batch_index=batch_index, rows=self._shoes_per_batch)
+        return self._batch
+
+    def shoe(self, shoe_index: int) -> memoryview:
+        """Returns the cards of a shoe as a view of its row in the batch, without copying it."""
+        batch_index, row = divmod(shoe_index, self._shoes_per_batch)
+        # rows are shuffled in chunks that double in size, up to the rest of the batch
+        rows_shuffled = self._rows_shuffled if batch_index == self._batch_index else 0
+        if row >= rows_shuffled:
+            self._shuffle_rows(batch_index=batch_index, rows=min(max(row + 1, 2 * rows_shuffled), self._shoes_per_batch))
+        return memoryview(self._batch[row])
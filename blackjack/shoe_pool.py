@@ -0,0 +1,229 @@
+import hashlib
+import mmap
+import os
+import random
+import struct
+import threading
+from typing import Any
+from typing_extensions import override
+from blackjack.random_generator import RandomGenerator, create_generator
+from blackjack.shoe import ArrayShoe, shoe_seed
+
+
+# identifies a shoe pool file and the version of its layout
+MAGIC = b'BJSHOES\x00'
+VERSION = 1
+
+# magic, version, shoe size, number of shoes and seed, little-endian
+HEADER = struct.Struct('<8sHHQQ')
+
+
+def write_shoe_pool(
+    path: str | os.PathLike,
+    number_of_shoes: int,
+    shoe_size: int,
+    seed: int | None = None,
+    random_generator: str = 'stdlib'
+) -> int:
+    """
+    Writes a pool of shuffled shoes to a file and returns the seed used.
+
+    The file starts with a header holding the shoe size, number of shoes
+    and seed, followed by every shoe with one byte per card, each the index
+    of its rank in blackjack.shoe.CARDS. Shoe `i` is shuffled the same way
+    as shoe `i` of a simulation with the same seed and random generator,
+    so replaying the pool deals the same cards as that simulation.
+
+    """
+    if number_of_shoes < 1:
+        raise ValueError('Number of shoes must be at least 1.')
+    if seed is None:
+        seed = random.getrandbits(64)
+    if not 0 <= seed < 1 << 64:
+        raise ValueError('Seed must be between 0 and 2**64 - 1 to be stored in a shoe pool.')
+
+    shoe = ArrayShoe(shoe_size=shoe_size, generator=create_generator(name=random_generator))
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, shoe_size, number_of_shoes, seed))
+        for shoe_index in range(number_of_shoes):
+            shoe.reset(seed=shoe_seed(seed=seed, shoe_index=shoe_index))
+            shoe.shuffle()
+            file.write(shoe._buffer)
+    return seed
+
+
+def _map_pool(path: str) -> mmap.mmap:
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f'{path} is not a shoe pool.')
+        magic, version, shoe_size, number_of_shoes, _ = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a shoe pool.')
+        if version != VERSION:
+            raise ValueError(f'Shoe pool version {version} is not supported.')
+        if os.fstat(file.fileno()).st_size != HEADER.size + number_of_shoes * shoe_size * 52:
+            raise ValueError(f'{path} does not hold {number_of_shoes} shoes of {shoe_size} decks.')
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ShoePool:
+    """
+    Represents a pool of shuffled shoes written by write_shoe_pool, which is
+    memory-mapped read-only. Shoes are read as slices of the mapping without
+    copying them, so every process that opens the same pool shares its pages
+    in the operating system's page cache. A pickled pool is re-opened from
+    its path, which is how it reaches worker processes, and every copy of a
+    pool in the same process shares one mapping of the file.
+
+    """
+    # files mapped by pools in this process, keyed by their path, inode, size and modification
+    # time, along with the number of open pools using each mapping, which is unmapped once the
+    # last of them is closed
+    _mappings: dict[tuple[str, int, int, int], mmap.mmap] = {}
+    _open_pools: dict[tuple[str, int, int, int], int] = {}
+    _mappings_lock = threading.Lock()
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        path
+            File the pool of shoes was written to
+
+        """
+        self._path = os.fspath(path)
+        status = os.stat(self._path)
+        self._key = (self._path, status.st_ino, status.st_size, status.st_mtime_ns)
+        mapping = self._open_mapping(key=self._key)
+        _, _, shoe_size, number_of_shoes, seed = HEADER.unpack_from(mapping)
+
+        self._shoe_size = shoe_size
+        self._number_of_shoes = number_of_shoes
+        self._seed = seed
+        self._total_cards = shoe_size * 52
+        self._view = memoryview(mapping)
+        self._digest: str | None = None
+        self._closed = False
+
+    @classmethod
+    def _open_mapping(cls, key: tuple[str, int, int, int]) -> mmap.mmap:
+        # the header is only checked when the file is first mapped
+        with cls._mappings_lock:
+            mapping = cls._mappings.get(key)
+            if mapping is None:
+                mapping = cls._mappings[key] = _map_pool(path=key[0])
+            cls._open_pools[key] = cls._open_pools.get(key, 0) + 1
+            return mapping
+
+    def __getstate__(self) -> dict:
+        return {'path': self._path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(path=state['path'])
+
+    def __enter__(self) -> 'ShoePool':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._number_of_shoes
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def shoe_size(self) -> int:
+        return self._shoe_size
+
+    @property
+    def number_of_shoes(self) -> int:
+        return self._number_of_shoes
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hash of the pool's contents, which identifies the shoes it holds."""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self._view).hexdigest()
+        return self._digest
+
+    def shoe(self, shoe_index: int) -> memoryview:
+        """Returns the cards of a shoe as a view of the memory-mapped file, without copying them."""
+        if not 0 <= shoe_index < self._number_of_shoes:
+            raise ValueError(f'Shoe pool holds {self._number_of_shoes} shoes, so there is no shoe {shoe_index}.')
+        start = HEADER.size + shoe_index * self._total_cards
+        return self._view[start:start + self._total_cards]
+
+    def close(self) -> None:
+        """
+        Closes the pool, and unmaps the file unless other copies of the pool
+        in this process, or shoes read from it, still use the mapping.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._view.release()
+        with self._mappings_lock:
+            self._open_pools[self._key] -= 1
+            if self._open_pools[self._key]:
+                return
+            del self._open_pools[self._key]
+            try:
+                self._mappings[self._key].close()
+            except BufferError:
+                # shoes read from the pool are still in use, so the mapping is
+                # kept for the next copy of the pool, which unmaps it when closed
+                return
+            del self._mappings[self._key]
+
+
+class PooledShoe(ArrayShoe):
+    """
+    Represents a shoe that deals the shoes of a ShoePool by their index,
+    rather than shuffling its own cards, so that every game replaying the
+    pool sees exactly the same card sequences.
+
+    """
+    def __init__(
+        self,
+        pool: ShoePool,
+        penetration: float = 0.75,
+        seed: int | None = None,
+        generator: RandomGenerator | None = None
+    ):
+        """
+        Parameters
+        ----------
+        pool
+            Pool of shuffled shoes that are dealt
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        seed
+            Seed of the random number generator owned by the shoe,
+            which is only used when the shoe is shuffled itself
+        generator
+            Random number generator owned by the shoe, otherwise the
+            standard library's Mersenne Twister is used
+
+        """
+        super().__init__(shoe_size=pool.shoe_size, penetration=penetration, seed=seed, generator=generator)
+        self._pool = pool
+
+    @property
+    def pool(self) -> ShoePool:
+        return self._pool
+
+    @override
+    def start_shoe(self, seed: int, shoe_index: int) -> None:
+        # the pool was shuffled when it was written, so the seed is not needed
+        self.load(cards=self._pool.shoe(shoe_index=shoe_index))
+        self.burn_card()
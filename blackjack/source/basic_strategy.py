@@ -1,3 +1,6 @@
+from blackjack.cards import RANKS
+
+
 ## Basic Strategy (source: https://wizardofodds.com/games/blackjack/strategy/4-decks/)
 # H  : hit
 # S  : stand
@@ -125,28 +128,26 @@ S17_PAIR_ARRAY = [
 
 CARDS: list[str] = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
 
+# column of each card code, where the columns of J, Q and K repeat the column of 10
+_COLUMNS = [CARDS.index(rank) for rank in RANKS]
+
 
-def _array_to_integer_dict(array: list[list[str]], rows: range) -> dict[int, dict[str, str]]:
-    d: dict[int, dict[str, str]] = {}
-    for row_ix, i in enumerate(rows):
-        d[i] = {}
-        for col_ix, j in enumerate(CARDS):
-            d[i][j] = array[row_ix][col_ix]
-    return d
+def _array_to_total_table(array: list[list[str]], rows: range) -> list[list[str] | None]:
+    # indexed by the total of the hand and then the code of the dealer's up card
+    table: list[list[str] | None] = [None] * rows.start
+    for row in array:
+        table.append([row[column] for column in _COLUMNS])
+    return table
 
 
-def _array_to_string_dict(array: list[list[str]], rows: list[str]) -> dict[str, dict[str, str]]:
-    d: dict[str, dict[str, str]] = {}
-    for row_ix, i in enumerate(rows):
-        d[i] = {}
-        for col_ix, j in enumerate(CARDS):
-            d[i][j] = array[row_ix][col_ix]
-    return d
+def _array_to_pair_table(array: list[list[str]]) -> list[list[str]]:
+    # indexed by the code of the paired card and then the code of the dealer's up card
+    return [[array[row][column] for column in _COLUMNS] for row in _COLUMNS]
 
 
-H17_HARD_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=H17_HARD_ARRAY, rows=range(4, 22))
-H17_SOFT_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=H17_SOFT_ARRAY, rows=range(12, 22))
-H17_PAIR_DICT: dict[str, dict[str, str]] = _array_to_string_dict(array=H17_PAIR_ARRAY, rows=CARDS)
-S17_HARD_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=S17_HARD_ARRAY, rows=range(4, 22))
-S17_SOFT_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=S17_SOFT_ARRAY, rows=range(12, 22))
-S17_PAIR_DICT: dict[str, dict[str, str]] = _array_to_string_dict(array=S17_PAIR_ARRAY, rows=CARDS)
+H17_HARD_TABLE: list[list[str] | None] = _array_to_total_table(array=H17_HARD_ARRAY, rows=range(4, 22))
+H17_SOFT_TABLE: list[list[str] | None] = _array_to_total_table(array=H17_SOFT_ARRAY, rows=range(12, 22))
+H17_PAIR_TABLE: list[list[str]] = _array_to_pair_table(array=H17_PAIR_ARRAY)
+S17_HARD_TABLE: list[list[str] | None] = _array_to_total_table(array=S17_HARD_ARRAY, rows=range(4, 22))
+S17_SOFT_TABLE: list[list[str] | None] = _array_to_total_table(array=S17_SOFT_ARRAY, rows=range(12, 22))
+S17_PAIR_TABLE: list[list[str]] = _array_to_pair_table(array=S17_PAIR_ARRAY)
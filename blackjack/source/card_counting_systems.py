@@ -1,4 +1,4 @@
-from typing import Any
+from blackjack.cards import RANKS, TEN
 from blackjack.enums import CardCountingSystem
 
 
@@ -100,16 +100,21 @@ KO_VALUES = {
 }
 
 
+def _values_by_code(values: dict[str, float | int]) -> tuple[float | int, ...]:
+    # indexed by the code of a card, with ten-valued cards sharing the one code
+    return tuple(values['10-J-Q-K' if code == TEN else rank] for code, rank in enumerate(RANKS))
+
+
 # balanced card counting systems: Hi-Lo, Hi-Opt I, Hi-Opt II, Omega II, Halves, Zen Count
 # unbalanced card counting systems: KO
-COUNT_VALUES: dict[CardCountingSystem, dict[str, Any]] = {
-    CardCountingSystem.HI_LO: HI_LO_VALUES,
-    CardCountingSystem.HI_OPT_I: HI_OPT_I_VALUES,
-    CardCountingSystem.HI_OPT_II: HI_OPT_II_VALUES,
-    CardCountingSystem.OMEGA_II: OMEGA_II_VALUES,
-    CardCountingSystem.HALVES: HALVES_VALUES,
-    CardCountingSystem.ZEN_COUNT: ZEN_COUNT_VALUES,
-    CardCountingSystem.KO: KO_VALUES
+COUNT_VALUES: dict[CardCountingSystem, tuple[float | int, ...]] = {
+    CardCountingSystem.HI_LO: _values_by_code(values=HI_LO_VALUES),
+    CardCountingSystem.HI_OPT_I: _values_by_code(values=HI_OPT_I_VALUES),
+    CardCountingSystem.HI_OPT_II: _values_by_code(values=HI_OPT_II_VALUES),
+    CardCountingSystem.OMEGA_II: _values_by_code(values=OMEGA_II_VALUES),
+    CardCountingSystem.HALVES: _values_by_code(values=HALVES_VALUES),
+    CardCountingSystem.ZEN_COUNT: _values_by_code(values=ZEN_COUNT_VALUES),
+    CardCountingSystem.KO: _values_by_code(values=KO_VALUES)
 }
 
 
@@ -0,0 +1,60 @@
+from blackjack.cards import ACE, HARD_VALUES, RANKS
+
+
+# every hand is in one of a small number of states, numbered from the empty hand (0) in the
+# order they are reached, where a state is the hard total, whether the hand holds an ace,
+# the number of cards (0, 1, 2, or 3 for three or more) and the pair rank: the code of the
+# card of a one-card hand, or of the paired card of a two-card pair, otherwise None
+# a hand whose hard total is over 21 is busted and takes no more cards, so its state is final
+EMPTY_HAND = 0
+
+
+def _next_state(state: tuple[int, bool, int, int | None], card: int) -> tuple[int, bool, int, int | None]:
+    hard_total, has_ace, number_of_cards, pair = state
+    if hard_total > 21:
+        return state
+    number_of_cards = min(number_of_cards + 1, 3)
+    if number_of_cards == 1:
+        pair = card
+    elif number_of_cards != 2 or card != pair:
+        pair = None
+    return hard_total + HARD_VALUES[card], has_ace or card == ACE, number_of_cards, pair
+
+
+def _reachable_states() -> list[tuple[int, bool, int, int | None]]:
+    states = [(0, False, 0, None)]
+    numbers = {states[0]: EMPTY_HAND}
+    for state in states:
+        for card in range(len(RANKS)):
+            next_state = _next_state(state=state, card=card)
+            if next_state not in numbers:
+                numbers[next_state] = len(states)
+                states.append(next_state)
+    return states
+
+
+STATES = _reachable_states()
+_NUMBERS = {state: number for number, state in enumerate(STATES)}
+
+# the state a hand moves to when a card is added, indexed by the state and then the code of the card
+TRANSITIONS: list[list[int]] = [
+    [_NUMBERS[_next_state(state=state, card=card)] for card in range(len(RANKS))] for state in STATES
+]
+
+SOFT: list[bool] = [has_ace and hard_total < 12 for hard_total, has_ace, _, _ in STATES]
+TOTALS: list[int] = [hard_total + 10 if soft else hard_total for (hard_total, _, _, _), soft in zip(STATES, SOFT)]
+BUSTED: list[bool] = [total > 21 for total in TOTALS]
+
+# whether the cards of the hand make a blackjack, before knowing if the hand was split
+TWO_CARD_21: list[bool] = [number_of_cards == 2 and total == 21 for (_, _, number_of_cards, _), total in zip(STATES, TOTALS)]
+
+PAIRS: list[int | None] = [pair if number_of_cards == 2 else None for _, _, number_of_cards, pair in STATES]
+
+# the number of cards in the hand, where three or more cards count as 3
+NUMBER_OF_CARDS: list[int] = [number_of_cards for _, _, number_of_cards, _ in STATES]
+
+# whether the dealer stands on the hand, indexed by whether they stand on a soft 17
+DEALER_STANDS: dict[bool, list[bool]] = {
+    s17: [total > 17 or (total == 17 and (s17 or not soft)) for total, soft in zip(TOTALS, SOFT)]
+    for s17 in (True, False)
+}
@@ -1,20 +1,40 @@
 from collections import defaultdict
+from collections.abc import MutableMapping
 from blackjack.enums import StatsCategory
 
 
+# what a player brings back from a range of shoes played on a copy of the game: their stats,
+# the change in their bankroll, the furthest their bankroll fell below where it started at
+# the start of a round, whether they are still seated at the table, and the number of rounds
+# dealt in the range, which is the same for every player
+PlayerResults = tuple[dict[tuple[float | int | None, StatsCategory], float], float | int, float | int, bool, int]
+
+
 class Stats:
     """
     Represents a way to store blackjack statistics
     over the course of a simulation.
 
     """
-    def __init__(self):
-        self._stats = defaultdict(float)
+    def __init__(self, stats: MutableMapping[tuple[float | int | None, StatsCategory], float] | None = None):
+        """
+        Parameters
+        ----------
+        stats
+            Mapping the stats are accumulated in, i.e. a view of a SharedStats
+            block, otherwise a new dictionary is used
+
+        """
+        self._stats = defaultdict(float) if stats is None else stats
 
     @property
     def stats(self) -> defaultdict[tuple[float | int | None, StatsCategory], float]:
         return self._stats
 
+    def merge(self, stats: dict[tuple[float | int | None, StatsCategory], float]) -> None:
+        for stats_key, value in stats.items():
+            self._stats[stats_key] += value
+
     def _compute_totals(self) -> defaultdict[str, float]:
         totals: defaultdict[str, float] = defaultdict(float)
         for stats_key, value in self._stats.items():
@@ -20,6 +20,7 @@ class Table:
         self._rules = rules
         self._players: list[Player] = []
         self._observers: list[Player] = []
+        self._roster: list[Player] = []
 
     @property
     def players(self):
@@ -29,6 +30,10 @@ class Table:
     def observers(self) -> list[Player]:
         return self._observers
 
+    @property
+    def roster(self) -> list[Player]:
+        return self._roster
+
     def _validate_player(self, player: Player) -> None:
         if not isinstance(player, Player):
             raise TypeError('Expected a Player, CardCounter, or BackCounter object.')
@@ -43,6 +48,7 @@ class Table:
 
     def add_player(self, player: Player) -> None:
         self._validate_player(player=player)
+        self._roster.append(player)
         if isinstance(player, BackCounter):
             self._observers.append(player)
         else:
@@ -62,3 +68,10 @@ class Table:
         self._players.remove(back_counter)
         self._observers.append(back_counter)
         back_counter.is_seated = False
+
+    def reset_seating(self) -> None:
+        # back counters return to observing in the order they were added
+        self._players = [player for player in self._players if not isinstance(player, BackCounter)]
+        self._observers = [player for player in self._roster if isinstance(player, BackCounter)]
+        for back_counter in self._observers:
+            back_counter.is_seated = False
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from blackjack.back_counter import BackCounter
+from blackjack.blackjack import Blackjack
 from blackjack.card_counter import CardCounter
 from blackjack.dealer import Dealer
 from blackjack.enums import CardCountingSystem
@@ -13,6 +15,13 @@ from blackjack.stats import Stats
 from blackjack.table import Table
 
 
+@pytest.fixture
+def thread_pool():
+    thread_pool = ThreadPoolExecutor(max_workers=2)
+    yield thread_pool
+    thread_pool.shutdown()
+
+
 @pytest.fixture
 def rules():
     return Rules(min_bet=10, max_bet=500)
@@ -160,3 +169,106 @@ def stats():
 @pytest.fixture
 def table(rules):
     return Table(rules=rules)
+
+
+@pytest.fixture
+def blackjack_game():
+    blackjack_game = Blackjack(min_bet=10, max_bet=500)
+    blackjack_game.add_player(player=Player(name='Player 1', min_bet=10, bankroll=100000))
+    blackjack_game.add_player(
+        player=BackCounter(
+            name='Player 2',
+            bankroll=100000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={
+                1: 15,
+                2: 20,
+                3: 40,
+                4: 50,
+                5: 70
+            },
+            insurance=3,
+            entry_point=1,
+            exit_point=0
+        )
+    )
+    return blackjack_game
+
+
+@pytest.fixture
+def small_bankroll_game():
+    blackjack_game = Blackjack(min_bet=10, max_bet=500, double_after_split=True)
+    blackjack_game.add_player(player=Player(name='Player 1', min_bet=10, bankroll=200))
+    blackjack_game.add_player(
+        player=CardCounter(
+            name='Player 2',
+            bankroll=600,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={
+                1: 20,
+                3: 80
+            },
+            insurance=2
+        )
+    )
+    blackjack_game.add_player(
+        player=BackCounter(
+            name='Player 3',
+            bankroll=300,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={
+                1: 20,
+                3: 80
+            },
+            insurance=None,
+            entry_point=1,
+            exit_point=0
+        )
+    )
+    return blackjack_game
+
+
+@pytest.fixture
+def back_counter_game():
+    # a copy of the game that starts a later range without the player who busts out
+    # in an earlier one fails, while the game played from the start does not
+    blackjack_game = Blackjack(min_bet=10, max_bet=500)
+    blackjack_game.add_player(player=Player(name='Player 1', min_bet=10, bankroll=50))
+    blackjack_game.add_player(
+        player=CardCounter(
+            name='Player 2',
+            bankroll=100,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={
+                1: 15,
+                2: 20,
+                3: 40,
+                4: 50,
+                5: 70
+            },
+            insurance=3
+        )
+    )
+    blackjack_game.add_player(
+        player=BackCounter(
+            name='Player 3',
+            bankroll=100,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={
+                1: 15,
+                2: 20,
+                3: 40,
+                4: 50,
+                5: 70
+            },
+            insurance=3,
+            entry_point=1,
+            exit_point=0
+        )
+    )
+    return blackjack_game
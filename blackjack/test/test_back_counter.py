@@ -112,3 +112,14 @@ def test_is_seated(back_counter):
     assert back_counter.is_seated
     back_counter.is_seated = False
     assert not back_counter.is_seated
+
+
+def test_definition(back_counter):
+    """
+    Tests the definition property within the BackCounter class
+    by re-creating a back counter from its definition.
+
+    """
+    back_counter.adjust_bankroll(amount=-100)
+    assert back_counter.definition['bankroll'] == back_counter.initial_bankroll
+    assert BackCounter(**back_counter.definition).definition == back_counter.definition
@@ -0,0 +1,663 @@
+import os
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.cache import SimulationCache
+from blackjack.cards import RANKS
+from blackjack.checkpoint import Checkpoint
+from blackjack.enums import StatsCategory
+from blackjack.player import Player
+from blackjack.shoe import ArrayShoe, CompositionShoe, CSMShoe, InfiniteShoe, PartialShuffleShoe, Shoe
+from blackjack.shoe_pool import PooledShoe, write_shoe_pool
+
+
+def test_players(blackjack_game):
+    """Tests the players method within the Blackjack class."""
+    assert [player.name for player in blackjack_game.players] == ['Player 1', 'Player 2']
+
+
+def test_simulate_invalid_penetration(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class
+    when the penetration is too deep.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(penetration=0.95, number_of_shoes=1, shoe_size=1, progress_bar=False)
+    assert str(e.value) == 'Penetration must be less than or equal to 0.9.'
+
+
+def test_simulate_invalid_workers(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class
+    when fewer than one worker is requested.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(penetration=0.75, number_of_shoes=1, shoe_size=1, progress_bar=False, workers=0)
+    assert str(e.value) == 'Number of workers must be at least 1.'
+
+
+def test_simulate(blackjack_game):
+    """Tests the simulate method within the Blackjack class."""
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=10, shoe_size=1, seed=1, progress_bar=False)
+    for player in blackjack_game.players:
+        summary = player.stats.summary(string=False)
+        assert summary[StatsCategory.TOTAL_ROUNDS_PLAYED.value] > 0
+        assert player.bankroll - 100000 == summary[StatsCategory.TOTAL_NET_WINNINGS.value]
+
+
+@pytest.mark.parametrize('test_executor', [False, True])
+def test_simulate_workers(thread_pool, blackjack_game, test_executor):
+    """
+    Tests the simulate method within the Blackjack class when
+    shoes are played by several workers and merged back.
+
+    """
+    blackjack_game.simulate(
+        penetration=0.75,
+        number_of_shoes=20,
+        shoe_size=1,
+        seed=1,
+        progress_bar=False,
+        workers=2,
+        executor=thread_pool if test_executor else None
+    )
+    player = blackjack_game.players[0]
+    summary = player.stats.summary(string=False)
+    assert 100 < summary[StatsCategory.TOTAL_ROUNDS_PLAYED.value] < 200
+    for player in blackjack_game.players:
+        summary = player.stats.summary(string=False)
+        assert player.bankroll - 100000 == summary[StatsCategory.TOTAL_NET_WINNINGS.value]
+
+
+def test_simulate_workers_reset_bankroll(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    shoes are played by several workers and bankrolls are reset.
+
+    """
+    blackjack_game.simulate(
+        penetration=0.75,
+        number_of_shoes=4,
+        shoe_size=1,
+        reset_bankroll=True,
+        progress_bar=False,
+        workers=2
+    )
+    assert all(player.bankroll == 100000 for player in blackjack_game.players)
+
+
+def test_simulate_workers_matches_serial(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when the
+    same seed is simulated serially and by several workers.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=2, seed=7, progress_bar=False)
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=2, seed=7, progress_bar=False, workers=3)
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
+
+
+@pytest.mark.parametrize('test_reset_bankroll', [False, True])
+@pytest.mark.parametrize('test_parallelism', ['workers', 'shared_memory', 'executor', 'threads'])
+def test_simulate_parallel_small_bankroll_matches_serial(monkeypatch, thread_pool, small_bankroll_game, test_reset_bankroll, test_parallelism):
+    """
+    Tests the simulate method within the Blackjack class when the
+    same seed is simulated serially and in parallel, and bankrolls
+    are small enough for players to run out of money.
+
+    """
+    monkeypatch.setattr('blackjack.blackjack._gil_enabled', lambda: False)
+    serial_game = small_bankroll_game._clone()
+    parameters = {
+        'penetration': 0.75,
+        'number_of_shoes': 40,
+        'shoe_size': 6,
+        'seed': 7,
+        'reset_bankroll': test_reset_bankroll,
+        'progress_bar': False
+    }
+    serial_game.simulate(**parameters)
+    small_bankroll_game.simulate(
+        **parameters,
+        **{
+            'workers': {'workers': 4},
+            'shared_memory': {'workers': 4, 'shared_memory': True},
+            'executor': {'workers': 2, 'executor': thread_pool},
+            'threads': {'threads': 4}
+        }[test_parallelism]
+    )
+    for serial_player, player in zip(serial_game.players, small_bankroll_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+    assert serial_game.rounds_played == small_bankroll_game.rounds_played
+
+
+def test_simulate_workers_failed_range(back_counter_game):
+    """
+    Tests the simulate method within the Blackjack class when a range
+    played by a worker from the wrong bankrolls fails, and is played
+    again from the bankrolls the shoes before it left.
+
+    """
+    serial_game = back_counter_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=1, seed=3, progress_bar=False)
+    back_counter_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=1, seed=3, progress_bar=False, workers=2)
+    for serial_player, player in zip(serial_game.players, back_counter_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_rounds_played(back_counter_game):
+    """
+    Tests the rounds_played method within the Blackjack class when
+    no single player plays every round that is dealt.
+
+    """
+    back_counter_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=1, seed=3, progress_bar=False)
+    assert back_counter_game.rounds_played == 12
+    assert max(player.stats.summary(string=False)[StatsCategory.TOTAL_ROUNDS_PLAYED.value] for player in back_counter_game.players) == 10
+
+
+def test_simulate_shoe_type(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when shoes are
+    dealt from a re-used, partially shuffled shoe and from a new Shoe each time.
+
+    """
+    shoe_game = Blackjack(min_bet=10, max_bet=500, shoe_type=Shoe)
+    for player in blackjack_game._clone().players:
+        shoe_game.add_player(player=player)
+    assert blackjack_game.shoe_type is PartialShuffleShoe
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=10, shoe_size=2, seed=6, progress_bar=False)
+    shoe_game.simulate(penetration=0.75, number_of_shoes=10, shoe_size=2, seed=6, progress_bar=False)
+    for player, shoe_player in zip(blackjack_game.players, shoe_game.players):
+        assert player.stats.stats == shoe_player.stats.stats
+        assert player.bankroll == shoe_player.bankroll
+
+
+def test_simulate_composition_shoe(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    cards are drawn from the composition of the shoe.
+
+    """
+    games = [Blackjack(min_bet=10, max_bet=500, shoe_type=CompositionShoe) for _ in range(2)]
+    for game in games:
+        for player in blackjack_game._clone().players:
+            game.add_player(player=player)
+        game.simulate(penetration=0.75, number_of_shoes=5, shoe_size=2, seed=6, progress_bar=False)
+    for player, other_player in zip(games[0].players, games[1].players):
+        assert player.stats.stats == other_player.stats.stats
+        assert player.stats.summary(string=False)[StatsCategory.TOTAL_ROUNDS_PLAYED.value] > 0
+
+
+def test_init_invalid_random_generator():
+    """
+    Tests the __init__ method within the Blackjack class when an unknown
+    random generator, or one an ArrayShoe cannot use, is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        Blackjack(min_bet=10, max_bet=500, random_generator='xorshift')
+    assert str(e.value) == 'Random generator must be one of stdlib, pcg64, philox, counter.'
+    with pytest.raises(ValueError) as e:
+        Blackjack(min_bet=10, max_bet=500, shoe_type=ArrayShoe, random_generator='counter')
+    assert str(e.value) == 'ArrayShoe cannot shuffle batches of shoes with the counter random generator.'
+
+
+def test_simulate_rounds_per_shoe(thread_pool, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when every
+    shoe of a continuous shuffling machine is played for a number of
+    rounds, including when the shoes are split between workers.
+
+    """
+    games = [Blackjack(min_bet=10, max_bet=500, shoe_type=CSMShoe) for _ in range(2)]
+    for game in games:
+        for player in blackjack_game._clone().players:
+            game.add_player(player=player)
+    games[0].simulate(penetration=0.75, number_of_shoes=4, shoe_size=2, seed=3, progress_bar=False, rounds_per_shoe=25)
+    games[1].simulate(
+        penetration=0.75,
+        number_of_shoes=4,
+        shoe_size=2,
+        seed=3,
+        progress_bar=False,
+        rounds_per_shoe=25,
+        workers=2,
+        executor=thread_pool
+    )
+    for player, copied_player in zip(*(game.players for game in games)):
+        assert player.stats.stats == copied_player.stats.stats
+    assert games[0].players[0].stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 100
+
+    # a shoe with a cut card stops at whichever comes first
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=4, shoe_size=8, seed=3, progress_bar=False, rounds_per_shoe=5)
+    assert blackjack_game.players[0].stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 20
+
+
+@pytest.mark.parametrize(
+    'test_rounds_per_shoe, expected',
+    [
+        (None, 'A number of rounds per shoe is required to simulate a shoe without a cut card.'),
+        (0, 'Number of rounds per shoe must be at least 1.')
+    ]
+)
+def test_simulate_rounds_per_shoe_invalid(test_rounds_per_shoe, expected):
+    """
+    Tests the simulate method within the Blackjack class when
+    an invalid number of rounds per shoe is provided.
+
+    """
+    blackjack = Blackjack(min_bet=10, max_bet=500, shoe_type=CSMShoe)
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(penetration=0.75, number_of_shoes=1, shoe_size=2, progress_bar=False, rounds_per_shoe=test_rounds_per_shoe)
+    assert str(e.value) == expected
+
+
+def test_simulate_infinite_deck():
+    """
+    Tests the simulate method within the Blackjack class when
+    the cards are drawn from an infinite deck.
+
+    """
+    games = [Blackjack(min_bet=10, max_bet=500), Blackjack(min_bet=10, max_bet=500, shoe_type=InfiniteShoe)]
+    for game in games:
+        game.add_player(player=Player(name='Player 1', bankroll=1000, min_bet=10))
+        game.add_player(player=Player(name='Player 2', bankroll=1000, min_bet=20))
+    games[0].simulate(penetration=0.75, number_of_shoes=3, shoe_size=8, seed=2, progress_bar=False, rounds_per_shoe=20, infinite_deck=True)
+    games[1].simulate(penetration=0.75, number_of_shoes=3, shoe_size=8, seed=2, progress_bar=False, rounds_per_shoe=20)
+    assert games[0].shoe_type is PartialShuffleShoe
+    for player, expected_player in zip(*(game.players for game in games)):
+        assert player.stats.stats == expected_player.stats.stats
+        assert player.bankroll == expected_player.bankroll
+    assert games[0].players[0].stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 60
+
+
+@pytest.mark.parametrize(
+    'test_rules, test_bankroll, test_reset_bankroll',
+    [
+        ({}, 100000, False),
+        ({'s17': False, 'double_after_split': True, 'resplit_aces': True, 'late_surrender': False}, 100000, False),
+        ({'blackjack_payout': 1.2, 'max_hands': 2, 'double_down': False}, 100000, False),
+        ({}, 200, False),
+        ({}, 200, True)
+    ]
+)
+def test_simulate_infinite_shoe_matches_play_round(monkeypatch, thread_pool, test_rules, test_bankroll, test_reset_bankroll):
+    """
+    Tests the simulate method within the Blackjack class when players
+    who flat bet are dealt from an infinite deck, whose shoes are played
+    the same as if every round were played by play_round.
+
+    """
+    games = [Blackjack(min_bet=10, max_bet=500, shoe_type=InfiniteShoe, **test_rules) for _ in range(3)]
+    for game in games:
+        game.add_player(player=Player(name='Player 1', bankroll=test_bankroll, min_bet=10))
+        game.add_player(player=Player(name='Player 2', bankroll=test_bankroll, min_bet=25))
+    parameters = {
+        'penetration': 0.75,
+        'number_of_shoes': 30,
+        'shoe_size': 8,
+        'seed': 5,
+        'progress_bar': False,
+        'rounds_per_shoe': 30,
+        'reset_bankroll': test_reset_bankroll
+    }
+    games[0].simulate(**parameters)
+    games[1].simulate(**parameters, workers=2, executor=thread_pool)
+    # the shoe is not recognised as infinite, so every round is played by play_round
+    monkeypatch.setattr('blackjack.blackjack.InfiniteShoe', type('FiniteShoe', (), {}))
+    games[2].simulate(**parameters)
+    for game in games[:2]:
+        assert game.rounds_played == games[2].rounds_played
+        for player, expected_player in zip(game.players, games[2].players):
+            assert player.stats.summary(string=False) == expected_player.stats.summary(string=False)
+            assert player.bankroll == expected_player.bankroll
+
+
+def test_simulate_infinite_deck_invalid(tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when an
+    infinite deck is requested for a game that cannot use one.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(penetration=0.75, number_of_shoes=1, shoe_size=8, progress_bar=False, rounds_per_shoe=20, infinite_deck=True)
+    assert str(e.value) == 'An infinite deck can only be simulated with players who flat bet.'
+
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=Player(name='Player 1', bankroll=1000, min_bet=10))
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(penetration=0.75, number_of_shoes=1, shoe_size=8, progress_bar=False, infinite_deck=True)
+    assert str(e.value) == 'A number of rounds per shoe is required to simulate a shoe without a cut card.'
+
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(
+            penetration=0.75,
+            number_of_shoes=1,
+            shoe_size=8,
+            progress_bar=False,
+            rounds_per_shoe=20,
+            infinite_deck=True,
+            checkpoint=Checkpoint(path=tmp_path / 'checkpoint', every_shoes=1)
+        )
+    assert str(e.value) == 'Cannot checkpoint a simulation of an infinite deck.'
+
+    write_shoe_pool(path=tmp_path / 'shoes.bin', number_of_shoes=1, shoe_size=8, seed=1)
+    blackjack = Blackjack(min_bet=10, max_bet=500, shoe_pool=tmp_path / 'shoes.bin')
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(penetration=0.75, number_of_shoes=1, shoe_size=8, progress_bar=False, rounds_per_shoe=20, infinite_deck=True)
+    assert str(e.value) == 'Cannot deal an infinite deck from a shoe pool.'
+
+
+def test_simulate_shoe_pool(tmp_path, thread_pool, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when the cards
+    are dealt from a shoe pool, which replays the shoes of a simulation
+    with the pool's seed, including when the shoes are split between workers.
+
+    """
+    write_shoe_pool(path=tmp_path / 'shoes.bin', number_of_shoes=8, shoe_size=2, seed=5)
+    games = [Blackjack(min_bet=10, max_bet=500, shoe_pool=tmp_path / 'shoes.bin') for _ in range(2)]
+    for game in games:
+        for player in blackjack_game._clone().players:
+            game.add_player(player=player)
+    games[0].simulate(penetration=0.75, number_of_shoes=6, shoe_size=2, first_shoe=2, progress_bar=False)
+    games[1].simulate(
+        penetration=0.75,
+        number_of_shoes=6,
+        shoe_size=2,
+        first_shoe=2,
+        progress_bar=False,
+        workers=2,
+        executor=thread_pool
+    )
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=6, shoe_size=2, seed=5, first_shoe=2, progress_bar=False)
+    assert isinstance(games[0]._shoe, PooledShoe)
+    for game in games:
+        for player, expected_player in zip(game.players, blackjack_game.players):
+            assert player.stats.stats == expected_player.stats.stats
+            assert player.bankroll == expected_player.bankroll
+
+
+@pytest.mark.parametrize(
+    'test_shoe_size, test_first_shoe, expected',
+    [
+        (1, 0, 'Shoe size must be 2 to deal from the shoe pool.'),
+        (2, 1, 'Shoe pool only holds 4 shoes.')
+    ]
+)
+def test_simulate_shoe_pool_invalid(tmp_path, test_shoe_size, test_first_shoe, expected):
+    """
+    Tests the simulate method within the Blackjack class when
+    the shoes simulated are not all in the shoe pool.
+
+    """
+    write_shoe_pool(path=tmp_path / 'shoes.bin', number_of_shoes=4, shoe_size=2, seed=5)
+    blackjack = Blackjack(min_bet=10, max_bet=500, shoe_pool=tmp_path / 'shoes.bin')
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(penetration=0.75, number_of_shoes=4, shoe_size=test_shoe_size, first_shoe=test_first_shoe, progress_bar=False)
+    assert str(e.value) == expected
+
+
+def test_simulate_playing_strategy(tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when the
+    players follow a strategy loaded from a file, which plays the
+    same as basic strategy when it holds the same decisions.
+
+    """
+    playing_strategy = blackjack_game.playing_strategy
+    lines = [','.join(['table', 'hand', *RANKS])]
+    for total in range(4, 22):
+        lines.append(','.join(['hard', str(total), *(playing_strategy.hard(total=total, dealer_up_card=up) for up in RANKS)]))
+    for total in range(12, 22):
+        lines.append(','.join(['soft', str(total), *(playing_strategy.soft(total=total, dealer_up_card=up) for up in RANKS)]))
+    for rank in RANKS:
+        lines.append(','.join(['pair', rank, *(playing_strategy.pair(card=rank, dealer_up_card=up) for up in RANKS)]))
+    (tmp_path / 'strategy.csv').write_text('\n'.join(lines))
+
+    game = Blackjack(min_bet=10, max_bet=500, playing_strategy=tmp_path / 'strategy.csv')
+    for player in blackjack_game._clone().players:
+        game.add_player(player=player)
+    game.simulate(penetration=0.75, number_of_shoes=5, shoe_size=2, seed=3, progress_bar=False)
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=5, shoe_size=2, seed=3, progress_bar=False)
+    assert game.playing_strategy.digest is not None
+    for player, expected_player in zip(game.players, blackjack_game.players):
+        assert player.stats.stats == expected_player.stats.stats
+        assert player.bankroll == expected_player.bankroll
+
+
+def test_simulate_random_generator(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    shoes are shuffled with the counter-based random generator.
+
+    """
+    games = [Blackjack(min_bet=10, max_bet=500, random_generator=random_generator) for random_generator in ['counter', 'counter', 'stdlib']]
+    for game in games:
+        for player in blackjack_game._clone().players:
+            game.add_player(player=player)
+        game.simulate(penetration=0.75, number_of_shoes=5, shoe_size=2, seed=6, progress_bar=False)
+    assert games[0].players[0].stats.stats == games[1].players[0].stats.stats
+    assert games[0].players[0].stats.stats != games[2].players[0].stats.stats
+
+
+def test_simulate_first_shoe(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when a
+    simulation is split into two ranges of shoes.
+
+    """
+    split_game = blackjack_game._clone()
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=10, shoe_size=1, seed=3, progress_bar=False)
+    split_game.simulate(penetration=0.75, number_of_shoes=4, shoe_size=1, seed=3, progress_bar=False)
+    split_game.simulate(penetration=0.75, number_of_shoes=6, shoe_size=1, seed=3, progress_bar=False, first_shoe=4)
+    for player, split_player in zip(blackjack_game.players, split_game.players):
+        assert player.stats.stats == split_player.stats.stats
+
+
+def test_simulate_workers_shared_memory(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    workers accumulate stats in shared memory.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=12, shoe_size=2, seed=5, progress_bar=False)
+    blackjack_game.simulate(
+        penetration=0.75,
+        number_of_shoes=12,
+        shoe_size=2,
+        seed=5,
+        progress_bar=False,
+        workers=2,
+        shared_memory=True
+    )
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_simulate_invalid_threads(blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class
+    when threads and worker processes are both requested.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(penetration=0.75, number_of_shoes=1, shoe_size=1, progress_bar=False, workers=2, threads=2)
+    assert str(e.value) == 'Cannot simulate with both threads and worker processes.'
+
+
+@pytest.mark.parametrize('test_gil_enabled', [True, False])
+def test_simulate_threads(monkeypatch, blackjack_game, test_gil_enabled):
+    """
+    Tests the simulate method within the Blackjack class when shoes
+    are played by threads on a free-threaded build of CPython, or
+    serially on a build with the GIL.
+
+    """
+    monkeypatch.setattr('blackjack.blackjack._gil_enabled', lambda: test_gil_enabled)
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=12, shoe_size=2, seed=9, progress_bar=False)
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=12, shoe_size=2, seed=9, progress_bar=False, threads=4)
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_simulate_checkpoint_shared_memory(tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when a
+    checkpoint is requested along with shared memory.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(
+            penetration=0.75,
+            number_of_shoes=1,
+            shoe_size=1,
+            progress_bar=False,
+            workers=2,
+            shared_memory=True,
+            checkpoint=Checkpoint(path=tmp_path / 'checkpoint', every_shoes=1)
+        )
+    assert str(e.value) == 'Cannot checkpoint a simulation that accumulates stats in shared memory.'
+
+
+def test_resume(monkeypatch, tmp_path, blackjack_game):
+    """
+    Tests the resume method within the Blackjack class when a
+    simulation dies part way through.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=10, shoe_size=1, seed=8, progress_bar=False)
+
+    play_shoe = Blackjack._play_shoe
+    shoes_played = []
+
+    def _play_shoe_then_die(self, **kwargs):
+        if len(shoes_played) == 7:
+            raise KeyboardInterrupt
+        shoes_played.append(kwargs['seed'])
+        play_shoe(self, **kwargs)
+
+    monkeypatch.setattr(Blackjack, '_play_shoe', _play_shoe_then_die)
+    with pytest.raises(KeyboardInterrupt):
+        blackjack_game.simulate(
+            penetration=0.75,
+            number_of_shoes=10,
+            shoe_size=1,
+            seed=8,
+            progress_bar=False,
+            checkpoint=Checkpoint(path=tmp_path / 'checkpoint', every_shoes=3)
+        )
+    monkeypatch.setattr(Blackjack, '_play_shoe', play_shoe)
+
+    assert Checkpoint.load(path=tmp_path / 'checkpoint')['shoe_ranges'] == [range(6, 10)]
+    resumed_game = Blackjack.resume(path=tmp_path / 'checkpoint', progress_bar=False)
+    assert Checkpoint.load(path=tmp_path / 'checkpoint')['shoe_ranges'] == []
+    for serial_player, player in zip(serial_game.players, resumed_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_resume_workers(monkeypatch, tmp_path, thread_pool, blackjack_game):
+    """
+    Tests the resume method within the Blackjack class from a
+    checkpoint taken while workers still had shoes in flight.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=1, seed=8, progress_bar=False)
+
+    save = Checkpoint.save
+
+    def _save_first_checkpoint(self, state):
+        save(self, state=state)
+        if not (tmp_path / 'first_checkpoint').exists():
+            (tmp_path / 'first_checkpoint').write_bytes((tmp_path / 'checkpoint').read_bytes())
+
+    monkeypatch.setattr(Checkpoint, 'save', _save_first_checkpoint)
+    blackjack_game.simulate(
+        penetration=0.75,
+        number_of_shoes=20,
+        shoe_size=1,
+        seed=8,
+        progress_bar=False,
+        workers=2,
+        executor=thread_pool,
+        checkpoint=Checkpoint(path=tmp_path / 'checkpoint', every_shoes=2)
+    )
+    monkeypatch.setattr(Checkpoint, 'save', save)
+
+    assert sum(len(shoe_range) for shoe_range in Checkpoint.load(path=tmp_path / 'first_checkpoint')['shoe_ranges']) > 0
+    resumed_game = Blackjack.resume(path=tmp_path / 'first_checkpoint', progress_bar=False, workers=2)
+    for serial_player, player, resumed_player in zip(serial_game.players, blackjack_game.players, resumed_game.players):
+        assert serial_player.stats.stats == player.stats.stats == resumed_player.stats.stats
+        assert serial_player.bankroll == player.bankroll == resumed_player.bankroll
+
+
+def test_simulate_cache(monkeypatch, tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    the results of the simulation are already cached.
+
+    """
+    cached_game = blackjack_game._clone()
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=8, shoe_size=1, seed=4, progress_bar=False, cache=SimulationCache(directory=tmp_path))
+
+    def _play_shoe(self, **kwargs):
+        raise AssertionError('Cached shoes should not be simulated.')
+
+    monkeypatch.setattr(Blackjack, '_play_shoe', _play_shoe)
+    cached_game.simulate(penetration=0.75, number_of_shoes=8, shoe_size=1, seed=4, progress_bar=False, cache=SimulationCache(directory=tmp_path))
+    for player, cached_player in zip(blackjack_game.players, cached_game.players):
+        assert player.stats.stats == cached_player.stats.stats
+        assert player.bankroll == cached_player.bankroll
+
+
+def test_simulate_cache_extended(monkeypatch, tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    more shoes are simulated than are cached.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=12, shoe_size=1, seed=4, progress_bar=False)
+
+    cache = SimulationCache(directory=tmp_path)
+    blackjack_game._clone().simulate(penetration=0.75, number_of_shoes=5, shoe_size=1, seed=4, progress_bar=False, cache=cache)
+
+    play_shoe = Blackjack._play_shoe
+    shoes_played = []
+
+    def _count_shoes(self, **kwargs):
+        shoes_played.append(kwargs['seed'])
+        play_shoe(self, **kwargs)
+
+    monkeypatch.setattr(Blackjack, '_play_shoe', _count_shoes)
+    blackjack_game.simulate(penetration=0.75, number_of_shoes=12, shoe_size=1, seed=4, progress_bar=False, cache=cache)
+    assert len(shoes_played) == 7
+    assert cache.shoes_cached(key=next(iter(os.listdir(tmp_path)))) == [5, 12]
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_simulate_cache_without_seed(tmp_path, blackjack_game):
+    """
+    Tests the simulate method within the Blackjack class when
+    results are cached without a seed.
+
+    """
+    with pytest.raises(ValueError) as e:
+        blackjack_game.simulate(penetration=0.75, number_of_shoes=1, shoe_size=1, progress_bar=False, cache=SimulationCache(directory=tmp_path))
+    assert str(e.value) == 'A seed is required to cache the results of a simulation.'
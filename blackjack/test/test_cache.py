@@ -0,0 +1,53 @@
+import os
+from blackjack.cache import SimulationCache, simulation_key
+from blackjack.enums import StatsCategory
+from blackjack.shoe import CompositionShoe
+
+
+def test_simulation_key(blackjack_game):
+    """Tests the simulation_key function."""
+    kwargs = {
+        'rules': blackjack_game._rules,
+        'players': blackjack_game.players,
+        'penetration': 0.75,
+        'shoe_size': 6,
+        'seed': 1,
+        'reset_bankroll': False
+    }
+    key = simulation_key(**kwargs)
+    assert key == simulation_key(**kwargs)
+    assert key == simulation_key(**{**kwargs, 'players': blackjack_game._clone().players})
+    assert key != simulation_key(**{**kwargs, 'seed': 2})
+    assert key != simulation_key(**{**kwargs, 'first_shoe': 1})
+    assert key != simulation_key(**{**kwargs, 'rounds_per_shoe': 10})
+    assert key != simulation_key(**{**kwargs, 'players': blackjack_game.players[:1]})
+    assert key != simulation_key(**{**kwargs, 'shoe_type': CompositionShoe})
+    assert key != simulation_key(**{**kwargs, 'random_generator': 'counter'})
+    assert key != simulation_key(**{**kwargs, 'shoe_pool': 64 * '0'})
+    assert key != simulation_key(**{**kwargs, 'playing_strategy': 64 * '0'})
+
+    blackjack_game.players[0].adjust_bankroll(amount=10)
+    assert key != simulation_key(**kwargs)
+
+
+def test_load_empty(tmp_path):
+    """
+    Tests the load method within the SimulationCache
+    class when nothing is cached.
+
+    """
+    cache = SimulationCache(directory=tmp_path / 'cache')
+    assert cache.load(key='key', number_of_shoes=10) is None
+    assert cache.shoes_cached(key='key') == []
+
+
+def test_save_and_load(tmp_path):
+    """Tests the save and load methods within the SimulationCache class."""
+    cache = SimulationCache(directory=tmp_path)
+    cache.save(key='key', number_of_shoes=5, results=[({(None, StatsCategory.TOTAL_HANDS_PLAYED): 5}, 10)])
+    cache.save(key='key', number_of_shoes=20, results=[({(None, StatsCategory.TOTAL_HANDS_PLAYED): 20}, -5)])
+    assert cache.shoes_cached(key='key') == [5, 20]
+    assert cache.load(key='key', number_of_shoes=4) is None
+    assert cache.load(key='key', number_of_shoes=10) == (5, [({(None, StatsCategory.TOTAL_HANDS_PLAYED): 5}, 10)])
+    assert cache.load(key='key', number_of_shoes=50) == (20, [({(None, StatsCategory.TOTAL_HANDS_PLAYED): 20}, -5)])
+    assert sorted(os.listdir(tmp_path / 'key')) == ['20.pickle', '5.pickle']
@@ -0,0 +1,58 @@
+import os
+import pytest
+from blackjack.checkpoint import Checkpoint
+
+
+@pytest.mark.parametrize(
+    'test_every_shoes, test_every_seconds, expected',
+    [
+        (None, None, 'Checkpoints must be taken every number of shoes and/or seconds.'),
+        (0, None, 'Checkpoint interval must be greater than 0.'),
+        (None, 0, 'Checkpoint interval must be greater than 0.')
+    ]
+)
+def test_init_invalid_interval(tmp_path, test_every_shoes, test_every_seconds, expected):
+    """
+    Tests the __init__ method within the Checkpoint class
+    when an invalid interval is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        Checkpoint(path=tmp_path / 'checkpoint', every_shoes=test_every_shoes, every_seconds=test_every_seconds)
+    assert str(e.value) == expected
+
+
+def test_record_every_shoes(tmp_path):
+    """
+    Tests the record method within the Checkpoint class
+    when checkpoints are taken every number of shoes.
+
+    """
+    checkpoint = Checkpoint(path=tmp_path / 'checkpoint', every_shoes=3)
+    assert not checkpoint.record(number_of_shoes=1)
+    assert not checkpoint.record(number_of_shoes=1)
+    assert checkpoint.record(number_of_shoes=1)
+    checkpoint.save(state={})
+    assert not checkpoint.record(number_of_shoes=1)
+
+
+def test_record_every_seconds(monkeypatch, tmp_path):
+    """
+    Tests the record method within the Checkpoint class
+    when checkpoints are taken every number of seconds.
+
+    """
+    monkeypatch.setattr('time.monotonic', lambda: 100)
+    checkpoint = Checkpoint(path=tmp_path / 'checkpoint', every_seconds=60)
+    assert not checkpoint.record(number_of_shoes=1)
+    monkeypatch.setattr('time.monotonic', lambda: 160)
+    assert checkpoint.record(number_of_shoes=1)
+
+
+def test_save_and_load(tmp_path):
+    """Tests the save and load methods within the Checkpoint class."""
+    checkpoint = Checkpoint(path=tmp_path / 'checkpoint', every_shoes=1)
+    checkpoint.save(state={'shoe_ranges': [range(5, 10)]})
+    checkpoint.save(state={'shoe_ranges': [range(6, 10)]})
+    assert Checkpoint.load(path=checkpoint.path) == {'shoe_ranges': [range(6, 10)]}
+    assert os.listdir(tmp_path) == ['checkpoint']
@@ -0,0 +1,164 @@
+import csv
+import json
+import pytest
+from blackjack.cli import format_results, load_config, main, run
+from blackjack.config import create_blackjack
+from blackjack.shoe_pool import ShoePool
+
+
+CONFIG_TOML = '''
+[rules]
+min_bet = 10
+max_bet = 500
+
+[[players]]
+type = "Player"
+name = "Player 1"
+bankroll = 10000
+min_bet = 10
+
+[[players]]
+type = "BackCounter"
+name = "Player 2"
+bankroll = 10000
+min_bet = 10
+card_counting_system = "HI_LO"
+insurance = 3
+entry_point = 1
+exit_point = 0
+
+[players.bet_ramp]
+1 = 15
+2 = 20
+3 = 40
+
+[simulation]
+penetration = 0.75
+number_of_shoes = 5
+shoe_size = 1
+seed = 2
+'''
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text(CONFIG_TOML)
+    return path
+
+
+def test_load_config(tmp_path, config_path):
+    """Tests the load_config function for TOML and JSON configs."""
+    config = load_config(path=config_path)
+    assert config['players'][1]['bet_ramp'] == {'1': 15, '2': 20, '3': 40}
+    (tmp_path / 'config.json').write_text(json.dumps(config))
+    assert load_config(path=tmp_path / 'config.json') == config
+
+
+def test_run(config_path):
+    """
+    Tests the run function when the number of shoes and
+    seed in the config are overridden.
+
+    """
+    config = load_config(path=config_path)
+    results = run(config=config, number_of_shoes=3, seed=7, bench=True)
+    assert results['simulation']['number_of_shoes'] == 3
+    assert results['simulation']['seed'] == 7
+
+    blackjack = create_blackjack(config=config)
+    blackjack.simulate(penetration=0.75, number_of_shoes=3, shoe_size=1, seed=7, progress_bar=False)
+    assert results['bench']['rounds'] == blackjack.rounds_played
+    for player, player_results in zip(blackjack.players, results['players']):
+        assert player.stats.summary(string=False) == player_results['stats']
+        assert player.bankroll == player_results['bankroll']
+
+
+def test_run_config_workers(config_path):
+    """
+    Tests the run function when the config sets the number of workers and
+    the progress bar, which the arguments of the run take precedence over.
+
+    """
+    config = load_config(path=config_path)
+    config['simulation'] = {**config['simulation'], 'workers': 2, 'progress_bar': True}
+    assert run(config=config)['simulation']['workers'] == 2
+    results = run(config=config, workers=1, progress_bar=False)
+    assert results['simulation']['workers'] == 1
+    assert 'progress_bar' not in results['simulation']
+    assert run(config=load_config(path=config_path))['simulation']['workers'] == 1
+
+
+def test_run_without_seed(config_path):
+    """
+    Tests the run function when no seed is provided,
+    in which case the seed used is recorded in the results.
+
+    """
+    config = load_config(path=config_path)
+    del config['simulation']['seed']
+    results = run(config=config)
+    assert results == run(config=config, seed=results['simulation']['seed'])
+
+
+def test_format_results_csv(config_path):
+    """Tests the format_results function when the results are written as a CSV file."""
+    results = run(config=load_config(path=config_path))
+    rows = list(csv.DictReader(format_results(results=results, output_format='csv').splitlines()))
+    assert [row['name'] for row in rows] == ['Player 1', 'Player 2']
+    assert [row['type'] for row in rows] == ['Player', 'BackCounter']
+    assert int(rows[0]['TOTAL ROUNDS PLAYED']) == results['players'][0]['stats']['TOTAL ROUNDS PLAYED']
+
+
+def test_main(capsys, tmp_path, config_path):
+    """Tests the main function when the results are written to a file."""
+    main(['run', str(config_path), '--shoes', '2', '--output', str(tmp_path / 'results.json'), '--bench'])
+    results = json.loads((tmp_path / 'results.json').read_text())
+    assert results['simulation']['number_of_shoes'] == 2
+    assert 'rounds/sec' in capsys.readouterr().err
+
+
+def test_main_invalid_config(capsys, tmp_path):
+    """Tests the main function when the config cannot be used."""
+    (tmp_path / 'config.json').write_text(json.dumps({'players': []}))
+    with pytest.raises(SystemExit):
+        main(['run', str(tmp_path / 'config.json')])
+    assert 'Config must include the rules of the game.' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    'test_error, expected',
+    [
+        (KeyError('bet_ramp'), "Invalid config, missing 'bet_ramp'."),
+        (AttributeError("'int' object has no attribute 'items'"), "'int' object has no attribute 'items'")
+    ]
+)
+def test_main_config_errors(monkeypatch, capsys, config_path, test_error, expected):
+    """
+    Tests the main function when a config fails
+    while its game is created.
+
+    """
+    def _raise(config):
+        raise test_error
+
+    monkeypatch.setattr('blackjack.config.create_blackjack', _raise)
+    with pytest.raises(SystemExit):
+        main(['run', str(config_path)])
+    assert expected in capsys.readouterr().err
+
+
+def test_main_pool(capsys, tmp_path, config_path):
+    """
+    Tests the main function when a shoe pool is written,
+    and then dealt from by a config that names it.
+
+    """
+    main(['pool', str(tmp_path / 'shoes.bin'), '--shoes', '5', '--shoe-size', '1', '--seed', '2'])
+    assert 'Wrote 5 shoes of 1 decks' in capsys.readouterr().err
+    pool = ShoePool(path=tmp_path / 'shoes.bin')
+    assert (pool.number_of_shoes, pool.shoe_size, pool.seed) == (5, 1, 2)
+
+    config = load_config(path=config_path)
+    pooled_config = {**config, 'rules': {**config['rules'], 'shoe_pool': str(tmp_path / 'shoes.bin')}}
+    assert run(config=pooled_config)['players'] == run(config=config)['players']
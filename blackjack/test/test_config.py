@@ -0,0 +1,140 @@
+import pytest
+from blackjack.back_counter import BackCounter
+from blackjack.config import create_blackjack, create_player, simulation_parameters
+from blackjack.enums import CardCountingSystem, DeckEstimation
+from blackjack.shoe import CompositionShoe
+
+
+def test_create_player():
+    """
+    Tests the create_player function when bet ramp counts
+    and the card counting system are read from a config.
+
+    """
+    player = create_player(definition={
+        'type': 'BackCounter',
+        'name': 'Player 2',
+        'bankroll': 1000,
+        'min_bet': 10,
+        'card_counting_system': 'HALVES',
+        'bet_ramp': {'1': 15, '2.5': 20},
+        'insurance': None,
+        'deck_estimation': 'HALF DECK',
+        'entry_point': 1,
+        'exit_point': 0
+    })
+    assert isinstance(player, BackCounter)
+    assert player.card_counting_system == CardCountingSystem.HALVES
+    assert player.deck_estimation == DeckEstimation.HALF_DECK
+    assert player.bet_ramp[1] == 15
+    assert player.bet_ramp[2.5] == 20
+    assert create_player(definition={**player.definition, 'type': 'BackCounter'}).definition == player.definition
+
+
+@pytest.mark.parametrize(
+    'test_definition, expected',
+    [
+        ({'type': 'Dealer', 'name': 'Player 1'}, "Unknown player type 'Dealer'."),
+        (
+            {'type': 'CardCounter', 'name': 'Player 1', 'bankroll': 100, 'min_bet': 10, 'card_counting_system': 'RED 7', 'bet_ramp': {1: 10}},
+            "Unknown card counting system 'RED 7'."
+        ),
+        (
+            {
+                'type': 'CardCounter',
+                'name': 'Player 1',
+                'bankroll': 100,
+                'min_bet': 10,
+                'card_counting_system': 'HI_LO',
+                'bet_ramp': {1: 10},
+                'deck_estimation': 'EIGHTH DECK'
+            },
+            "Unknown deck estimation 'EIGHTH DECK'."
+        ),
+        (
+            {
+                'type': 'CardCounter',
+                'name': 'Player 1',
+                'bankroll': 100,
+                'min_bet': 10,
+                'card_counting_system': 'HI_LO',
+                'bet_ramp': [10, 20]
+            },
+            'Bet ramp must be a table of counts and wagers.'
+        ),
+        (
+            ['Player 1'],
+            'Each player must be a table of its parameters.'
+        )
+    ]
+)
+def test_create_player_invalid(test_definition, expected):
+    """
+    Tests the create_player function when an unknown player
+    type, card counting system or deck estimation is provided,
+    or the definition or its bet ramp is not a table.
+
+    """
+    with pytest.raises(ValueError) as e:
+        create_player(definition=test_definition)
+    assert str(e.value) == expected
+
+
+def test_create_blackjack(blackjack_game):
+    """Tests the create_blackjack function."""
+    blackjack = create_blackjack(config={
+        'rules': blackjack_game._rules.definition,
+        'players': [{'type': type(player).__name__, **player.definition} for player in blackjack_game.players]
+    })
+    assert blackjack._rules.definition == blackjack_game._rules.definition
+    assert [player.definition for player in blackjack.players] == [player.definition for player in blackjack_game.players]
+
+
+def test_simulation_parameters():
+    """Tests the simulation_parameters function."""
+    assert simulation_parameters(config={'simulation': {'number_of_shoes': 10, 'shoe_size': 6, 'seed': 1}}) == {
+        'penetration': 0.75,
+        'number_of_shoes': 10,
+        'shoe_size': 6,
+        'seed': 1,
+        'reset_bankroll': False,
+        'first_shoe': 0,
+        'rounds_per_shoe': None,
+        'infinite_deck': False
+    }
+    with pytest.raises(ValueError) as e:
+        simulation_parameters(config={'simulation': {'number_of_shoes': 10}})
+    assert str(e.value) == 'Config must include the shoe_size to simulate.'
+    with pytest.raises(ValueError) as e:
+        simulation_parameters(config={'simulation': [10, 6]})
+    assert str(e.value) == 'Simulation must be a table of its parameters.'
+
+
+def test_create_blackjack_shoe_type():
+    """
+    Tests the create_blackjack function when the rules
+    name the class of shoe cards are dealt from.
+
+    """
+    assert create_blackjack(config={'rules': {'min_bet': 10, 'max_bet': 500, 'shoe_type': 'CompositionShoe'}}).shoe_type is CompositionShoe
+    with pytest.raises(ValueError) as e:
+        create_blackjack(config={'rules': {'min_bet': 10, 'max_bet': 500, 'shoe_type': 'Deck'}})
+    assert str(e.value) == "Unknown shoe type 'Deck'."
+
+
+@pytest.mark.parametrize(
+    'test_config, expected',
+    [
+        ({'rules': ['min_bet', 10]}, 'Rules must be a table of their parameters.'),
+        ({'rules': {'min_bet': 10, 'max_bet': 500}, 'players': {'name': 'Player 1'}}, 'Players must be a list of player definitions.')
+    ]
+)
+def test_create_blackjack_invalid(test_config, expected):
+    """
+    Tests the create_blackjack function when the rules
+    or players of a config are not of the right type.
+
+    """
+    with pytest.raises(ValueError) as e:
+        create_blackjack(config=test_config)
+    assert str(e.value) == expected
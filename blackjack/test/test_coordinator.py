@@ -0,0 +1,196 @@
+import threading
+from multiprocessing.connection import Client
+import pytest
+from blackjack.coordinator import Coordinator
+from blackjack.worker import run_worker
+
+
+def _simulate_serially(blackjack_game, number_of_shoes, seed):
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=number_of_shoes, shoe_size=1, seed=seed, progress_bar=False)
+    return serial_game
+
+
+def _start_workers(coordinator, number_of_workers):
+    host, port = coordinator.address
+    threads = [
+        threading.Thread(target=run_worker, kwargs={'host': host, 'port': port, 'authkey': coordinator.authkey})
+        for _ in range(number_of_workers)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_init_invalid_penetration(blackjack_game):
+    """
+    Tests the __init__ method within the Coordinator class
+    when the penetration is too deep.
+
+    """
+    with pytest.raises(ValueError) as e:
+        Coordinator(blackjack=blackjack_game, penetration=0.95, number_of_shoes=1, shoe_size=1)
+    assert str(e.value) == 'Penetration must be less than or equal to 0.9.'
+
+
+def test_run(blackjack_game):
+    """
+    Tests the run method within the Coordinator class with
+    several workers on 127.0.0.1.
+
+    """
+    serial_game = _simulate_serially(blackjack_game=blackjack_game, number_of_shoes=30, seed=4)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=30, shoe_size=1, seed=4, workers=3) as coordinator:
+        threads = _start_workers(coordinator=coordinator, number_of_workers=3)
+        coordinator.run()
+        for thread in threads:
+            thread.join()
+    assert coordinator.shoes_remaining == 0
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_run_small_bankroll(small_bankroll_game):
+    """
+    Tests the run method within the Coordinator class when
+    bankrolls are small enough for players to run out of money.
+
+    """
+    serial_game = small_bankroll_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=40, shoe_size=6, seed=7, progress_bar=False)
+    with Coordinator(blackjack=small_bankroll_game, penetration=0.75, number_of_shoes=40, shoe_size=6, seed=7, workers=4) as coordinator:
+        threads = _start_workers(coordinator=coordinator, number_of_workers=4)
+        coordinator.run()
+        for thread in threads:
+            thread.join()
+    assert coordinator.shoes_remaining == 0
+    for serial_player, player in zip(serial_game.players, small_bankroll_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_run_failed_range(back_counter_game):
+    """
+    Tests the run method within the Coordinator class when a range
+    played by a worker from the wrong bankrolls fails, and is played
+    again by the coordinator.
+
+    """
+    serial_game = back_counter_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=1, seed=3, progress_bar=False)
+    with Coordinator(blackjack=back_counter_game, penetration=0.75, number_of_shoes=20, shoe_size=1, seed=3, workers=2) as coordinator:
+        threads = _start_workers(coordinator=coordinator, number_of_workers=2)
+        coordinator.run()
+        for thread in threads:
+            thread.join()
+    for serial_player, player in zip(serial_game.players, back_counter_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_run_range_error(monkeypatch, blackjack_game):
+    """
+    Tests the run method within the Coordinator class when a
+    range fails on the workers and again on the coordinator.
+
+    """
+    def _fail(**kwargs):
+        raise ValueError('Range failed.')
+
+    monkeypatch.setattr('blackjack.worker._play_shoes', _fail)
+    monkeypatch.setattr('blackjack.coordinator._play_shoes', _fail)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=4, shoe_size=1, seed=1) as coordinator:
+        _start_workers(coordinator=coordinator, number_of_workers=1)
+        with pytest.raises(ValueError) as e:
+            coordinator.run()
+    assert str(e.value) == 'Range failed.'
+
+
+def test_run_replay_unlocked(monkeypatch, blackjack_game):
+    """
+    Tests the run method within the Coordinator class when ranges
+    are played again by the coordinator without holding its lock.
+
+    """
+    from blackjack.blackjack import _play_shoes
+
+    def _fail(**kwargs):
+        raise ValueError('Range failed.')
+
+    def _try_lock():
+        acquired = coordinator._condition.acquire(blocking=False)
+        if acquired:
+            coordinator._condition.release()
+        locked.append(not acquired)
+
+    def _replay(**kwargs):
+        # the lock is tried from another thread, since the condition's lock is re-entrant
+        thread = threading.Thread(target=_try_lock)
+        thread.start()
+        thread.join()
+        return _play_shoes(**kwargs)
+
+    locked = []
+    serial_game = _simulate_serially(blackjack_game=blackjack_game, number_of_shoes=6, seed=2)
+    monkeypatch.setattr('blackjack.worker._play_shoes', _fail)
+    monkeypatch.setattr('blackjack.coordinator._play_shoes', _replay)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=6, shoe_size=1, seed=2) as coordinator:
+        _start_workers(coordinator=coordinator, number_of_workers=1)
+        coordinator.run()
+    assert locked and not any(locked)
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.summary(string=False) == player.stats.summary(string=False)
+        assert serial_player.bankroll == player.bankroll
+
+
+def test_accept_error(blackjack_game):
+    """
+    Tests the _accept method within the Coordinator class when
+    accepting a worker fails before the coordinator is closed.
+
+    """
+    serial_game = _simulate_serially(blackjack_game=blackjack_game, number_of_shoes=4, seed=3)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=4, shoe_size=1, seed=3) as coordinator:
+        accept = coordinator._listener.accept
+        errors = [OSError('Too many open files.')]
+
+        def _accept():
+            if errors:
+                raise errors.pop()
+            return accept()
+
+        coordinator._listener.accept = _accept
+        threads = _start_workers(coordinator=coordinator, number_of_workers=1)
+        coordinator.run()
+        for thread in threads:
+            thread.join()
+    assert not errors
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+
+
+def test_run_worker_dies(blackjack_game):
+    """
+    Tests the run method within the Coordinator class when a
+    worker disconnects while holding a range of shoes.
+
+    """
+    serial_game = _simulate_serially(blackjack_game=blackjack_game, number_of_shoes=10, seed=2)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=10, shoe_size=1, seed=2) as coordinator:
+        coordinator_thread = threading.Thread(target=coordinator.run)
+        coordinator_thread.start()
+
+        with Client(address=coordinator.address, family='AF_INET', authkey=coordinator.authkey) as connection:
+            assert connection.recv()[0] == 'job'
+            message, shoe_range = connection.recv()
+            assert message == 'range'
+            assert len(shoe_range) > 0
+
+        threads = _start_workers(coordinator=coordinator, number_of_workers=2)
+        coordinator_thread.join()
+        for thread in threads:
+            thread.join()
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
+        assert serial_player.bankroll == player.bankroll
@@ -1,15 +1,20 @@
+from blackjack.cards import CARD_CODES
+
+
 def test_hole_card(dealer_with_hand):
     """Tests the hole_card method within the Dealer class."""
-    assert dealer_with_hand.hole_card == '8'
+    assert dealer_with_hand.hole_card == CARD_CODES['8']
 
 
 def test_up_card(dealer_with_hand):
     """Tests the up_card method within the Dealer class."""
-    assert dealer_with_hand.up_card == '6'
+    assert dealer_with_hand.up_card == CARD_CODES['6']
 
 
 def test_reset_hand(dealer_with_hand):
     """Tests the reset_hand method within the Dealer class."""
     assert dealer_with_hand.hand.cards == ['8', '6']
+    hand = dealer_with_hand.hand
     dealer_with_hand.reset_hand()
     assert dealer_with_hand.hand.cards == []
+    assert dealer_with_hand.hand is hand
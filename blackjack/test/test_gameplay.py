@@ -1,13 +1,14 @@
 import pytest
-from blackjack.enums import StatsCategory
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem, DeckEstimation, StatsCategory
 from blackjack.gameplay import get_count, get_insurance_count
 from blackjack.gameplay import initialize_hands
 from blackjack.gameplay import player_initial_decision, player_plays_hands
 from blackjack.gameplay import dealer_turn, dealer_plays_hand, compare_hands
-from blackjack.gameplay import clear_hands, play_round
+from blackjack.gameplay import clear_hands, play_round, RoundState
 from blackjack.hand import HandStatus
 from blackjack.player import Player
-from blackjack.playing_strategy import PlayingStrategy
+from blackjack.playing_strategy import HIT, PlayingStrategy
 from blackjack.shoe import Shoe
 from blackjack.rules import Rules
 from blackjack.table import Table
@@ -29,6 +30,73 @@ def test_get_count(player, table, card_counter_unbalanced, back_counter):
     assert count_dict[card_counter_unbalanced] == -72
     assert count_dict[back_counter] == -10
 
+    # a dictionary re-used from the last round is cleared first
+    stale_player = CardCounter(
+        name='Player 4',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 15}
+    )
+    assert get_count(table=table, shoe=shoe, count_dict={stale_player: 3}) == count_dict
+
+
+def test_get_count_shared(monkeypatch, table, card_counter_unbalanced, back_counter):
+    """
+    Tests the get_count function, which only computes the count
+    of each card counting system once for every player using it.
+
+    """
+    shoe = Shoe(shoe_size=6)
+    calls = []
+    running_count = Shoe.running_count
+
+    def _record_running_count(self, card_counting_system):
+        calls.append(card_counting_system)
+        return running_count(self, card_counting_system=card_counting_system)
+
+    monkeypatch.setattr(Shoe, 'running_count', _record_running_count)
+    table.add_player(player=card_counter_unbalanced)
+    table.add_player(player=back_counter)
+    table.add_player(player=CardCounter(
+        name='Player 4',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.KO,
+        bet_ramp={1: 20}
+    ))
+    count_dict = get_count(table=table, shoe=shoe)
+    assert len(count_dict) == 3
+    assert calls == [CardCountingSystem.KO, CardCountingSystem.HI_LO]
+
+
+def test_get_count_deck_estimation(table):
+    """
+    Tests the get_count function when players using the same card counting
+    system estimate the number of decks remaining with different precisions.
+
+    """
+    shoe = Shoe(shoe_size=6)
+    for _ in range(226):
+        shoe.burn_card()
+    for _ in range(10):
+        shoe.add_to_seen_cards(card='2')
+    card_counters = [
+        CardCounter(
+            name=f'Player {number}',
+            bankroll=1000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={1: 20},
+            deck_estimation=deck_estimation
+        )
+        for number, deck_estimation in enumerate([DeckEstimation.FULL_DECK, DeckEstimation.HALF_DECK], 1)
+    ]
+    for card_counter in card_counters:
+        table.add_player(player=card_counter)
+    count_dict = get_count(table=table, shoe=shoe)
+    assert [count_dict[card_counter] for card_counter in card_counters] == [5, 7]
+
 
 def test_get_insurance_count(shoe, player, table, card_counter_balanced, card_counter_unbalanced, back_counter):
     """Tests the get_insurance_count function."""
@@ -51,8 +119,8 @@ def test_initialize_hands(player, dealer, shoe, table):
     """Tests the initialize_hands function."""
     table.add_player(player=player)
     initialize_hands(dealer=dealer, players=table.players, shoe=shoe)
-    assert player.get_first_hand().cards == ['A', 'Q']
-    assert dealer.hand.cards == ['K', 'J']
+    assert player.get_first_hand().cards == ['A', '10']
+    assert dealer.hand.cards == ['10', '10']
     assert shoe.seen_cards['A'] == 1
     assert shoe.seen_cards['10-J-Q-K'] == 2
 
@@ -64,7 +132,7 @@ def test_player_initial_decision_insufficient_bankroll_insurance(card_counter_un
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     card_counter_unbalanced_hand = card_counter_unbalanced.get_first_hand()
     card_counter_unbalanced_hand.add_card(card='5')
     card_counter_unbalanced_hand.add_card(card='6')
@@ -80,7 +148,7 @@ def test_player_initial_decision_insufficient_bankroll_insurance(card_counter_un
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert card_counter_unbalanced.bankroll == 0
     assert card_counter_unbalanced_hand.status == HandStatus.SETTLED
@@ -100,7 +168,7 @@ def test_player_initial_decision_insurance_dealer_blackjack(card_counter_unbalan
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     card_counter_unbalanced_hand = card_counter_unbalanced.get_first_hand()
     card_counter_unbalanced_hand.add_card(card='5')
     card_counter_unbalanced_hand.add_card(card='6')
@@ -116,7 +184,7 @@ def test_player_initial_decision_insurance_dealer_blackjack(card_counter_unbalan
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert card_counter_unbalanced.bankroll == 1000
     assert card_counter_unbalanced_hand.status == HandStatus.SETTLED
@@ -136,7 +204,7 @@ def test_player_initial_decision_insurance_player_blackjack_dealer_blackjack(car
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     card_counter_unbalanced_hand = card_counter_unbalanced.get_first_hand()
     card_counter_unbalanced_hand.add_card(card='K')
     card_counter_unbalanced_hand.add_card(card='A')
@@ -152,7 +220,7 @@ def test_player_initial_decision_insurance_player_blackjack_dealer_blackjack(car
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert card_counter_unbalanced.bankroll == 1010
     assert card_counter_unbalanced_hand.status == HandStatus.SETTLED
@@ -173,7 +241,7 @@ def test_player_initial_decision_insurance_no_dealer_blackjack(card_counter_unba
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     card_counter_unbalanced_hand = card_counter_unbalanced.get_first_hand()
     card_counter_unbalanced_hand.add_card(card='2')
     card_counter_unbalanced_hand.add_card(card='2')
@@ -189,8 +257,8 @@ def test_player_initial_decision_insurance_no_dealer_blackjack(card_counter_unba
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
-    ) == 'H'
+        compiled_strategy=compiled_strategy
+    ) == HIT
     assert card_counter_unbalanced.bankroll == 985
     assert card_counter_unbalanced_hand.status == HandStatus.IN_PLAY
     assert card_counter_unbalanced.stats.stats[(3, StatsCategory.AMOUNT_BET)] == 10
@@ -206,7 +274,7 @@ def test_player_initial_decision_no_insurance_dealer_blackjack(player, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='5')
     player_hand.add_card(card='6')
@@ -222,7 +290,7 @@ def test_player_initial_decision_no_insurance_dealer_blackjack(player, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.SETTLED
@@ -240,7 +308,7 @@ def test_player_initial_decision_no_insurance_no_dealer_blackjack(player, dealer
 
     """
     rules = Rules(min_bet=10, max_bet=500)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='2')
     player_hand.add_card(card='3')
@@ -256,8 +324,8 @@ def test_player_initial_decision_no_insurance_no_dealer_blackjack(player, dealer
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
-    ) == 'H'
+        compiled_strategy=compiled_strategy
+    ) == HIT
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.IN_PLAY
     assert player.stats.stats[(None, StatsCategory.DEALER_BLACKJACKS)] == 0
@@ -271,7 +339,7 @@ def test_player_initial_decision_player_blackjack(player, dealer, rules):
     blackjack and the dealer does not.
 
     """
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='A')
     player_hand.add_card(card='K')
@@ -287,7 +355,7 @@ def test_player_initial_decision_player_blackjack(player, dealer, rules):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert player.bankroll == 1015
     assert player_hand.status == HandStatus.SETTLED
@@ -305,7 +373,7 @@ def test_player_initial_decision_late_surrender(player, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, late_surrender=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='K')
     player_hand.add_card(card='5')
@@ -321,7 +389,7 @@ def test_player_initial_decision_late_surrender(player, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     ) is None
     assert player.bankroll == 995
     assert player_hand.status == HandStatus.SETTLED
@@ -339,7 +407,7 @@ def test_player_initial_decision_no_late_surrender(player, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, late_surrender=False)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='K')
     player_hand.add_card(card='5')
@@ -355,8 +423,8 @@ def test_player_initial_decision_no_late_surrender(player, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
-    ) == 'Rh'
+        compiled_strategy=compiled_strategy
+    ) == HIT
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.IN_PLAY
     assert player.stats.stats[(None, StatsCategory.PLAYER_SURRENDERS)] == 0
@@ -371,7 +439,7 @@ def test_player_plays_hands_initial_decision_settled(player, shoe, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, late_surrender=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='K')
     player_hand.add_card(card='5')
@@ -388,7 +456,7 @@ def test_player_plays_hands_initial_decision_settled(player, shoe, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert player.bankroll == 995
     assert player_hand.status == HandStatus.SETTLED
@@ -405,7 +473,7 @@ def test_player_plays_hands_split(shoe, dealer, player, rules):
     a pair and the hand is split.
 
     """
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='8')
     player_hand.add_card(card='8')
@@ -422,7 +490,7 @@ def test_player_plays_hands_split(shoe, dealer, player, rules):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert player.bankroll == 980
     assert player.number_of_hands == 2
@@ -431,7 +499,7 @@ def test_player_plays_hands_split(shoe, dealer, player, rules):
     assert player_hand.cards == ['8', 'A']
     assert player.hands[1].status == HandStatus.SHOWDOWN
     assert player.hands[1].total_bet == 10
-    assert player.hands[1].cards == ['8', 'K']
+    assert player.hands[1].cards == ['8', '10']
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == 0
     assert player.stats.stats[(None, StatsCategory.AMOUNT_BET)] == 20
 
@@ -442,7 +510,7 @@ def test_player_plays_hands_split_insufficient_bankroll(shoe, dealer, rules):
     a pair and the player has insufficient bankroll to split a hand.
 
     """
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player = Player(name='Player 1', min_bet=10, bankroll=10)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='6')
@@ -461,7 +529,7 @@ def test_player_plays_hands_split_insufficient_bankroll(shoe, dealer, rules):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert player.bankroll == 0
     assert player.number_of_hands == 1
@@ -478,7 +546,7 @@ def test_player_plays_hands_resplit_aces(player, shoe, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, resplit_aces=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='A')
     player_hand.add_card(card='A')
@@ -495,20 +563,20 @@ def test_player_plays_hands_resplit_aces(player, shoe, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.resplit_aces
     assert player.bankroll == 970
     assert player.number_of_hands == 3
     assert player_hand.status == HandStatus.SHOWDOWN
     assert player_hand.total_bet == 10
-    assert player_hand.cards == ['A', 'K']
+    assert player_hand.cards == ['A', '10']
     assert player.hands[1].status == HandStatus.SHOWDOWN
     assert player.hands[1].total_bet == 10
-    assert player.hands[1].cards == ['A', 'Q']
+    assert player.hands[1].cards == ['A', '10']
     assert player.hands[2].status == HandStatus.SHOWDOWN
     assert player.hands[2].total_bet == 10
-    assert player.hands[2].cards == ['A', 'J']
+    assert player.hands[2].cards == ['A', '10']
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == 0
     assert player.stats.stats[(None, StatsCategory.AMOUNT_BET)] == 30
 
@@ -521,7 +589,7 @@ def test_player_plays_hands_resplit_aces_insufficient_bankroll(shoe, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, resplit_aces=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player = Player(name='Player 1', min_bet=10, bankroll=20)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='A')
@@ -540,7 +608,7 @@ def test_player_plays_hands_resplit_aces_insufficient_bankroll(shoe, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.resplit_aces
     assert player.bankroll == 0
@@ -563,7 +631,7 @@ def test_player_plays_hands_resplit_aces_max_hands(player, shoe, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, resplit_aces=True, max_hands=3)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='A')
     player_hand.add_card(card='A')
@@ -581,7 +649,7 @@ def test_player_plays_hands_resplit_aces_max_hands(player, shoe, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.resplit_aces
     assert player.bankroll == 970
@@ -607,7 +675,7 @@ def test_player_plays_hands_resplit_aces_not_allowed(player, shoe, dealer):
 
     """
     rules = Rules(min_bet=10, max_bet=500, resplit_aces=False)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='A')
     player_hand.add_card(card='A')
@@ -624,7 +692,7 @@ def test_player_plays_hands_resplit_aces_not_allowed(player, shoe, dealer):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert not rules.resplit_aces
     assert player.bankroll == 980
@@ -634,7 +702,7 @@ def test_player_plays_hands_resplit_aces_not_allowed(player, shoe, dealer):
     assert player_hand.cards == ['A', 'A']
     assert player.hands[1].status == HandStatus.SHOWDOWN
     assert player.hands[1].total_bet == 10
-    assert player.hands[1].cards == ['A', 'K']
+    assert player.hands[1].cards == ['A', '10']
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == 0
     assert player.stats.stats[(None, StatsCategory.AMOUNT_BET)] == 20
 
@@ -646,7 +714,7 @@ def test_player_plays_hands_double_down(player, dealer, shoe):
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='5')
     player_hand.add_card(card='6')
@@ -663,7 +731,7 @@ def test_player_plays_hands_double_down(player, dealer, shoe):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.double_down
     assert player.bankroll == 980
@@ -682,7 +750,7 @@ def test_player_plays_hands_double_down_not_allowed(player, dealer, shoe):
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=False)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='5')
     player_hand.add_card(card='6')
@@ -699,12 +767,12 @@ def test_player_plays_hands_double_down_not_allowed(player, dealer, shoe):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert not rules.double_down
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.SETTLED
-    assert player_hand.cards == ['5', '6', 'A', 'K']
+    assert player_hand.cards == ['5', '6', 'A', '10']
     assert player_hand.total_bet == 10
     assert player.stats.stats[(None, StatsCategory.TOTAL_HANDS_PLAYED)] == 1
     assert player.stats.stats[(None, StatsCategory.PLAYER_HANDS_LOST)] == 1
@@ -720,7 +788,7 @@ def test_player_plays_hands_double_down_insufficient_bankroll(player, dealer, sh
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='5')
     player_hand.add_card(card='6')
@@ -738,13 +806,13 @@ def test_player_plays_hands_double_down_insufficient_bankroll(player, dealer, sh
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.double_down
     assert player.bankroll == 0
     assert player_hand.status == HandStatus.SETTLED
     assert player_hand.total_bet == 10
-    assert player_hand.cards == ['5', '6', 'A', 'K']
+    assert player_hand.cards == ['5', '6', 'A', '10']
     assert player.stats.stats[(None, StatsCategory.TOTAL_HANDS_PLAYED)] == 1
     assert player.stats.stats[(None, StatsCategory.PLAYER_HANDS_LOST)] == 1
     assert player.stats.stats[(None, StatsCategory.PLAYER_DOUBLE_DOWNS)] == 0
@@ -759,7 +827,7 @@ def test_player_plays_hands_double_after_split(player, dealer, shoe):
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=True, double_after_split=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='2')
     player_hand.add_card(card='2')
@@ -777,7 +845,7 @@ def test_player_plays_hands_double_after_split(player, dealer, shoe):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.double_after_split
     assert player.bankroll == 960
@@ -800,7 +868,7 @@ def test_player_plays_hands_double_after_split_not_allowed(player, dealer, shoe)
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=True, double_after_split=False)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='2')
     player_hand.add_card(card='2')
@@ -817,13 +885,13 @@ def test_player_plays_hands_double_after_split_not_allowed(player, dealer, shoe)
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert not rules.double_after_split
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.SHOWDOWN
     assert player_hand.total_bet == 10
-    assert player_hand.cards == ['2', '2', 'A', 'K']
+    assert player_hand.cards == ['2', '2', 'A', '10']
     assert player.stats.stats[(None, StatsCategory.PLAYER_DOUBLE_DOWNS)] == 0
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == 0
     assert player.stats.stats[(None, StatsCategory.AMOUNT_BET)] == 10
@@ -836,7 +904,7 @@ def test_player_plays_hands_double_after_split_insufficient_bankroll(player, dea
 
     """
     rules = Rules(min_bet=10, max_bet=500, double_down=True, double_after_split=True)
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='2')
     player_hand.add_card(card='2')
@@ -854,13 +922,13 @@ def test_player_plays_hands_double_after_split_insufficient_bankroll(player, dea
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert rules.double_after_split is True
     assert player.bankroll == 20
     assert player_hand.status == HandStatus.SHOWDOWN
     assert player_hand.total_bet == 10
-    assert player_hand.cards == ['2', '2', 'A', 'K']
+    assert player_hand.cards == ['2', '2', 'A', '10']
     assert player.stats.stats[(None, StatsCategory.PLAYER_DOUBLE_DOWNS)] == 0
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == 0
     assert player.stats.stats[(None, StatsCategory.AMOUNT_BET)] == 10
@@ -868,7 +936,7 @@ def test_player_plays_hands_double_after_split_insufficient_bankroll(player, dea
 
 def test_player_plays_hands_stand(player, dealer, shoe, rules):
     """Tests the player_plays_hands function when the player stands."""
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='6')
     player_hand.add_card(card='7')
@@ -885,7 +953,7 @@ def test_player_plays_hands_stand(player, dealer, shoe, rules):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.SHOWDOWN
@@ -896,7 +964,7 @@ def test_player_plays_hands_stand(player, dealer, shoe, rules):
 
 def test_player_plays_hands_busted(player, dealer, shoe, rules):
     """Tests the player_plays_hands function when the hand is busted."""
-    playing_strategy = PlayingStrategy(s17=rules.s17)
+    compiled_strategy = PlayingStrategy(s17=rules.s17).compile(rules=rules)
     player_hand = player.get_first_hand()
     player_hand.add_card(card='6')
     player_hand.add_card(card='7')
@@ -913,12 +981,12 @@ def test_player_plays_hands_busted(player, dealer, shoe, rules):
         dealer_hand_is_blackjack=dealer.hand.is_blackjack,
         dealer_up_card=dealer.up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        compiled_strategy=compiled_strategy
     )
     assert player.bankroll == 990
     assert player_hand.status == HandStatus.SETTLED
     assert player_hand.total > 21
-    assert player_hand.cards == ['6', '7', 'A', 'K']
+    assert player_hand.cards == ['6', '7', 'A', '10']
     assert player.stats.stats[(None, StatsCategory.TOTAL_HANDS_PLAYED)] == 1
     assert player.stats.stats[(None, StatsCategory.PLAYER_HANDS_LOST)] == 1
     assert player.stats.stats[(None, StatsCategory.NET_WINNINGS)] == -10
@@ -1315,14 +1383,20 @@ def test_play_round_player_removed(table, player, dealer, shoe, rules):
     assert player.stats.stats[(None, StatsCategory.TOTAL_ROUNDS_PLAYED)] == 0
 
 
-def test_play_round_add_and_remove_back_counters(table, dealer, player, rules, back_counter):
+@pytest.mark.parametrize('test_round_state', [False, True])
+def test_play_round_add_and_remove_back_counters(table, dealer, player, rules, back_counter, test_round_state):
     """
-    Tests the play_round function when a back counter
-    is added and removed from the table.
+    Tests the play_round function when a back counter is added and
+    removed from the table, with or without a compiled strategy and
+    the containers of the round re-used from one round to the next.
 
     """
     shoe = Shoe(shoe_size=1, penetration=0.75)
     playing_strategy = PlayingStrategy(s17=rules.s17)
+    round_parameters = {
+        'compiled_strategy': playing_strategy.compile(rules=rules),
+        'round_state': RoundState()
+    } if test_round_state else {'playing_strategy': playing_strategy}
     table.add_player(player=player)
     table.add_player(player=back_counter)
     for _ in range(0, 3):
@@ -1331,10 +1405,10 @@ def test_play_round_add_and_remove_back_counters(table, dealer, player, rules, b
     assert len(table.players) == 1
     count_round_1 = shoe.true_count(card_counting_system=back_counter.card_counting_system)
     assert count_round_1 >= back_counter.entry_point
-    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, playing_strategy=playing_strategy)
+    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, **round_parameters)
     assert len(table.players) == 2
     assert back_counter.stats.stats[(count_round_1, StatsCategory.TOTAL_ROUNDS_PLAYED)] == 1
-    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, playing_strategy=playing_strategy)
+    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, **round_parameters)
     assert len(table.players) == 1
     count_round_2 = shoe.true_count(card_counting_system=back_counter.card_counting_system)
     assert count_round_2 <= back_counter.exit_point
@@ -1,5 +1,7 @@
 import pytest
+from blackjack.cards import CARD_CODES
 from blackjack.enums import HandStatus
+from blackjack.hand import Hand
 
 
 def test_cards(hand_with_ace):
@@ -34,6 +36,21 @@ def test_add_cards(hand_with_ace):
     assert hand_with_ace.cards == ['A', '6']
     hand_with_ace.add_card(card='K')
     assert hand_with_ace.cards == ['A', '6', 'K']
+    hand_with_ace.add_card(card=CARD_CODES['Q'])
+    assert hand_with_ace.cards == ['A', '6', 'K', '10']
+
+
+def test_card_codes(hand_with_ace):
+    """
+    Tests the card_codes method within the Hand class, where
+    every ten-valued card has the same code.
+
+    """
+    hand_with_ace.add_card(card='K')
+    hand_with_ace.add_card(card=CARD_CODES['10'])
+    assert hand_with_ace.card_codes == [CARD_CODES['A'], CARD_CODES['6'], CARD_CODES['10'], CARD_CODES['10']]
+    assert hand_with_ace.total == 27
+    assert not hand_with_ace.is_soft
 
 
 def test_number_of_cards(hand_with_ace):
@@ -82,16 +99,96 @@ def test_is_busted(hand_without_ace):
     assert hand_without_ace.is_busted
 
 
+def test_is_busted_final_state(hand_without_ace):
+    """
+    Tests the is_busted method within the Hand class, where
+    a busted hand stays in its state as more cards are added.
+
+    """
+    hand_without_ace.add_card(card='5')
+    state = hand_without_ace.state
+    hand_without_ace.add_card(card='A')
+    assert hand_without_ace.state == state
+    assert hand_without_ace.total == 23
+
+
+@pytest.mark.parametrize(
+    'test_cards, expected',
+    [
+        (['7', '7'], '7'),
+        (['K', 'Q'], '10'),
+        (['A', 'A'], 'A'),
+        (['A', '6'], None),
+        (['7'], None),
+        (['7', '7', '7'], None)
+     ]
+)
+def test_pair_card(test_cards, expected):
+    """Tests the pair_card method within the Hand class."""
+    hand = Hand()
+    for card in test_cards:
+        hand.add_card(card=card)
+    assert hand.pair_card == (CARD_CODES[expected] if expected is not None else None)
+
+
 def test_split(hand_pair):
     """Tests the split method within the Hand class."""
     assert hand_pair.cards == ['7', '7']
     new_hand = hand_pair.split()
     assert hand_pair.cards == ['7']
     assert new_hand.cards == ['7']
+    assert hand_pair.state == new_hand.state
+    assert hand_pair.total == 7
     assert hand_pair.is_split
     assert not new_hand.is_split
 
 
+def test_split_face_cards():
+    """
+    Tests the split method within the Hand class when
+    the pair is of face cards, whose ranks are kept.
+
+    """
+    hand = Hand()
+    hand.add_card(card='J')
+    hand.add_card(card='Q')
+    new_hand = hand.split()
+    assert hand.cards == ['J']
+    assert new_hand.cards == ['Q']
+    assert hand.card_codes == new_hand.card_codes
+
+
+def test_split_new_hand(hand_pair, hand_with_ace):
+    """
+    Tests the split method within the Hand class when
+    a hand is provided to reuse for the split hand.
+
+    """
+    hand_with_ace.add_to_total_bet(amount=10)
+    hand_pair.add_to_total_bet(amount=20)
+    new_hand = hand_pair.split(new_hand=hand_with_ace)
+    assert new_hand is hand_with_ace
+    assert new_hand.cards == ['7']
+    assert new_hand.total_bet == 20
+    assert new_hand.was_split
+
+
+def test_reset(hand_pair):
+    """Tests the reset method within the Hand class."""
+    hand_pair.add_to_total_bet(amount=10)
+    hand_pair.split()
+    hand_pair.status = HandStatus.SETTLED
+    hand_pair.reset()
+    assert not hand_pair.cards
+    assert hand_pair.total == 0
+    assert hand_pair.total_bet == 0
+    hand_pair.add_card(card=CARD_CODES['J'])
+    assert hand_pair.cards == ['10']
+    assert hand_pair.status == HandStatus.IN_PLAY
+    assert not hand_pair.is_split
+    assert not hand_pair.was_split
+
+
 @pytest.mark.parametrize(
     'test_was_split, test_is_split, expected',
      [
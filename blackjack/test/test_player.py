@@ -1,5 +1,7 @@
 import pytest
+from blackjack.cards import CARD_CODES
 from blackjack.player import Player
+from blackjack.playing_strategy import SPLIT, SURRENDER
 
 
 def test_init_insufficient_bankroll():
@@ -133,7 +135,7 @@ def test_decision_busted(player, playing_strategy_s17):
     player_hand.add_card(card='K')
     player_hand.add_card(card='J')
     player_hand.add_card(card='2')
-    with pytest.raises(KeyError):
+    with pytest.raises(IndexError):
         player.decision(
             playing_strategy=playing_strategy_s17,
             hand=player_hand,
@@ -178,6 +180,31 @@ def test_decision_pair_insufficient_bankroll(player, playing_strategy_s17):
     ) == 'Rh'
 
 
+
+def test_action(player, playing_strategy_s17, rules):
+    """
+    Tests the action method within the Player class, which
+    only splits a pair the player can afford to split.
+
+    """
+    compiled_strategy = playing_strategy_s17.compile(rules=rules)
+    player_hand = player.get_first_hand()
+    player_hand.add_card(card='8')
+    player_hand.add_card(card='8')
+    assert player.action(
+        compiled_strategy=compiled_strategy,
+        hand=player_hand,
+        dealer_up_card=CARD_CODES['J'],
+        max_hands=4
+    ) == SPLIT
+    player_hand.add_to_total_bet(amount=2000)
+    assert player.action(
+        compiled_strategy=compiled_strategy,
+        hand=player_hand,
+        dealer_up_card=CARD_CODES['J'],
+        max_hands=4
+    ) == SURRENDER
+
 def test_reset_hands(player):
     """Tests the reset_hands method within the Player class."""
     player_hand = player.get_first_hand()
@@ -191,9 +218,31 @@ def test_reset_hands(player):
     assert player.number_of_hands == 2
     player.reset_hands()
     assert not player.get_first_hand().cards
+    assert player.get_first_hand() is player_hand
     assert player.number_of_hands == 1
 
 
+def test_split_hand(player):
+    """
+    Tests the split_hand method within the Player class, which
+    reuses the split hands of earlier rounds.
+
+    """
+    player_hand = player.get_first_hand()
+    player_hand.add_card(card='8')
+    player_hand.add_card(card='8')
+    player.split_hand(hand=player_hand)
+    split_hand = player.hands[1]
+    assert split_hand.cards == ['8']
+    assert split_hand.was_split
+    player.reset_hands()
+    player_hand.add_card(card='A')
+    player_hand.add_card(card='A')
+    player.split_hand(hand=player_hand)
+    assert player.hands[1] is split_hand
+    assert split_hand.cards == ['A']
+
+
 def test_reset_bankroll(player):
     """Tests the reset_bankroll method within the Player class."""
     assert player.bankroll == 1000
@@ -201,3 +250,9 @@ def test_reset_bankroll(player):
     assert player.bankroll == 500
     player.reset_bankroll()
     assert player.bankroll == 1000
+
+
+def test_definition(player):
+    """Tests the definition property within the Player class."""
+    player.adjust_bankroll(amount=-500)
+    assert player.definition == {'name': 'Player 1', 'bankroll': 1000, 'min_bet': 10}
@@ -1,3 +1,36 @@
+import json
+import shutil
+import pytest
+from blackjack.cards import CARD_CODES, RANKS
+from blackjack.hand import Hand
+from blackjack.playing_strategy import DOUBLE_OR_HIT, DOUBLE_OR_STAND, HIT, SPLIT, SPLIT_OR_HIT, STAND, SURRENDER
+from blackjack.playing_strategy import STRATEGY_ROWS, PlayingStrategy, load_playing_strategy
+from blackjack.rules import Rules
+
+
+def _state(*cards):
+    hand = Hand()
+    for card in cards:
+        hand.add_card(card=card)
+    return hand.state
+
+
+def _strategy_tables(playing_strategy):
+    # the decisions of a strategy as they are laid out in a strategy file
+    return {
+        'hard': {hand: [playing_strategy.hard(total=int(hand), dealer_up_card=up) for up in RANKS] for hand in STRATEGY_ROWS['hard']},
+        'soft': {hand: [playing_strategy.soft(total=int(hand), dealer_up_card=up) for up in RANKS] for hand in STRATEGY_ROWS['soft']},
+        'pair': {hand: [playing_strategy.pair(card=hand, dealer_up_card=up) for up in RANKS] for hand in STRATEGY_ROWS['pair']}
+    }
+
+
+def _strategy_csv(tables):
+    lines = [','.join(['table', 'hand', *RANKS])]
+    for table, rows in tables.items():
+        lines.extend(','.join([table, hand, *decisions]) for hand, decisions in rows.items())
+    return '\n'.join(lines) + '\n'
+
+
 def test_hard_h17(playing_strategy_h17):
     """
     Tests the hard method within the PlayingStrategy class
@@ -50,3 +83,190 @@ def test_pair_s17(playing_strategy_s17):
 
     """
     assert playing_strategy_s17.pair(card='8', dealer_up_card='A') == 'P'
+    assert playing_strategy_s17.pair(card='K', dealer_up_card='Q') == 'S'
+
+
+def test_compile(playing_strategy_s17, rules):
+    """
+    Tests the compile method within the PlayingStrategy class, which
+    only compiles a strategy once for the rules its tables depend on.
+
+    """
+    compiled_strategy = playing_strategy_s17.compile(rules=rules)
+    assert playing_strategy_s17.compile(rules=rules) is compiled_strategy
+    assert playing_strategy_s17.compile(rules=Rules(min_bet=10, max_bet=1000, max_hands=2)) is compiled_strategy
+    assert playing_strategy_s17.compile(rules=Rules(min_bet=10, max_bet=500, late_surrender=False)) is not compiled_strategy
+
+
+@pytest.mark.parametrize(
+    'double_down, split, cards, expected',
+    [
+        (True, False, ('6', '5'), DOUBLE_OR_HIT),
+        (False, False, ('6', '5'), HIT),
+        (True, False, ('4', '2', '5'), HIT),
+        (True, True, ('6', '5'), HIT),
+        (True, False, ('A', '8'), DOUBLE_OR_STAND),
+        (True, False, ('A', '4', '4'), STAND)
+    ]
+)
+def test_action_double(playing_strategy_h17, double_down, split, cards, expected):
+    """
+    Tests the action method within the CompiledStrategy class
+    when the strategy doubles down.
+
+    """
+    compiled_strategy = playing_strategy_h17.compile(rules=Rules(min_bet=10, max_bet=500, s17=False, double_down=double_down))
+    dealer_up_card = CARD_CODES['A'] if cards[0] != 'A' else CARD_CODES['6']
+    assert compiled_strategy.action(
+        hand_state=_state(*cards),
+        dealer_up_card=dealer_up_card,
+        split=split,
+        can_split=False
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    'late_surrender, split, cards, expected',
+    [
+        (True, False, ('10', '6'), SURRENDER),
+        (False, False, ('10', '6'), HIT),
+        (True, True, ('10', '6'), HIT),
+        (True, False, ('4', '2', '10'), HIT)
+    ]
+)
+def test_action_surrender(playing_strategy_s17, late_surrender, split, cards, expected):
+    """
+    Tests the action method within the CompiledStrategy class
+    when the strategy surrenders.
+
+    """
+    compiled_strategy = playing_strategy_s17.compile(rules=Rules(min_bet=10, max_bet=500, late_surrender=late_surrender))
+    assert compiled_strategy.action(
+        hand_state=_state(*cards),
+        dealer_up_card=CARD_CODES['10'],
+        split=split,
+        can_split=False
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    'double_after_split, can_split, expected',
+    [
+        (True, True, SPLIT_OR_HIT),
+        (False, True, HIT),
+        (True, False, HIT)
+    ]
+)
+def test_action_split(playing_strategy_s17, double_after_split, can_split, expected):
+    """
+    Tests the action method within the CompiledStrategy class
+    when the strategy splits if doubling after splitting is allowed.
+
+    """
+    compiled_strategy = playing_strategy_s17.compile(
+        rules=Rules(min_bet=10, max_bet=500, double_after_split=double_after_split)
+    )
+    assert compiled_strategy.action(
+        hand_state=_state('2', '2'),
+        dealer_up_card=CARD_CODES['2'],
+        split=False,
+        can_split=can_split
+    ) == expected
+    assert compiled_strategy.action(
+        hand_state=_state('8', '8'),
+        dealer_up_card=CARD_CODES['2'],
+        split=False,
+        can_split=True
+    ) == SPLIT
+
+
+def test_load_playing_strategy(tmp_path, playing_strategy_h17):
+    """
+    Tests the load_playing_strategy function, which compiles the
+    strategy of a CSV or JSON file into the same tables as basic
+    strategy and only loads a file's contents once.
+
+    """
+    tables = _strategy_tables(playing_strategy=playing_strategy_h17)
+    (tmp_path / 'strategy.csv').write_text(_strategy_csv(tables=tables))
+    (tmp_path / 'strategy.json').write_text(json.dumps(tables))
+    rules = Rules(min_bet=10, max_bet=500, s17=False, double_after_split=True)
+    expected = playing_strategy_h17.compile(rules=rules)._tables
+
+    playing_strategy = load_playing_strategy(path=tmp_path / 'strategy.csv')
+    assert playing_strategy.compile(rules=rules)._tables == expected
+    assert len(playing_strategy.digest) == 64
+    assert load_playing_strategy(path=tmp_path / 'strategy.json').compile(rules=rules)._tables == expected
+
+    shutil.copy(tmp_path / 'strategy.csv', tmp_path / 'copy.csv')
+    assert load_playing_strategy(path=tmp_path / 'copy.csv') is playing_strategy
+    assert PlayingStrategy(s17=False).digest is None
+
+
+def test_load_playing_strategy_custom(tmp_path, playing_strategy_s17):
+    """
+    Tests the load_playing_strategy function when the strategy
+    differs from basic strategy.
+
+    """
+    tables = _strategy_tables(playing_strategy=playing_strategy_s17)
+    tables['hard']['16'] = ['S'] * len(RANKS)
+    (tmp_path / 'strategy.csv').write_text(_strategy_csv(tables=tables))
+    playing_strategy = load_playing_strategy(path=tmp_path / 'strategy.csv')
+    assert playing_strategy.hard(total=16, dealer_up_card='10') == 'S'
+    assert playing_strategy.compile(rules=Rules(min_bet=10, max_bet=500)).action(
+        hand_state=_state('10', '6'),
+        dealer_up_card=CARD_CODES['10'],
+        split=False,
+        can_split=False
+    ) == STAND
+
+
+@pytest.mark.parametrize(
+    'test_change, expected',
+    [
+        (lambda tables: tables.pop('soft'), 'Strategy must include a soft table.'),
+        (lambda tables: tables.update(split={}), 'Strategy has unknown tables split.'),
+        (lambda tables: tables['hard'].pop('4'), 'Strategy hard table is missing a row for 4.'),
+        (lambda tables: tables['hard'].update({'22': tables['hard']['21']}), 'Strategy hard table has unknown rows 22.'),
+        (lambda tables: tables['pair']['A'].pop(), 'Strategy pair A must have a decision for each of 2, 3, 4, 5, 6, 7, 8, 9, 10, A.'),
+        (lambda tables: tables['soft']['18'].__setitem__(0, 'D'), "Strategy soft 18 has unknown decision 'D'."),
+        (lambda tables: tables['hard']['16'].__setitem__(0, 'P'), "Strategy hard 16 has unknown decision 'P'."),
+        (lambda tables: tables['pair']['8'].__setitem__(0, ['P']), "Strategy pair 8 has unknown decision ['P'].")
+    ]
+)
+def test_load_playing_strategy_invalid(tmp_path, playing_strategy_s17, test_change, expected):
+    """
+    Tests the load_playing_strategy function when the
+    strategy is not complete or has unknown decisions.
+
+    """
+    tables = _strategy_tables(playing_strategy=playing_strategy_s17)
+    test_change(tables)
+    (tmp_path / 'strategy.json').write_text(json.dumps(tables))
+    with pytest.raises(ValueError) as e:
+        load_playing_strategy(path=tmp_path / 'strategy.json')
+    assert str(e.value) == expected
+
+
+@pytest.mark.parametrize(
+    'test_contents, expected',
+    [
+        ('hard,4,H\n', 'Strategy CSV must start with the header table,hand,2,3,4,5,6,7,8,9,10,A.'),
+        (f'table,hand,{",".join(RANKS)}\nhard\n', 'Every row of a strategy CSV must name its table and hand.'),
+        (
+            f'table,hand,{",".join(RANKS)}\nhard,4,{",".join(["H"] * 10)}\nhard,4,{",".join(["H"] * 10)}\n',
+            'Strategy lists hard 4 more than once.'
+        )
+    ]
+)
+def test_load_playing_strategy_invalid_csv(tmp_path, test_contents, expected):
+    """
+    Tests the load_playing_strategy function when a
+    CSV file is not laid out as a strategy.
+
+    """
+    (tmp_path / 'strategy.csv').write_text(test_contents)
+    with pytest.raises(ValueError) as e:
+        load_playing_strategy(path=tmp_path / 'strategy.csv')
+    assert str(e.value) == expected
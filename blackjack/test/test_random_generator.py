@@ -0,0 +1,105 @@
+import random
+from collections import Counter
+import pytest
+from blackjack.random_generator import CounterGenerator, NumPyGenerator, StdlibGenerator, create_generator
+
+
+@pytest.fixture(params=['stdlib', 'counter', 'pcg64', 'philox'])
+def generator(request):
+    return create_generator(name=request.param, seed=1)
+
+
+def test_create_generator_invalid_name():
+    """Tests the create_generator function when an unknown name is provided."""
+    with pytest.raises(ValueError) as e:
+        create_generator(name='xorshift')
+    assert str(e.value) == 'Random generator must be one of stdlib, pcg64, philox, counter.'
+
+
+def test_seed(generator):
+    """Tests the seed method within every RandomGenerator class."""
+    first_integers = generator.integers_below(bounds=[52] * 10)
+    generator.seed(seed=1)
+    assert generator.integers_below(bounds=[52] * 10) == first_integers
+    generator.seed(seed=2)
+    assert generator.integers_below(bounds=[52] * 10) != first_integers
+
+
+def test_get_state_and_set_state(generator):
+    """Tests the get_state and set_state methods within every RandomGenerator class."""
+    generator.random()
+    state = generator.get_state()
+    integers = generator.integers_below(bounds=range(100, 1, -1))
+    number = generator.random()
+    generator.set_state(state=state)
+    assert generator.integers_below(bounds=range(100, 1, -1)) == integers
+    assert generator.random() == number
+
+
+def test_integers_below(generator):
+    """Tests the integers_below method within every RandomGenerator class."""
+    integers = generator.integers_below(bounds=[6] * 6000)
+    assert all(0 <= integer < 6 for integer in integers)
+    assert all(850 <= count <= 1150 for count in Counter(integers).values())
+    assert generator.integers_below(bounds=[]) == []
+
+
+def test_random(generator):
+    """Tests the random method within every RandomGenerator class."""
+    numbers = [generator.random() for _ in range(1000)]
+    assert all(0 <= number < 1 for number in numbers)
+    assert 0.45 < sum(numbers) / len(numbers) < 0.55
+
+
+def test_shuffle(generator):
+    """Tests the shuffle method within every RandomGenerator class."""
+    cards = list(range(52))
+    generator.shuffle(cards=cards)
+    assert sorted(cards) == list(range(52))
+    assert cards != list(range(52))
+
+
+def test_stdlib_generator_shuffle():
+    """
+    Tests the shuffle and swaps methods within the StdlibGenerator
+    class against random.shuffle with the same seed.
+
+    """
+    cards = list(range(52))
+    random.Random(5).shuffle(cards)
+    generator = StdlibGenerator(seed=5)
+    shuffled_cards = list(range(52))
+    generator.shuffle(cards=shuffled_cards)
+    assert shuffled_cards == cards
+
+    generator.seed(seed=5)
+    swapped_cards = list(range(52))
+    for i, j in zip(range(51, 0, -1), generator.swaps(start=51, stop=0)):
+        swapped_cards[i], swapped_cards[j] = swapped_cards[j], swapped_cards[i]
+    assert swapped_cards == cards
+
+
+def test_counter_generator_state():
+    """
+    Tests the state of the CounterGenerator class, which
+    is the key derived from the seed and a counter.
+
+    """
+    generator = CounterGenerator(seed=1)
+    key, counter = generator.get_state()
+    assert counter == 0
+    generator.integers_below(bounds=[2, 3])
+    assert generator.get_state() == (key, 2)
+    assert CounterGenerator(seed=1).get_state() == (key, 0)
+
+
+def test_numpy_generator_without_numpy(monkeypatch):
+    """
+    Tests the __init__ method within the NumPyGenerator
+    class when NumPy is not installed.
+
+    """
+    monkeypatch.setattr('blackjack.random_generator.np', None)
+    with pytest.raises(ModuleNotFoundError) as e:
+        NumPyGenerator(seed=1)
+    assert str(e.value) == 'NumPyGenerator requires NumPy, which can be installed with `pip install numpy`.'
@@ -67,3 +67,12 @@ def test_init_resplit_aces_invalid_max_hands():
     with pytest.raises(ValueError) as e:
         Rules(min_bet=10, max_bet=500, resplit_aces=True, max_hands=2)
     assert str(e.value) == 'Maximum hands must be greater than 2 if re-splitting aces is allowed.'
+
+
+def test_definition(rules):
+    """
+    Tests the definition property within the Rules class
+    by re-creating the rules from their definition.
+
+    """
+    assert Rules(**rules.definition).definition == rules.definition
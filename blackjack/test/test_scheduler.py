@@ -0,0 +1,68 @@
+import pytest
+from blackjack.scheduler import ShoeScheduler
+
+
+def test_init_invalid_workers():
+    """
+    Tests the __init__ method within the ShoeScheduler class
+    when fewer than one worker is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        ShoeScheduler(shoe_ranges=[range(10)], workers=0)
+    assert str(e.value) == 'Number of workers must be at least 1.'
+
+
+def test_next_range_covers_shoes():
+    """
+    Tests the next_range method within the ShoeScheduler class
+    hands out every shoe exactly once and in order.
+
+    """
+    scheduler = ShoeScheduler(shoe_ranges=[range(5, 105), range(200, 1100)], workers=4)
+    shoe_indices = []
+    while (shoe_range := scheduler.next_range()) is not None:
+        shoe_indices.extend(shoe_range)
+        scheduler.record(number_of_shoes=len(shoe_range), seconds=len(shoe_range) * 0.01)
+    assert shoe_indices == [*range(5, 105), *range(200, 1100)]
+    assert scheduler.remaining_shoes == 0
+    assert scheduler.remaining_ranges == []
+
+
+def test_chunk_size_initial():
+    """
+    Tests the chunk_size method within the ShoeScheduler class
+    before any shoes per second have been measured.
+
+    """
+    scheduler = ShoeScheduler(shoe_ranges=[range(1000)], workers=4, initial_chunk_size=3)
+    assert scheduler.shoes_per_second is None
+    assert scheduler.chunk_size() == 3
+
+
+def test_chunk_size_measured():
+    """
+    Tests the chunk_size method within the ShoeScheduler class
+    after shoes per second have been measured.
+
+    """
+    scheduler = ShoeScheduler(shoe_ranges=[range(10000)], workers=4, target_seconds=0.5)
+    scheduler.record(number_of_shoes=100, seconds=1)
+    assert scheduler.shoes_per_second == 100
+    assert scheduler.chunk_size() == 50
+
+
+def test_chunk_size_guided():
+    """
+    Tests the chunk_size method within the ShoeScheduler class
+    shrinks as the number of remaining shoes decreases.
+
+    """
+    scheduler = ShoeScheduler(shoe_ranges=[range(100)], workers=2, target_seconds=10)
+    scheduler.record(number_of_shoes=1000, seconds=1)
+    assert scheduler.chunk_size() == 25
+    scheduler.next_range()
+    assert scheduler.chunk_size() == 19
+    while scheduler.next_range() is not None:
+        pass
+    assert scheduler.chunk_size() == 1
@@ -0,0 +1,220 @@
+import asyncio
+import http.client
+import json
+import pytest
+from blackjack.config import create_blackjack
+from blackjack.enums import JobStatus
+from blackjack.service import SimulationService
+
+
+CONFIG = {
+    'rules': {'min_bet': 10, 'max_bet': 500},
+    'players': [
+        {'type': 'Player', 'name': 'Player 1', 'bankroll': 100000, 'min_bet': 10},
+        {
+            'type': 'CardCounter',
+            'name': 'Player 2',
+            'bankroll': 100000,
+            'min_bet': 10,
+            'card_counting_system': 'HI_LO',
+            'bet_ramp': {'1': 15, '2': 20, '3': 40}
+        }
+    ],
+    'simulation': {'penetration': 0.75, 'number_of_shoes': 6, 'shoe_size': 1, 'seed': 3}
+}
+
+
+def _request(address, method, path, payload=None):
+    connection = http.client.HTTPConnection(*address, timeout=10)
+    try:
+        connection.request(method, path, body=json.dumps(payload) if payload is not None else None)
+        response = connection.getresponse()
+        body = response.read().decode()
+        if response.getheader('Content-Type') == 'application/x-ndjson':
+            return response.status, [json.loads(line) for line in body.splitlines()]
+        return response.status, json.loads(body)
+    finally:
+        connection.close()
+
+
+def test_init_invalid_workers():
+    """
+    Tests the __init__ method within the SimulationService
+    class when an invalid number of workers is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        SimulationService(workers=0)
+    assert str(e.value) == 'Number of workers must be at least 1.'
+
+
+def test_submit_duplicate():
+    """
+    Tests the submit method within the SimulationService class
+    when an identical job is already queued.
+
+    """
+    async def _submit():
+        service = SimulationService()
+        job, deduplicated = service.submit(config=CONFIG)
+        assert not deduplicated
+        duplicate_job, deduplicated = service.submit(config=CONFIG, priority=5)
+        assert deduplicated
+        assert duplicate_job is job
+        assert job.priority == 5
+        other_job, deduplicated = service.submit(config={**CONFIG, 'simulation': {**CONFIG['simulation'], 'seed': 4}})
+        assert not deduplicated
+        assert [job.id for job in service.jobs] == [1, 2]
+
+    asyncio.run(_submit())
+
+
+def test_run_jobs_priority(monkeypatch, thread_pool):
+    """
+    Tests the jobs run by the SimulationService class
+    in order of priority, then submission.
+
+    """
+    jobs_run = []
+    run_job = SimulationService._run_job
+
+    async def _record_run_job(self, job):
+        jobs_run.append(job.id)
+        await run_job(self, job=job)
+
+    monkeypatch.setattr(SimulationService, '_run_job', _record_run_job)
+
+    async def _run():
+        service = SimulationService(workers=1, executor=thread_pool)
+        for seed, priority in [(1, 0), (2, 1), (3, 0), (4, 2)]:
+            service.submit(config={**CONFIG, 'simulation': {**CONFIG['simulation'], 'seed': seed}}, priority=priority)
+        async with service:
+            async for summary in service.job(job_id=3).updates():
+                pass
+        assert summary['status'] == JobStatus.COMPLETED.value
+
+    asyncio.run(_run())
+    assert jobs_run == [4, 2, 1, 3]
+
+
+def test_http_job():
+    """
+    Tests submitting a job to the SimulationService class over HTTP
+    and streaming its progress until it completes.
+
+    """
+    async def _run():
+        async with SimulationService(workers=2) as service:
+            status, job = await asyncio.to_thread(_request, service.address, 'POST', '/jobs', CONFIG)
+            assert status == 201
+            assert not job['deduplicated']
+
+            status, events = await asyncio.to_thread(_request, service.address, 'GET', f"/jobs/{job['id']}/events")
+            assert status == 200
+            assert events[-1]['status'] == JobStatus.COMPLETED.value
+            assert [event['shoes_simulated'] for event in events] == sorted(event['shoes_simulated'] for event in events)
+
+            status, jobs = await asyncio.to_thread(_request, service.address, 'GET', '/jobs')
+            assert status == 200
+            assert jobs == [events[-1]]
+            return events[-1]
+
+    summary = asyncio.run(_run())
+    assert summary['shoes_simulated'] == 6
+
+    blackjack = create_blackjack(config=CONFIG)
+    blackjack.simulate(progress_bar=False, **CONFIG['simulation'])
+    for player, player_summary in zip(blackjack.players, summary['players']):
+        assert player.stats.summary(string=False) == player_summary['stats']
+        assert player.bankroll == player_summary['bankroll']
+
+
+def test_http_cancel(thread_pool):
+    """
+    Tests cancelling a queued job of the SimulationService
+    class over HTTP.
+
+    """
+    async def _run():
+        service = SimulationService(executor=thread_pool)
+        service.submit(config={**CONFIG, 'simulation': {**CONFIG['simulation'], 'number_of_shoes': 10000}})
+        job, _ = service.submit(config=CONFIG)
+        async with service:
+            status, summary = await asyncio.to_thread(_request, service.address, 'DELETE', f'/jobs/{job.id}')
+            assert status == 200
+            assert summary['status'] == JobStatus.CANCELLED.value
+            status, summary = await asyncio.to_thread(_request, service.address, 'DELETE', '/jobs/1')
+            assert summary['status'] == JobStatus.CANCELLED.value
+        assert job.shoes_simulated == 0
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize(
+    'test_method, test_path, test_payload, expected_status, expected',
+    [
+        ('GET', '/jobs/7', None, 404, 'Job 7 does not exist.'),
+        ('GET', '/results', None, 404, 'GET /results does not exist.'),
+        ('POST', '/jobs', {'players': []}, 400, 'Config must include the rules of the game.'),
+        (
+            'POST',
+            '/jobs',
+            {**CONFIG, 'simulation': {**CONFIG['simulation'], 'penetration': 0.95}},
+            400,
+            'Penetration must be less than or equal to 0.9.'
+        ),
+        (
+            'POST',
+            '/jobs',
+            {**CONFIG, 'rules': {**CONFIG['rules'], 'playing_strategy': '/etc/passwd'}},
+            400,
+            'Jobs submitted over HTTP cannot set playing_strategy.'
+        ),
+        (
+            'POST',
+            '/jobs',
+            {**CONFIG, 'players': [{**CONFIG['players'][1], 'bet_ramp': 15}]},
+            400,
+            'Bet ramp must be a table of counts and wagers.'
+        ),
+        ('POST', '/jobs', {**CONFIG, 'rules': 'default'}, 400, 'Rules must be a table of their parameters.'),
+        ('POST', '/jobs', {**CONFIG, 'simulation': [6, 1]}, 400, 'Simulation must be a table of its parameters.'),
+        ('GET', '/jobs/one', None, 400, "invalid literal for int() with base 10: 'one'")
+    ]
+)
+def test_http_errors(thread_pool, test_method, test_path, test_payload, expected_status, expected):
+    """
+    Tests the errors returned by the SimulationService class
+    for unknown jobs and invalid configs.
+
+    """
+    async def _run():
+        async with SimulationService(executor=thread_pool) as service:
+            return await asyncio.to_thread(_request, service.address, test_method, test_path, test_payload)
+
+    assert asyncio.run(_run()) == (expected_status, {'error': expected})
+
+
+@pytest.mark.parametrize(
+    'test_error, expected',
+    [
+        (KeyError('bet_ramp'), "Invalid config, missing 'bet_ramp'."),
+        (FileNotFoundError('No such file'), 'No such file')
+    ]
+)
+def test_http_submit_errors(monkeypatch, thread_pool, test_error, expected):
+    """
+    Tests the errors returned by the SimulationService class
+    when a config fails while its job is created.
+
+    """
+    def _raise(config):
+        raise test_error
+
+    monkeypatch.setattr('blackjack.service.create_blackjack', _raise)
+
+    async def _run():
+        async with SimulationService(executor=thread_pool) as service:
+            return await asyncio.to_thread(_request, service.address, 'POST', '/jobs', CONFIG)
+
+    assert asyncio.run(_run()) == (400, {'error': expected})
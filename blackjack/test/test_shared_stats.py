@@ -0,0 +1,64 @@
+import pickle
+import pytest
+from blackjack.enums import StatsCategory
+from blackjack.shared_stats import SharedStats
+
+
+@pytest.fixture
+def shared_stats():
+    with SharedStats(number_of_players=2, number_of_slots=2, min_count=-2, max_count=2) as shared_stats:
+        yield shared_stats
+
+
+def test_init_invalid_count_range():
+    """
+    Tests the __init__ method within the SharedStats class
+    when the count range is empty.
+
+    """
+    with pytest.raises(ValueError) as e:
+        SharedStats(number_of_players=1, min_count=1, max_count=0)
+    assert str(e.value) == 'Maximum count must be greater than or equal to the minimum count.'
+
+
+def test_view(shared_stats):
+    """Tests the view method within the SharedStats class."""
+    view = shared_stats.view(slot=1, player=0)
+    view[(1, StatsCategory.AMOUNT_BET)] += 10
+    view[(None, StatsCategory.AMOUNT_BET)] += 5
+    view[(1, StatsCategory.AMOUNT_BET)] += 10
+    assert view[(1, StatsCategory.AMOUNT_BET)] == 20
+    assert dict(view) == {(1, StatsCategory.AMOUNT_BET): 20, (None, StatsCategory.AMOUNT_BET): 5}
+    assert view.overflow == {}
+
+
+def test_view_overflow(shared_stats):
+    """
+    Tests the view method within the SharedStats class
+    when a count is outside of the block's count range.
+
+    """
+    view = shared_stats.view(slot=0, player=1)
+    view[(3, StatsCategory.NET_WINNINGS)] -= 10
+    assert view.overflow == {(3, StatsCategory.NET_WINNINGS): -10}
+    assert shared_stats.stats(player=1).stats == {}
+
+
+def test_stats(shared_stats):
+    """Tests the stats method within the SharedStats class."""
+    for slot in range(2):
+        shared_stats.view(slot=slot, player=1)[(-2, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
+    shared_stats.view(slot=0, player=0)[(0, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
+    assert shared_stats.stats(player=1).stats == {(-2, StatsCategory.TOTAL_ROUNDS_PLAYED): 2}
+    assert shared_stats.stats(player=0).summary(string=False)['TOTAL ROUNDS PLAYED'] == 1
+
+
+def test_pickle(shared_stats):
+    """
+    Tests that a pickled view of the SharedStats class writes
+    into the same block of shared memory.
+
+    """
+    view = pickle.loads(pickle.dumps(shared_stats.view(slot=1, player=1)))
+    view[(2, StatsCategory.PLAYER_BLACKJACKS)] += 1
+    assert shared_stats.stats(player=1).stats == {(2, StatsCategory.PLAYER_BLACKJACKS): 1}
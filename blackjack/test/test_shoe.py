@@ -1,7 +1,9 @@
-import random
 import pytest
-from blackjack.enums import CardCountingSystem
-from blackjack.shoe import Shoe
+from blackjack.cards import CARD_CODES, RANKS, TEN
+from blackjack.enums import CardCountingSystem, DeckEstimation
+from blackjack.random_generator import CounterGenerator, NumPyGenerator
+from blackjack.shoe import CODES, ArrayShoe, CompositionShoe, CSMShoe, CursorShoe, InfiniteShoe, PartialShuffleShoe, Shoe, shoe_seed
+from blackjack.shoe_factory import ShoeFactory
 
 
 @pytest.mark.parametrize(
@@ -27,10 +29,10 @@ def test_cards(shoe):
     """Tests the cards method within the Shoe class."""
     assert len(shoe.cards) == 52
     assert shoe.cards[-13:] == [
-        '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'
+        '2', '3', '4', '5', '6', '7', '8', '9', '10', '10', '10', '10', 'A'
     ]
     assert shoe.cards[:13] == [
-        '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'
+        '2', '3', '4', '5', '6', '7', '8', '9', '10', '10', '10', '10', 'A'
     ]
 
 
@@ -45,23 +47,43 @@ def test_burn_card(shoe):
 
 def test_deal_card(shoe):
     """Tests the deal_card method within the Shoe class."""
-    assert shoe.deal_card(seen=True) == 'A'
+    assert shoe.deal_card(seen=True) == CARD_CODES['A']
     assert shoe.seen_cards['A'] == 1
-    assert shoe.deal_card(seen=False) == 'K'
+    assert shoe.deal_card(seen=False) == CARD_CODES['K']
     assert shoe.seen_cards['10-J-Q-K'] == 0
 
 
-def test_shuffle(shoe):
+def test_shuffle():
     """Tests the shuffle method within the Shoe class."""
+    shoe = Shoe(shoe_size=1, seed=1)
     before_shuffle = shoe.cards.copy()
     assert len(before_shuffle) == 52
-    random.seed(1)
     shoe.shuffle()
     after_shuffle = shoe.cards
     assert len(after_shuffle) == 51
     assert before_shuffle[0] != after_shuffle[0]
 
 
+def test_shuffle_seed():
+    """
+    Tests the shuffle method within the Shoe class when
+    shoes are seeded with the same and different seeds.
+
+    """
+    shoes = [Shoe(shoe_size=2, seed=seed) for seed in [1, 1, 2]]
+    for shoe in shoes:
+        shoe.shuffle()
+    assert shoes[0].cards == shoes[1].cards
+    assert shoes[0].cards != shoes[2].cards
+
+
+def test_shoe_seed():
+    """Tests the shoe_seed function."""
+    assert shoe_seed(seed=1, shoe_index=1234567) == shoe_seed(seed=1, shoe_index=1234567)
+    assert shoe_seed(seed=1, shoe_index=0) != shoe_seed(seed=1, shoe_index=1)
+    assert shoe_seed(seed=1, shoe_index=10) != shoe_seed(seed=11, shoe_index=0)
+
+
 def test_add_to_seen_cards(shoe):
     """Tests the add_to_seen_cards method within the Shoe class."""
     assert shoe.seen_cards['10-J-Q-K'] == 0
@@ -111,6 +133,50 @@ def test_running_count():
     assert shoe.running_count(card_counting_system=CardCountingSystem.KO) == -22
 
 
+@pytest.mark.parametrize('test_shoe_type', [Shoe, CursorShoe, PartialShuffleShoe, CompositionShoe, CSMShoe])
+def test_track_running_counts(test_shoe_type):
+    """
+    Tests the track_running_counts method within every class of shoe, whose
+    running counts are kept as cards are seen and match the summed counts.
+
+    """
+    shoe = test_shoe_type(shoe_size=6, seed=4)
+    untracked_shoe = test_shoe_type(shoe_size=6, seed=4)
+    shoe.shuffle()
+    untracked_shoe.shuffle()
+    for _ in range(10):
+        shoe.deal_card()
+        untracked_shoe.deal_card()
+    shoe.track_running_counts(card_counting_systems={CardCountingSystem.HALVES, CardCountingSystem.KO})
+    for _ in range(50):
+        shoe.deal_card()
+        untracked_shoe.deal_card()
+    for card_counting_system in CardCountingSystem:
+        assert shoe.running_count(card_counting_system=card_counting_system) == \
+            untracked_shoe.running_count(card_counting_system=card_counting_system)
+        assert shoe.true_count(card_counting_system=card_counting_system) == \
+            untracked_shoe.true_count(card_counting_system=card_counting_system)
+
+    shoe.reset(seed=4)
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HALVES) == 0
+    assert shoe.running_count(card_counting_system=CardCountingSystem.KO) == -20
+
+
+def test_track_running_counts_return_discards():
+    """
+    Tests the running counts kept by the CSMShoe class,
+    which are reset once the discards are returned.
+
+    """
+    shoe = CSMShoe(shoe_size=1, seed=1)
+    shoe.track_running_counts(card_counting_systems={CardCountingSystem.HI_LO})
+    shoe.shuffle()
+    for _ in range(10):
+        shoe.add_to_seen_cards(card=shoe.deal_card(seen=False))
+    shoe.return_discards()
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) == 0
+
+
 def test_true_count():
     """Tests the true_count method within the Shoe class."""
     shoe = Shoe(shoe_size=6)
@@ -123,6 +189,83 @@ def test_true_count():
     assert shoe.true_count(card_counting_system=CardCountingSystem.HI_OPT_II) == -21
 
 
+@pytest.mark.parametrize(
+    'test_cards_remaining, expected',
+    [
+        (
+            12,
+            {
+                DeckEstimation.EXACT: 0.25,
+                DeckEstimation.QUARTER_DECK: 0.25,
+                DeckEstimation.HALF_DECK: 0.25,
+                DeckEstimation.FULL_DECK: 0.25
+            }
+        ),
+        (
+            26,
+            {
+                DeckEstimation.EXACT: 0.5,
+                DeckEstimation.QUARTER_DECK: 0.5,
+                DeckEstimation.HALF_DECK: 0.5,
+                DeckEstimation.FULL_DECK: 0.5
+            }
+        ),
+        (
+            39,
+            {
+                DeckEstimation.EXACT: 0.75,
+                DeckEstimation.QUARTER_DECK: 0.75,
+                DeckEstimation.HALF_DECK: 1,
+                DeckEstimation.FULL_DECK: 1
+            }
+        ),
+        (
+            100,
+            {
+                DeckEstimation.EXACT: 100 / 52,
+                DeckEstimation.QUARTER_DECK: 2,
+                DeckEstimation.HALF_DECK: 2,
+                DeckEstimation.FULL_DECK: 2
+            }
+        ),
+        (
+            338,
+            {
+                DeckEstimation.EXACT: 6.5,
+                DeckEstimation.QUARTER_DECK: 6.5,
+                DeckEstimation.HALF_DECK: 6.5,
+                DeckEstimation.FULL_DECK: 7
+            }
+        )
+    ]
+)
+def test_estimated_decks(test_cards_remaining, expected):
+    """Tests the estimated_decks method within the Shoe class for every deck estimation."""
+    shoe = CursorShoe(shoe_size=8)
+    shoe._cursor = test_cards_remaining
+    for deck_estimation, decks in expected.items():
+        assert shoe.estimated_decks(deck_estimation=deck_estimation) == decks
+    assert shoe.remaining_decks == expected[DeckEstimation.FULL_DECK]
+
+
+def test_true_count_deck_estimation():
+    """
+    Tests the true_count method within the Shoe class when the
+    number of decks remaining is estimated with different precisions.
+
+    """
+    shoe = Shoe(shoe_size=6)
+    # 86 cards remain, which is 1.65 decks
+    for _ in range(226):
+        shoe.burn_card()
+    for _ in range(10):
+        shoe.add_to_seen_cards(card='2')
+    assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO) == 5
+    assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO, deck_estimation=DeckEstimation.HALF_DECK) == 7
+    assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO, deck_estimation=DeckEstimation.QUARTER_DECK) == 6
+    assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO, deck_estimation=DeckEstimation.EXACT) == 6
+
+
 def test_true_count_zero():
     """Tests the true_count method within the Shoe class when it is zero."""
     shoe = Shoe(shoe_size=8)
@@ -133,3 +276,347 @@ def test_true_count_zero():
     assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) < 0
     assert shoe.remaining_decks > 0
     assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO) == 0
+
+
+def test_reset():
+    """Tests the reset method within the Shoe class."""
+    shoe = Shoe(shoe_size=1, seed=1)
+    shoe.shuffle()
+    shoe.deal_card()
+    shoe.reset(seed=1)
+    assert shoe.cards == Shoe(shoe_size=1).cards
+    assert not shoe.seen_cards
+    shoe.shuffle()
+    seeded_shoe = Shoe(shoe_size=1, seed=1)
+    seeded_shoe.shuffle()
+    assert shoe.cards == seeded_shoe.cards
+
+
+def test_cursor_shoe_deal_card():
+    """
+    Tests the deal_card method within the CursorShoe class
+    against a Shoe with the same seed.
+
+    """
+    shoe = Shoe(shoe_size=2, penetration=0.5, seed=3)
+    cursor_shoe = CursorShoe(shoe_size=2, penetration=0.5, seed=3)
+    shoe.shuffle()
+    cursor_shoe.shuffle()
+    while not shoe.cut_card_reached:
+        assert not cursor_shoe.cut_card_reached
+        assert shoe.deal_card() == cursor_shoe.deal_card()
+        assert shoe.deal_card(seen=False) == cursor_shoe.deal_card(seen=False)
+        assert shoe.remaining_decks == cursor_shoe.remaining_decks
+    assert cursor_shoe.cut_card_reached
+    assert shoe.cards == cursor_shoe.cards
+    assert shoe.seen_cards == cursor_shoe.seen_cards
+
+
+def test_cursor_shoe_reset():
+    """Tests the reset method within the CursorShoe class."""
+    shoe = CursorShoe(shoe_size=1, seed=1)
+    cards = shoe._cards
+    shoe.shuffle()
+    for _ in range(40):
+        shoe.deal_card()
+    shoe.reset(seed=1)
+    assert shoe._cards is cards
+    assert shoe.cards == Shoe(shoe_size=1).cards
+    assert not shoe.seen_cards
+    assert shoe.remaining_decks == 1
+    assert not shoe.cut_card_reached
+    shoe.shuffle()
+    seeded_shoe = Shoe(shoe_size=1, seed=1)
+    seeded_shoe.shuffle()
+    assert shoe.cards == seeded_shoe.cards
+
+
+def test_cursor_shoe_burn_card():
+    """Tests the burn_card method within the CursorShoe class."""
+    shoe = CursorShoe(shoe_size=1)
+    shoe.burn_card()
+    assert len(shoe.cards) == 51
+    assert shoe.deal_card() == CARD_CODES['K']
+    assert shoe.seen_cards == {'10-J-Q-K': 1}
+
+
+@pytest.mark.parametrize('test_overdraw', [0, 26])
+def test_partial_shuffle_shoe_shuffle(test_overdraw):
+    """
+    Tests the shuffle method within the PartialShuffleShoe class
+    against a fully shuffled Shoe with the same seed, including
+    cards dealt past the shuffled part of the shoe.
+
+    """
+    shoe = Shoe(shoe_size=2, penetration=0.75, seed=4)
+    partial_shuffle_shoe = PartialShuffleShoe(shoe_size=2, penetration=0.75, seed=4, overdraw=test_overdraw)
+    shoe.shuffle()
+    partial_shuffle_shoe.shuffle()
+    assert partial_shuffle_shoe._shuffled_to == 26 - test_overdraw
+    for _ in range(80):
+        assert shoe.deal_card() == partial_shuffle_shoe.deal_card()
+    assert partial_shuffle_shoe.cut_card_reached
+    assert partial_shuffle_shoe._shuffled_to <= 23
+    assert shoe.cards == partial_shuffle_shoe.cards
+    assert shoe.seen_cards == partial_shuffle_shoe.seen_cards
+
+
+def test_partial_shuffle_shoe_reset():
+    """Tests the reset method within the PartialShuffleShoe class."""
+    shoe = PartialShuffleShoe(shoe_size=1, seed=1)
+    shoe.shuffle()
+    shoe.deal_card()
+    shoe.reset(seed=2)
+    shoe.shuffle()
+    seeded_shoe = Shoe(shoe_size=1, seed=2)
+    seeded_shoe.shuffle()
+    assert shoe.cards == seeded_shoe.cards
+
+
+def test_composition_shoe_init():
+    """
+    Tests the __init__ method within the CompositionShoe class
+    for a full shoe and a shoe starting from a given composition.
+
+    """
+    shoe = CompositionShoe(shoe_size=2)
+    assert shoe.composition == {'10': 32, '2': 8, '3': 8, '4': 8, '5': 8, '6': 8, '7': 8, '8': 8, '9': 8, 'A': 8}
+    assert len(shoe.cards) == 104
+    assert shoe.remaining_decks == 2
+
+    shoe = CompositionShoe(shoe_size=1, penetration=0.5, composition={'10': 16, 'A': 10})
+    assert shoe.composition['2'] == 0
+    assert shoe.remaining_decks == 0.5
+    for _ in range(12):
+        assert shoe.deal_card() in {CARD_CODES['10'], CARD_CODES['A']}
+    assert not shoe.cut_card_reached
+    shoe.deal_card()
+    assert shoe.cut_card_reached
+    assert sum(shoe.seen_cards.values()) == 13
+
+
+@pytest.mark.parametrize(
+    'test_composition, expected',
+    [
+        ({'K': 4}, 'Composition ranks must be one of 10, 2, 3, 4, 5, 6, 7, 8, 9, A.'),
+        ({'A': -1, '10': 4}, 'Composition counts must not be negative.'),
+        ({'A': 0}, 'Composition must hold between 1 card and the cards of the shoe size.'),
+        ({'A': 53}, 'Composition must hold between 1 card and the cards of the shoe size.')
+    ]
+)
+def test_composition_shoe_init_invalid_composition(test_composition, expected):
+    """
+    Tests the __init__ method within the CompositionShoe
+    class when an invalid composition is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        CompositionShoe(shoe_size=1, composition=test_composition)
+    assert str(e.value) == expected
+
+
+def test_composition_shoe_deal_card():
+    """
+    Tests the deal_card method within the CompositionShoe class,
+    which deals every card of the shoe exactly once.
+
+    """
+    shoe = CompositionShoe(shoe_size=1, seed=1)
+    cards = [shoe.deal_card(seen=card_number % 2 == 0) for card_number in range(52)]
+    assert sorted(RANKS[card] for card in cards) == sorted(Shoe(shoe_size=1).cards)
+    assert shoe.composition == dict.fromkeys(shoe.composition, 0)
+    assert sum(shoe.seen_cards.values()) == 26
+
+
+def test_composition_shoe_shuffle_and_reset():
+    """Tests the shuffle and reset methods within the CompositionShoe class."""
+    shoe = CompositionShoe(shoe_size=1, seed=1)
+    shoe.shuffle()
+    assert len(shoe.cards) == 51
+    first_cards = [shoe.deal_card() for _ in range(20)]
+    shoe.reset(seed=1)
+    assert not shoe.seen_cards
+    assert len(shoe.cards) == 52
+    shoe.shuffle()
+    assert [shoe.deal_card() for _ in range(20)] == first_cards
+
+
+def test_start_shoe():
+    """Tests the start_shoe method within the Shoe class."""
+    shoe = PartialShuffleShoe(shoe_size=1)
+    shoe.start_shoe(seed=1, shoe_index=5)
+    seeded_shoe = Shoe(shoe_size=1, seed=shoe_seed(seed=1, shoe_index=5))
+    seeded_shoe.shuffle()
+    assert shoe.cards == seeded_shoe.cards
+
+
+def test_array_shoe_shuffle():
+    """
+    Tests the shuffle method within the ArrayShoe class
+    against a Shoe with the same seed.
+
+    """
+    shoe = Shoe(shoe_size=2, seed=3)
+    array_shoe = ArrayShoe(shoe_size=2, seed=3)
+    shoe.shuffle()
+    array_shoe.shuffle()
+    assert shoe.cards == array_shoe.cards
+    for _ in range(20):
+        assert shoe.deal_card() == array_shoe.deal_card()
+    assert shoe.seen_cards == array_shoe.seen_cards
+
+
+def test_array_shoe_load():
+    """
+    Tests the load method within the ArrayShoe class, which
+    deals a row of cards without copying it.
+
+    """
+    shoe = ArrayShoe(shoe_size=1)
+    row = bytearray(range(13)) * 4
+    shoe.load(cards=memoryview(row))
+    assert shoe._cards.obj is row
+    assert shoe.deal_card() == CARD_CODES['A']
+    assert shoe.deal_card() == CARD_CODES['K']
+    assert shoe.seen_cards == {'A': 1, '10-J-Q-K': 1}
+    assert len(shoe.cards) == 50
+    shoe.shuffle()
+    assert row == bytearray(range(13)) * 4
+
+    with pytest.raises(ValueError) as e:
+        shoe.load(cards=bytes(10))
+    assert str(e.value) == 'Expected 52 cards but received 10.'
+
+
+def test_array_shoe_start_shoe():
+    """
+    Tests the start_shoe method within the ArrayShoe class,
+    which deals shoes shuffled by a ShoeFactory.
+
+    """
+    shoe = ArrayShoe(shoe_size=2)
+    shoe.start_shoe(seed=1, shoe_index=300)
+    factory = ShoeFactory(shoe_size=2, seed=1, bit_generator='MT19937')
+    assert shoe.cards == [RANKS[CODES[card]] for card in factory.shoe(shoe_index=300)[:-1]]
+    shoe = ArrayShoe(shoe_size=2, generator=NumPyGenerator(bit_generator='Philox'))
+    shoe.start_shoe(seed=-1, shoe_index=3)
+    factory = ShoeFactory(shoe_size=2, seed=-1, bit_generator='Philox')
+    assert shoe.cards == [RANKS[CODES[card]] for card in factory.shoe(shoe_index=3)[:-1]]
+
+
+def test_array_shoe_start_shoe_counter_generator():
+    """
+    Tests the start_shoe method within the ArrayShoe class when its
+    generator cannot shuffle a batch of shoes.
+
+    """
+    shoe = ArrayShoe(shoe_size=2, generator=CounterGenerator())
+    with pytest.raises(ValueError) as e:
+        shoe.start_shoe(seed=1, shoe_index=0)
+    assert str(e.value) == 'ArrayShoe cannot shuffle batches of shoes with a CounterGenerator.'
+
+
+def test_partial_shuffle_shoe_generator():
+    """
+    Tests the PartialShuffleShoe class with a random generator other than the
+    standard library's, which deals the same cards as a fully shuffled shoe.
+
+    """
+    shoe = CursorShoe(shoe_size=1, seed=2, generator=CounterGenerator())
+    partial_shuffle_shoe = PartialShuffleShoe(shoe_size=1, seed=2, generator=CounterGenerator(), overdraw=0)
+    shoe.shuffle()
+    partial_shuffle_shoe.shuffle()
+    assert [shoe.deal_card() for _ in range(45)] == [partial_shuffle_shoe.deal_card() for _ in range(45)]
+
+
+def test_return_discards():
+    """
+    Tests the return_discards method within the Shoe class, which leaves
+    the discards out of the shoe until it is shuffled again.
+
+    """
+    shoe = Shoe(shoe_size=1, seed=1)
+    shoe.shuffle()
+    cards = [shoe.deal_card() for _ in range(10)]
+    shoe.return_discards()
+    assert len(shoe.cards) == 41
+    assert sum(shoe.seen_cards.values()) == len(cards)
+
+
+def test_csm_shoe_return_discards():
+    """
+    Tests the return_discards method within the CSMShoe class, which
+    reinserts the discards among the cards in the machine and clears
+    the seen cards.
+
+    """
+    shoe = CSMShoe(shoe_size=1, seed=1)
+    shoe.shuffle()
+    cards = [shoe.deal_card() for _ in range(10)]
+    shoe.return_discards()
+    assert len(shoe.cards) == 52
+    assert sorted(shoe.cards) == sorted(Shoe(shoe_size=1).cards)
+    assert not shoe.seen_cards
+    assert shoe.remaining_decks == 1
+    assert not shoe.cut_card_reached
+
+    shoe.reset(seed=1)
+    shoe.shuffle()
+    assert [shoe.deal_card() for _ in range(10)] == cards
+
+
+def test_csm_shoe_positions():
+    """
+    Tests the positions that the CSMShoe class reinserts a discard at,
+    which are uniformly spread across the machine.
+
+    """
+    shoe = CSMShoe(shoe_size=1, seed=2)
+    shoe._cards = list(range(52))
+    positions = [0] * 52
+    for _ in range(5200):
+        shoe.deal_card(seen=False)
+        shoe.return_discards()
+        positions[shoe._cards.index(51)] += 1
+        shoe._cards.remove(51)
+        shoe._cards.append(51)
+    assert all(50 <= count <= 160 for count in positions)
+
+
+def test_infinite_shoe_init_invalid_block_size():
+    """
+    Tests the __init__ method within the InfiniteShoe
+    class when an invalid block size is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        InfiniteShoe(shoe_size=1, block_size=0)
+    assert str(e.value) == 'Block size must be at least 1.'
+
+
+def test_infinite_shoe_deal_card():
+    """
+    Tests the deal_card method within the InfiniteShoe class, which draws
+    every rank with the same probability and keeps no seen cards.
+
+    """
+    shoe = InfiniteShoe(shoe_size=8, seed=3, block_size=100)
+    shoe.shuffle()
+    cards = [shoe.deal_card() for _ in range(13000)]
+    assert all(850 <= cards.count(card) <= 1150 for card in range(len(RANKS)) if card != TEN)
+    assert 3700 <= cards.count(TEN) <= 4300
+    assert not shoe.seen_cards
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) == 0
+    assert shoe.remaining_decks == 8
+    assert not shoe.cut_card_reached
+
+
+def test_infinite_shoe_start_shoe():
+    """Tests the start_shoe method within the InfiniteShoe class."""
+    shoe = InfiniteShoe(shoe_size=1)
+    shoe.start_shoe(seed=1, shoe_index=0)
+    cards = [shoe.deal_card() for _ in range(200)]
+    shoe.start_shoe(seed=1, shoe_index=1)
+    assert [shoe.deal_card() for _ in range(200)] != cards
+    shoe.start_shoe(seed=1, shoe_index=0)
+    assert [shoe.deal_card() for _ in range(200)] == cards
@@ -0,0 +1,68 @@
+from collections import Counter
+import numpy as np
+import pytest
+from blackjack.shoe_factory import ShoeFactory
+
+
+def test_init_without_numpy(monkeypatch):
+    """
+    Tests the __init__ method within the ShoeFactory
+    class when NumPy is not installed.
+
+    """
+    monkeypatch.setattr('blackjack.shoe_factory.np', None)
+    with pytest.raises(ModuleNotFoundError) as e:
+        ShoeFactory(shoe_size=1, seed=1)
+    assert str(e.value) == 'ShoeFactory requires NumPy, which can be installed with `pip install numpy`.'
+
+
+def test_init_invalid_bit_generator():
+    """
+    Tests the __init__ method within the ShoeFactory class
+    when an unknown bit generator is provided.
+
+    """
+    with pytest.raises(ValueError) as e:
+        ShoeFactory(shoe_size=1, seed=1, bit_generator='SFC64')
+    assert str(e.value) == 'Bit generator must be one of MT19937, PCG64, Philox.'
+
+
+def test_batch():
+    """Tests the batch method within the ShoeFactory class."""
+    factory = ShoeFactory(shoe_size=2, seed=1, shoes_per_batch=16)
+    batch = factory.batch(batch_index=0)
+    assert batch.shape == (16, 104)
+    assert batch.dtype == np.uint8
+    for row in batch:
+        assert Counter(row.tolist()) == {card: 8 for card in range(13)}
+    assert not np.array_equal(batch[0], batch[1])
+    assert np.array_equal(ShoeFactory(shoe_size=2, seed=1, shoes_per_batch=16).batch(batch_index=0), batch)
+    assert not np.array_equal(factory.batch(batch_index=1), batch)
+
+
+def test_shoe():
+    """
+    Tests the shoe method within the ShoeFactory class, which
+    returns a row of a batch without copying it.
+
+    """
+    factory = ShoeFactory(shoe_size=1, seed=1, shoes_per_batch=4)
+    shoe = factory.shoe(shoe_index=6)
+    assert np.shares_memory(np.asarray(shoe), factory.batch(batch_index=1))
+    assert np.array_equal(np.asarray(shoe), factory.batch(batch_index=1)[2])
+
+
+def test_shoe_shuffled_in_chunks():
+    """
+    Tests the shoe method within the ShoeFactory class, which only shuffles
+    the rows of a batch up to the shoe asked for, and deals the same shoes
+    as shuffling the whole batch at once.
+
+    """
+    factory = ShoeFactory(shoe_size=1, seed=-3, shoes_per_batch=16)
+    shoes = [np.asarray(factory.shoe(shoe_index=shoe_index)).copy() for shoe_index in (1, 2, 9)]
+    assert factory._rows_shuffled == 10
+    batch = ShoeFactory(shoe_size=1, seed=-3, shoes_per_batch=16).batch(batch_index=0)
+    for shoe, row in zip(shoes, (1, 2, 9)):
+        assert np.array_equal(shoe, batch[row])
+    assert np.array_equal(factory.batch(batch_index=0), batch)
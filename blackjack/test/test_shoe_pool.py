@@ -0,0 +1,169 @@
+import copy
+import pickle
+import pytest
+from blackjack.cards import RANKS
+from blackjack.shoe import CODES, Shoe
+from blackjack.shoe_pool import HEADER, PooledShoe, ShoePool, write_shoe_pool
+
+
+@pytest.fixture
+def pool_path(tmp_path):
+    path = tmp_path / 'shoes.bin'
+    write_shoe_pool(path=path, number_of_shoes=4, shoe_size=2, seed=3)
+    return path
+
+
+def test_write_shoe_pool(tmp_path, pool_path):
+    """Tests the write_shoe_pool function."""
+    assert pool_path.stat().st_size == HEADER.size + 4 * 104
+    seed = write_shoe_pool(path=tmp_path / 'random.bin', number_of_shoes=1, shoe_size=1)
+    assert ShoePool(path=tmp_path / 'random.bin').seed == seed
+
+
+@pytest.mark.parametrize(
+    'test_number_of_shoes, test_seed, expected',
+    [
+        (0, 1, 'Number of shoes must be at least 1.'),
+        (1, -1, 'Seed must be between 0 and 2**64 - 1 to be stored in a shoe pool.'),
+        (1, 1 << 64, 'Seed must be between 0 and 2**64 - 1 to be stored in a shoe pool.')
+    ]
+)
+def test_write_shoe_pool_invalid(tmp_path, test_number_of_shoes, test_seed, expected):
+    """Tests the write_shoe_pool function when invalid parameters are provided."""
+    with pytest.raises(ValueError) as e:
+        write_shoe_pool(path=tmp_path / 'shoes.bin', number_of_shoes=test_number_of_shoes, shoe_size=1, seed=test_seed)
+    assert str(e.value) == expected
+
+
+def test_init(pool_path):
+    """Tests the __init__ method within the ShoePool class."""
+    pool = ShoePool(path=pool_path)
+    assert pool.path == str(pool_path)
+    assert pool.shoe_size == 2
+    assert pool.number_of_shoes == len(pool) == 4
+    assert pool.seed == 3
+
+
+def test_init_invalid(tmp_path, pool_path):
+    """Tests the __init__ method within the ShoePool class when the file is not a valid pool."""
+    (tmp_path / 'empty.bin').write_bytes(b'')
+    with pytest.raises(ValueError) as e:
+        ShoePool(path=tmp_path / 'empty.bin')
+    assert str(e.value) == f"{tmp_path / 'empty.bin'} is not a shoe pool."
+
+    (tmp_path / 'other.bin').write_bytes(b'\x00' * 100)
+    with pytest.raises(ValueError) as e:
+        ShoePool(path=tmp_path / 'other.bin')
+    assert str(e.value) == f"{tmp_path / 'other.bin'} is not a shoe pool."
+
+    (tmp_path / 'truncated.bin').write_bytes(pool_path.read_bytes()[:-1])
+    with pytest.raises(ValueError) as e:
+        ShoePool(path=tmp_path / 'truncated.bin')
+    assert str(e.value) == f"{tmp_path / 'truncated.bin'} does not hold 4 shoes of 2 decks."
+
+
+def test_shoe(pool_path):
+    """
+    Tests the shoe method within the ShoePool class, whose shoes are
+    shuffled the same way as the shoes of a simulation with the same seed.
+
+    """
+    pool = ShoePool(path=pool_path)
+    for shoe_index in range(4):
+        cards = pool.shoe(shoe_index=shoe_index)
+        assert isinstance(cards, memoryview)
+        assert cards.readonly
+        shoe = Shoe(shoe_size=2)
+        shoe.start_shoe(seed=3, shoe_index=shoe_index)
+        # cards are dealt from the end, and the shoe has already burned the last one
+        assert [RANKS[CODES[card]] for card in cards[:-1]] == shoe.cards
+
+    with pytest.raises(ValueError) as e:
+        pool.shoe(shoe_index=4)
+    assert str(e.value) == 'Shoe pool holds 4 shoes, so there is no shoe 4.'
+
+
+def test_digest(tmp_path, pool_path):
+    """Tests the digest property within the ShoePool class."""
+    write_shoe_pool(path=tmp_path / 'same.bin', number_of_shoes=4, shoe_size=2, seed=3)
+    write_shoe_pool(path=tmp_path / 'other.bin', number_of_shoes=4, shoe_size=2, seed=4)
+    assert ShoePool(path=pool_path).digest == ShoePool(path=tmp_path / 'same.bin').digest
+    assert ShoePool(path=pool_path).digest != ShoePool(path=tmp_path / 'other.bin').digest
+
+
+def test_pickle(pool_path):
+    """Tests pickling the ShoePool and PooledShoe classes, which re-open the pool from its path."""
+    shoe = PooledShoe(pool=ShoePool(path=pool_path))
+    shoe.start_shoe(seed=0, shoe_index=1)
+    copied_shoe = pickle.loads(pickle.dumps(shoe))
+    assert copied_shoe.pool.path == str(pool_path)
+    copied_shoe.start_shoe(seed=0, shoe_index=1)
+    shoe.start_shoe(seed=0, shoe_index=1)
+    assert copied_shoe.cards == shoe.cards
+
+
+def test_copies_share_mapping(pool_path):
+    """
+    Tests the ShoePool class when it is copied within a process,
+    which shares the mapping of the file rather than mapping it again.
+
+    """
+    pool = ShoePool(path=pool_path)
+    copied_pool = copy.deepcopy(pool)
+    assert copied_pool is not pool
+    assert copied_pool._view.obj is pool._view.obj
+    assert pickle.loads(pickle.dumps(pool))._view.obj is pool._view.obj
+
+
+def test_close(pool_path):
+    """
+    Tests the close method within the ShoePool class, which unmaps the file
+    once no copy of the pool or shoe read from it is still in use.
+
+    """
+    with ShoePool(path=pool_path) as pool:
+        copied_pool = copy.deepcopy(pool)
+        cards = bytes(pool.shoe(shoe_index=0))
+    with pytest.raises(ValueError):
+        pool.shoe(shoe_index=0)
+    assert bytes(copied_pool.shoe(shoe_index=0)) == cards
+    mapping = copied_pool._view.obj
+    copied_pool.close()
+    assert mapping.closed
+
+    with ShoePool(path=pool_path) as reopened_pool:
+        assert reopened_pool._view.obj is not mapping
+        assert bytes(reopened_pool.shoe(shoe_index=0)) == cards
+
+
+def test_close_twice(pool_path):
+    """
+    Tests the close method within the ShoePool class when a pool is closed
+    more than once, which only releases its own use of the mapping.
+
+    """
+    pool = ShoePool(path=pool_path)
+    copied_pool = copy.deepcopy(pool)
+    mapping = pool._view.obj
+    pool.close()
+    pool.close()
+    assert not mapping.closed
+    assert ShoePool._open_pools[pool._key] == 1
+    copied_pool.close()
+    assert mapping.closed
+    assert pool._key not in ShoePool._mappings
+    assert pool._key not in ShoePool._open_pools
+
+
+def test_pooled_shoe_start_shoe(pool_path):
+    """Tests the start_shoe method within the PooledShoe class."""
+    shoe = PooledShoe(pool=ShoePool(path=pool_path), penetration=0.5)
+    assert shoe.shoe_size == 2
+    expected = Shoe(shoe_size=2, penetration=0.5)
+    for shoe_index in (2, 0):
+        shoe.start_shoe(seed=0, shoe_index=shoe_index)
+        expected.start_shoe(seed=3, shoe_index=shoe_index)
+        cards = []
+        while not shoe.cut_card_reached:
+            cards.append(shoe.deal_card())
+        assert cards == [expected.deal_card() for _ in cards]
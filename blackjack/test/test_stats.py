@@ -1,3 +1,6 @@
+from blackjack.enums import StatsCategory
+
+
 def test_summary_as_dictionary(stats):
     """
     Tests the summary method within the Stats class
@@ -46,3 +49,14 @@ def test_summary_as_string(stats):
         'TOTAL AMOUNT BET: $47.50\n'
         'TOTAL NET WINNINGS: -$10.00'
     )
+
+
+def test_merge(stats):
+    """Tests the merge method within the Stats class."""
+    stats.merge(stats={
+        (1, StatsCategory.TOTAL_ROUNDS_PLAYED): 2,
+        (None, StatsCategory.AMOUNT_BET): 10
+    })
+    assert stats.stats[(1, StatsCategory.TOTAL_ROUNDS_PLAYED)] == 3
+    assert stats.stats[(None, StatsCategory.AMOUNT_BET)] == 10
+    assert stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 4
@@ -176,3 +176,26 @@ def test_remove_back_counter(table, back_counter):
     assert back_counter not in table.players
     assert back_counter in table.observers
     assert not back_counter.is_seated
+
+
+def test_roster(table, player, back_counter):
+    """Tests the roster method within the Table class."""
+    table.add_player(player=back_counter)
+    table.add_player(player=player)
+    table.add_back_counter(back_counter=back_counter)
+    assert table.players == [player, back_counter]
+    assert table.roster == [back_counter, player]
+
+
+def test_reset_seating(table, player, back_counter, card_counter_balanced):
+    """Tests the reset_seating method within the Table class."""
+    table.add_player(player=back_counter)
+    table.add_player(player=player)
+    table.add_player(player=card_counter_balanced)
+    table.add_back_counter(back_counter=back_counter)
+    table.remove_player(player=player)
+    assert table.players == [card_counter_balanced, back_counter]
+    table.reset_seating()
+    assert table.players == [card_counter_balanced]
+    assert table.observers == [back_counter]
+    assert not back_counter.is_seated
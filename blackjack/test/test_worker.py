@@ -0,0 +1,31 @@
+import subprocess
+import sys
+import threading
+from blackjack.coordinator import Coordinator
+
+
+def test_main(blackjack_game):
+    """
+    Tests the main function of the worker module when
+    several worker processes are started from the command line.
+
+    """
+    serial_game = blackjack_game._clone()
+    serial_game.simulate(penetration=0.75, number_of_shoes=20, shoe_size=2, seed=6, progress_bar=False)
+    with Coordinator(blackjack=blackjack_game, penetration=0.75, number_of_shoes=20, shoe_size=2, seed=6, workers=2) as coordinator:
+        coordinator_thread = threading.Thread(target=coordinator.run)
+        coordinator_thread.start()
+        host, port = coordinator.address
+        processes = [
+            subprocess.Popen([
+                sys.executable, '-m', 'blackjack.worker',
+                '--host', host,
+                '--port', str(port),
+                '--authkey', coordinator.authkey.hex()
+            ])
+            for _ in range(2)
+        ]
+        coordinator_thread.join(timeout=60)
+        assert all(process.wait(timeout=60) == 0 for process in processes)
+    for serial_player, player in zip(serial_game.players, blackjack_game.players):
+        assert serial_player.stats.stats == player.stats.stats
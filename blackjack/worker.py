@@ -0,0 +1,57 @@
+"""
+Worker process that simulates ranges of shoes handed out by a Coordinator.
+
+    python -m blackjack.worker --host 127.0.0.1 --port 5000 --authkey <hex key>
+
+"""
+import argparse
+import copy
+from multiprocessing.connection import Client
+from blackjack.blackjack import _play_shoes
+
+
+def run_worker(host: str, port: int, authkey: bytes) -> int:
+    """
+    Connects to a coordinator and simulates the ranges of shoes it hands
+    out until every shoe has been simulated. Returns the number of shoes
+    simulated by this worker.
+
+    """
+    shoes_simulated = 0
+    with Client(address=(host, port), family='AF_INET', authkey=authkey) as connection:
+        _, job = connection.recv()
+        while True:
+            message, shoe_range = connection.recv()
+            if message == 'done':
+                return shoes_simulated
+
+            # every range is played on a fresh copy so only its own stats are sent back
+            try:
+                results, seconds = _play_shoes(
+                    blackjack=copy.deepcopy(job['blackjack']),
+                    shoe_range=shoe_range,
+                    penetration=job['penetration'],
+                    shoe_size=job['shoe_size'],
+                    seed=job['seed'],
+                    reset_bankroll=job['reset_bankroll'],
+                    rounds_per_shoe=job['rounds_per_shoe']
+                )
+            except Exception:
+                # the range may only fail because the copy of the game started from the
+                # wrong bankrolls, so the coordinator plays it again from the right ones
+                results, seconds = None, 0.0
+            connection.send((results, seconds))
+            shoes_simulated += len(shoe_range)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Simulates ranges of shoes handed out by a blackjack coordinator.')
+    parser.add_argument('--host', default='127.0.0.1', help='host the coordinator listens on')
+    parser.add_argument('--port', type=int, required=True, help='port the coordinator listens on')
+    parser.add_argument('--authkey', required=True, help="coordinator's authentication key as a hex string")
+    args = parser.parse_args()
+    run_worker(host=args.host, port=args.port, authkey=bytes.fromhex(args.authkey))
+
+
+if __name__ == '__main__':
+    main()